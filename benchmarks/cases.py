@@ -0,0 +1,135 @@
+import multiprocessing
+import queue
+from typing import Any, Callable, Dict, Iterator, List
+
+from modupipe.extractor import Extractor, GetFromQueue
+from modupipe.loader import Loader
+from modupipe.mapper import Buffer, PushTo, PushToAndMap, PutToQueue
+from modupipe.queue import GetBlocking, PutBlocking, Queue
+from modupipe.runnable import FullPipeline, MultiProcess, MultiThread, Runnable
+
+Case = Callable[[], int]
+
+NB_ITEMS = 100_000
+NB_QUEUE_ITEMS = 20_000
+NB_CPU_ITEMS = 2_000
+
+
+class Range(Extractor[int]):
+    def __init__(self, nb_items: int) -> None:
+        self.nb_items = nb_items
+
+    def extract(self) -> Iterator[int]:
+        return iter(range(self.nb_items))
+
+
+class Identity(Loader[Any, Any]):
+    def load(self, item: Any) -> Any:
+        return item
+
+
+class Spin(Loader[int, int]):
+    def load(self, item: int) -> int:
+        total = 0
+        for i in range(200):
+            total += i * item
+
+        return total
+
+
+def mapper_chain(nb_mappers: int, fused: bool = False) -> Case:
+    def case() -> int:
+        extractor: Extractor[int] = Range(NB_ITEMS)
+        for _ in range(nb_mappers):
+            extractor = extractor + PushToAndMap(Identity())
+
+        FullPipeline(extractor, fused=fused).run()
+        return NB_ITEMS
+
+    return case
+
+
+def loader_chain(depth: int) -> Case:
+    def case() -> int:
+        loader: Loader[Any, Any] = Identity()
+        for _ in range(depth - 1):
+            loader = loader + Identity()
+
+        FullPipeline(Range(NB_ITEMS) + PushTo(loader)).run()
+        return NB_ITEMS
+
+    return case
+
+
+def buffer(size: int) -> Case:
+    def case() -> int:
+        FullPipeline(Range(NB_ITEMS) + Buffer(size)).run()
+        return NB_ITEMS
+
+    return case
+
+
+def thread_queue() -> int:
+    items_queue = Queue[int](queue.Queue())
+    FullPipeline(Range(NB_QUEUE_ITEMS) + PutToQueue(items_queue, PutBlocking())).run()
+
+    items = GetFromQueue(items_queue, GetBlocking()).extract()
+    for _ in range(NB_QUEUE_ITEMS):
+        next(items)
+
+    return NB_QUEUE_ITEMS
+
+
+def _produce(items_queue: Queue[int], nb_items: int) -> None:
+    FullPipeline(Range(nb_items) + PutToQueue(items_queue, PutBlocking())).run()
+
+
+def process_queue() -> int:
+    items_queue = Queue[int](multiprocessing.Queue())
+    producer = multiprocessing.Process(
+        target=_produce, args=(items_queue, NB_QUEUE_ITEMS)
+    )
+    producer.start()
+
+    items = GetFromQueue(items_queue, GetBlocking()).extract()
+    for _ in range(NB_QUEUE_ITEMS):
+        next(items)
+
+    producer.join()
+    return NB_QUEUE_ITEMS
+
+
+def runnables(runner: Callable[[List[Runnable]], Runnable], nb_workers: int) -> Case:
+    def case() -> int:
+        pipelines: List[Runnable] = [
+            FullPipeline(Range(NB_CPU_ITEMS) + PushTo(Spin()))
+            for _ in range(nb_workers)
+        ]
+
+        runner(pipelines).run()
+        return NB_CPU_ITEMS * nb_workers
+
+    return case
+
+
+CASES: Dict[str, Case] = {
+    "mapper_chain[0]": mapper_chain(0),
+    "mapper_chain[5]": mapper_chain(5),
+    "mapper_chain[10]": mapper_chain(10),
+    "mapper_chain[10,fused]": mapper_chain(10, fused=True),
+    "loader_chain[1]": loader_chain(1),
+    "loader_chain[5]": loader_chain(5),
+    "loader_chain[10]": loader_chain(10),
+    "buffer[1]": buffer(1),
+    "buffer[10]": buffer(10),
+    "buffer[100]": buffer(100),
+    "buffer[1000]": buffer(1000),
+    "queue[thread]": thread_queue,
+    "queue[process]": process_queue,
+    "multi_thread[1]": runnables(MultiThread, 1),
+    "multi_thread[2]": runnables(MultiThread, 2),
+    "multi_thread[4]": runnables(MultiThread, 4),
+    "multi_process[1]": runnables(MultiProcess, 1),
+    "multi_process[2]": runnables(MultiProcess, 2),
+    "multi_process[4]": runnables(MultiProcess, 4),
+}
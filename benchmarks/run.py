@@ -0,0 +1,89 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.cases import CASES, Case
+
+
+def measure(case: Case, repeat: int) -> float:
+    rates: List[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nb_items = case()
+        rates.append(nb_items / (time.perf_counter() - start))
+
+    return statistics.median(rates)
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    regressions: List[str] = []
+
+    for name, rate in results.items():
+        if name not in baseline:
+            print(f"{name:<26} {rate:>14.0f} items/s {'(new)':>10}")
+            continue
+
+        change = 100 * (rate - baseline[name]) / baseline[name]
+        print(f"{name:<26} {rate:>14.0f} items/s {change:>+9.1f}%")
+
+        if change < -threshold:
+            regressions.append(name)
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the modupipe benchmarks.")
+    parser.add_argument("-k", "--filter", default="", help="only run matching cases")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--save", help="save the results to this JSON file")
+    parser.add_argument("--compare", help="compare with a saved JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="slowdown percentage considered a regression when comparing",
+    )
+    args = parser.parse_args(argv)
+
+    results: Dict[str, float] = {}
+    for name, case in CASES.items():
+        if args.filter in name:
+            results[name] = measure(case, args.repeat)
+            if not args.compare:
+                print(f"{name:<26} {results[name]:>14.0f} items/s")
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions over {args.threshold}% : {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+from modupipe.extractor import Random
+from modupipe.loader import Loader
+from modupipe.mapper import ParallelMap, Print
+from modupipe.runnable import FullPipeline
+
+
+class SlowSquare(Loader[float, float]):
+    def load(self, item: float) -> float:
+        result = item
+        for _ in range(100_000):
+            result = (result * result) % 1
+
+        return result
+
+
+if __name__ == "__main__":
+    extractor = Random() + ParallelMap(SlowSquare(), workers=4, chunk_size=16) + Print()
+
+    pipeline = FullPipeline(extractor)
+
+    pipeline.run()
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from modupipe.base import Condition
+from modupipe.extractor import Extractor
+from modupipe.loader import Loader
+from modupipe.runnable import Runnable
+
+Data = TypeVar("Data")
+Input = TypeVar("Input")
+Output = TypeVar("Output")
+NextOutput = TypeVar("NextOutput")
+
+
+class AsyncMapper(ABC, Generic[Input, Output]):
+    @abstractmethod
+    def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Output]:
+        pass
+
+    def __add__(
+        self, next: AsyncMapper[Output, NextOutput]
+    ) -> AsyncMapper[Input, NextOutput]:
+        return AsyncChainedMapper(self, next)
+
+
+AsyncIdentityMapper = AsyncMapper[Input, Input]
+
+
+class AsyncChainedMapper(
+    AsyncMapper[Input, NextOutput], Generic[Input, Output, NextOutput]
+):
+    def __init__(
+        self, mapper: AsyncMapper[Input, Output], next: AsyncMapper[Output, NextOutput]
+    ) -> None:
+        self.mapper = mapper
+        self.next = next
+
+    def map(self, input: AsyncIterator[Input]) -> AsyncIterator[NextOutput]:
+        output = self.mapper.map(input)
+        return self.next.map(output)
+
+
+class AsyncExtractor(ABC, Generic[Data]):
+    @abstractmethod
+    def extract(self) -> AsyncIterator[Data]:
+        pass
+
+    def __add__(self, mapper: AsyncMapper[Data, Output]) -> AsyncExtractor[Output]:
+        return AsyncMappedExtractor(self, mapper)
+
+
+class AsyncMappedExtractor(AsyncExtractor[Output], Generic[Data, Output]):
+    def __init__(
+        self, extractor: AsyncExtractor[Data], mapper: AsyncMapper[Data, Output]
+    ) -> None:
+        self.extractor = extractor
+        self.mapper = mapper
+
+    def extract(self) -> AsyncIterator[Output]:
+        return self.mapper.map(self.extractor.extract())
+
+
+class AsyncLoader(ABC, Generic[Input, Output]):
+    @abstractmethod
+    async def load(self, item: Input) -> Output:
+        pass
+
+    def __add__(
+        self, next: AsyncLoader[Output, NextOutput]
+    ) -> AsyncLoader[Input, NextOutput]:
+        return AsyncChainedLoader(self, next)
+
+
+class AsyncChainedLoader(
+    AsyncLoader[Input, NextOutput], Generic[Input, Output, NextOutput]
+):
+    def __init__(
+        self, mapper: AsyncLoader[Input, Output], next: AsyncLoader[Output, NextOutput]
+    ) -> None:
+        self.mapper = mapper
+        self.next = next
+
+    async def load(self, item: Input) -> NextOutput:
+        mapped_item = await self.mapper.load(item)
+        return await self.next.load(mapped_item)
+
+
+class AsyncFilter(AsyncIdentityMapper[Input]):
+    def __init__(self, condition: Condition[Input]) -> None:
+        self.condition = condition
+
+    async def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Input]:
+        async for item in items:
+            if self.condition.check(item):
+                yield item
+
+
+class AsyncPushTo(AsyncIdentityMapper[Input]):
+    def __init__(self, loader: AsyncLoader[Input, Any]) -> None:
+        self.loader = loader
+
+    async def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Input]:
+        async for item in items:
+            await self.loader.load(item)
+            yield item
+
+
+class AsyncPushToAndMap(AsyncMapper[Input, Output]):
+    def __init__(self, loader: AsyncLoader[Input, Output]) -> None:
+        self.loader = loader
+
+    async def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Output]:
+        async for item in items:
+            yield await self.loader.load(item)
+
+
+class AsyncConcurrentPushTo(AsyncIdentityMapper[Input]):
+    def __init__(
+        self,
+        loader: AsyncLoader[Input, Any],
+        max_in_flight: int = 8,
+        ordered: bool = True,
+    ) -> None:
+        self.loader = loader
+        self.max_in_flight = max_in_flight
+        self.ordered = ordered
+
+    async def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Input]:
+        loaded = _load_concurrently(
+            self.loader, items, self.max_in_flight, self.ordered
+        )
+        async for item, _ in loaded:
+            yield item
+
+
+class AsyncConcurrentPushToAndMap(AsyncMapper[Input, Output]):
+    def __init__(
+        self,
+        loader: AsyncLoader[Input, Output],
+        max_in_flight: int = 8,
+        ordered: bool = True,
+    ) -> None:
+        self.loader = loader
+        self.max_in_flight = max_in_flight
+        self.ordered = ordered
+
+    async def map(self, items: AsyncIterator[Input]) -> AsyncIterator[Output]:
+        loaded = _load_concurrently(
+            self.loader, items, self.max_in_flight, self.ordered
+        )
+        async for _, output in loaded:
+            yield output
+
+
+async def _load_concurrently(
+    loader: AsyncLoader[Input, Output],
+    items: AsyncIterator[Input],
+    max_in_flight: int,
+    ordered: bool,
+) -> AsyncIterator[Tuple[Input, Output]]:
+    pending: Dict[asyncio.Task, Input] = {}
+
+    try:
+        async for item in items:
+            pending[asyncio.ensure_future(loader.load(item))] = item
+
+            if len(pending) >= max_in_flight:
+                for loaded in await _pop_completed(pending, ordered):
+                    yield loaded
+
+        while pending:
+            for loaded in await _pop_completed(pending, ordered):
+                yield loaded
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _pop_completed(
+    pending: Dict[asyncio.Task, Input], ordered: bool
+) -> List[Tuple[Input, Any]]:
+    if ordered:
+        task = next(iter(pending))
+        output = await task
+        return [(pending.pop(task), output)]
+
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+    return [(pending.pop(task), task.result()) for task in done]
+
+
+class FromExtractor(AsyncExtractor[Data]):
+    def __init__(self, extractor: Extractor[Data], in_thread: bool = False) -> None:
+        self.extractor = extractor
+        self.in_thread = in_thread
+
+    async def extract(self) -> AsyncIterator[Data]:
+        iterator = self.extractor.extract()
+        end = object()
+
+        while True:
+            if self.in_thread:
+                item = await asyncio.to_thread(next, iterator, end)
+            else:
+                item = next(iterator, end)
+
+            if item is end:
+                return
+
+            yield cast(Data, item)
+
+
+class FromLoader(AsyncLoader[Input, Output]):
+    def __init__(self, loader: Loader[Input, Output], in_thread: bool = False) -> None:
+        self.loader = loader
+        self.in_thread = in_thread
+
+    async def load(self, item: Input) -> Output:
+        if self.in_thread:
+            return await asyncio.to_thread(self.loader.load, item)
+        else:
+            return self.loader.load(item)
+
+
+class ToExtractor(Extractor[Data]):
+    def __init__(self, extractor: AsyncExtractor[Data]) -> None:
+        self.extractor = extractor
+
+    def extract(self) -> Iterator[Data]:
+        loop = asyncio.new_event_loop()
+        iterator = self.extractor.extract().__aiter__()
+
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+class ToLoader(Loader[Input, Output]):
+    def __init__(self, loader: AsyncLoader[Input, Output]) -> None:
+        self.loader = loader
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def load(self, item: Input) -> Output:
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+
+        return self.loop.run_until_complete(self.loader.load(item))
+
+    def close(self) -> None:
+        if self.loop is not None:
+            self.loop.close()
+            self.loop = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+class AsyncRunnable(Runnable):
+    @abstractmethod
+    async def run_async(self):
+        pass
+
+    def run(self):
+        asyncio.run(self.run_async())
+
+
+class AsyncFullPipeline(AsyncRunnable, Generic[Data]):
+    def __init__(self, extractor: AsyncExtractor[Data]) -> None:
+        self.extractor = extractor
+
+    async def run_async(self):
+        async for _ in self.extractor.extract():
+            pass
+
+
+class AsyncMultiTask(AsyncRunnable):
+    def __init__(self, runnables: List[AsyncRunnable]) -> None:
+        self.runnables = runnables
+
+    async def run_async(self):
+        await asyncio.gather(*(runnable.run_async() for runnable in self.runnables))
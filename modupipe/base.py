@@ -1,10 +1,65 @@
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Tuple, Type, TypeVar
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class Condition(ABC, Generic[T]):
     @abstractmethod
     def check(self, item: T) -> bool:
         pass
+
+
+class Failure(Generic[T]):
+    def __init__(self, item: T, exception: Exception) -> None:
+        self.item = item
+        self.exception = exception
+
+
+class EndOfStream:
+    pass
+
+
+class Backoff:
+    def __init__(
+        self,
+        initial: float = 0.1,
+        multiplier: float = 2.0,
+        maximum: float = 10.0,
+        jitter: bool = False,
+    ) -> None:
+        self.initial = initial
+        self.multiplier = multiplier
+        self.maximum = maximum
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.maximum, self.initial * self.multiplier**attempt)
+
+        if self.jitter:
+            return random.uniform(0, delay)
+
+        return delay
+
+
+def retry(
+    function: Callable[[T], R],
+    item: T,
+    nb_times: int,
+    backoff: Backoff,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+) -> R:
+    attempt = 0
+
+    while True:
+        try:
+            return function(item)
+        except exceptions:
+            if attempt >= nb_times:
+                raise
+
+            time.sleep(backoff.delay(attempt))
+            attempt += 1
@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from contextlib import nullcontext
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from modupipe.loader import Loader
+from modupipe.mapper import MapItem, Mapper
+
+Input = TypeVar("Input")
+Output = TypeVar("Output")
+Value = TypeVar("Value")
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class Cache(Generic[Value]):
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        thread_safe: bool = False,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.entries: OrderedDict[Hashable, Tuple[Value, float]] = OrderedDict()
+        self.lock: ContextManager[Any] = Lock() if thread_safe else nullcontext()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Value]) -> Value:
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None:
+                value, expires_at = entry
+
+                if self.ttl is None or self.clock() < expires_at:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self.entries[key]
+                self.expirations += 1
+
+            self.misses += 1
+
+        value = compute()
+
+        with self.lock:
+            expires_at = self.clock() + self.ttl if self.ttl is not None else 0.0
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+
+            while self.max_size is not None and len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class CachedLoader(Loader[Input, Output]):
+    def __init__(
+        self,
+        loader: Loader[Input, Output],
+        cache: Optional[Cache[Output]] = None,
+        key: Callable[[Input], Hashable] = _identity,
+    ) -> None:
+        self.loader = loader
+        self.cache: Cache[Output] = cache if cache is not None else Cache()
+        self.key = key
+
+    def load(self, item: Input) -> Output:
+        return self.cache.get_or_compute(self.key(item), lambda: self.loader.load(item))
+
+    def flush(self) -> Optional[Output]:
+        return self.loader.flush()
+
+
+class CachedMapper(Mapper[Input, Output]):
+    def __init__(
+        self,
+        mapper: Mapper[Input, Output],
+        cache: Optional[Cache[List[Output]]] = None,
+        key: Callable[[Input], Hashable] = _identity,
+    ) -> None:
+        self.loader = CachedLoader(MapItem(mapper), cache, key)
+
+    @property
+    def cache(self) -> Cache[List[Output]]:
+        return self.loader.cache
+
+    def map(self, items: Iterator[Input]) -> Iterator[Output]:
+        for item in items:
+            yield from self.loader.load(item)
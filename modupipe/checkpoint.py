@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Generic, Iterator, Optional, Tuple, TypeVar
+
+from modupipe.extractor import Extractor, MappedExtractor
+
+Data = TypeVar("Data")
+
+Position = Any
+
+
+class CheckpointStore(ABC):
+    @abstractmethod
+    def load(self) -> Optional[Position]:
+        pass
+
+    @abstractmethod
+    def save(self, position: Position) -> None:
+        pass
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    def __init__(self, position: Optional[Position] = None) -> None:
+        self.position = position
+
+    def load(self) -> Optional[Position]:
+        return self.position
+
+    def save(self, position: Position) -> None:
+        self.position = position
+
+
+class FileCheckpointStore(CheckpointStore):
+    def __init__(self, path: str, fsync: bool = True) -> None:
+        self.path = path
+        self.fsync = fsync
+
+    def load(self) -> Optional[Position]:
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, position: Position) -> None:
+        # Written next to the checkpoint then renamed, so that a crash never
+        # leaves a truncated checkpoint behind.
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(position, file)
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+        os.replace(temporary, self.path)
+
+
+class ResumableExtractor(Extractor[Data]):
+    # Yields each item with the position to resume from to extract the next
+    # items, starting after `position` (or from the start when it is None).
+    @abstractmethod
+    def extract_from(
+        self, position: Optional[Position]
+    ) -> Iterator[Tuple[Position, Data]]:
+        pass
+
+    def extract(self) -> Iterator[Data]:
+        for _, item in self.extract_from(None):
+            yield item
+
+
+class Checkpointed(Extractor[Data], Generic[Data]):
+    def __init__(
+        self,
+        extractor: ResumableExtractor[Data],
+        store: CheckpointStore,
+        every: int = 1000,
+    ) -> None:
+        self.extractor = extractor
+        self.store = store
+        self.every = every
+        self.position: Optional[Position] = None
+        self.committed: Optional[Position] = None
+        self.pending = 0
+        self.nb_commits = 0
+
+    def extract(self) -> Iterator[Data]:
+        self.position = self.committed = self.store.load()
+        self.pending = 0
+
+        for position, item in self.extractor.extract_from(self.position):
+            self.position = position
+            yield item
+
+    # Called once the pipeline is done with everything extracted so far.
+    def acknowledge(self) -> None:
+        self.pending += 1
+
+        if self.pending >= self.every:
+            self.commit()
+
+    def commit(self) -> None:
+        if self.position != self.committed:
+            self.store.save(self.position)
+            self.committed = self.position
+            self.nb_commits += 1
+
+        self.pending = 0
+
+
+def find_checkpointed(extractor: Extractor[Any]) -> Optional[Checkpointed[Any]]:
+    while isinstance(extractor, MappedExtractor):
+        extractor = extractor.extractor
+
+    if isinstance(extractor, Checkpointed):
+        return extractor
+
+    return None
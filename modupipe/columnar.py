@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from array import array
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from modupipe.mapper import Mapper
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+# A column is a memoryview on an `array.array` for typed columns, a numpy
+# array, or a list for untyped ones. Slicing the first two does not copy.
+Column = Any
+
+# Pairs of a column name and an `array` typecode (None for untyped columns).
+Schema = Sequence[Tuple[str, Optional[str]]]
+
+
+class Columns:
+    def __init__(self, columns: Dict[str, Column]) -> None:
+        self.columns = columns
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+
+        return 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.columns)
+
+    def select(self, names: Sequence[str]) -> Columns:
+        return Columns({name: self.columns[name] for name in names})
+
+    def slice(self, start: int, stop: int) -> Columns:
+        return Columns(
+            {name: column[start:stop] for name, column in self.columns.items()}
+        )
+
+    def compress(self, mask: Sequence[bool]) -> Columns:
+        flags = mask
+        if numpy is not None and isinstance(mask, numpy.ndarray):
+            flags = mask.tolist()
+
+        return Columns(
+            {
+                name: _compress(column, mask, flags)
+                for name, column in self.columns.items()
+            }
+        )
+
+    def with_column(self, name: str, column: Column) -> Columns:
+        return Columns({**self.columns, name: column})
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*self.columns.values())
+
+
+class ToColumns(Mapper[Any, Columns]):
+    # Rows are tuples in the order of the schema, or mappings with `by_name`.
+    def __init__(
+        self,
+        size: int,
+        schema: Schema,
+        by_name: bool = False,
+        use_numpy: bool = False,
+    ) -> None:
+        if use_numpy and numpy is None:
+            raise ImportError(
+                "ToColumns with use_numpy requires numpy to be installed."
+            )
+
+        self.size = size
+        self.schema = schema
+        self.by_name = by_name
+        self.use_numpy = use_numpy
+
+    def map(self, items: Iterator[Any]) -> Iterator[Columns]:
+        rows: List[Any] = []
+
+        for item in items:
+            rows.append(item)
+
+            if len(rows) >= self.size:
+                yield self._build(rows)
+                rows = []
+
+        if rows:
+            yield self._build(rows)
+
+    # Transposed one column at a time, which is much cheaper than zip(*rows)
+    # for large batches.
+    def _build(self, rows: List[Any]) -> Columns:
+        columns: Dict[str, Column] = {}
+
+        for index, (name, typecode) in enumerate(self.schema):
+            values = map(itemgetter(name if self.by_name else index), rows)
+            columns[name] = _column(values, typecode, self.use_numpy)
+
+        return Columns(columns)
+
+
+class SelectColumns(Mapper[Columns, Columns]):
+    def __init__(self, names: Sequence[str]) -> None:
+        self.names = names
+
+    def map(self, items: Iterator[Columns]) -> Iterator[Columns]:
+        for item in items:
+            yield item.select(self.names)
+
+
+class FilterColumns(Mapper[Columns, Columns]):
+    # `predicate` is called with each value of `column`, or once with the
+    # whole column when `vectorized`, returning a mask.
+    def __init__(
+        self, column: str, predicate: Callable[[Any], Any], vectorized: bool = False
+    ) -> None:
+        self.column = column
+        self.predicate = predicate
+        self.vectorized = vectorized
+
+    def map(self, items: Iterator[Columns]) -> Iterator[Columns]:
+        for item in items:
+            if self.vectorized:
+                mask = self.predicate(item[self.column])
+            else:
+                mask = list(map(self.predicate, item[self.column]))
+
+            filtered = item.compress(mask)
+            if len(filtered):
+                yield filtered
+
+
+class MapColumn(Mapper[Columns, Columns]):
+    # Stores `function` applied to the values of `column` (or to the whole
+    # column when `vectorized`) as the `output` column, typed by `typecode`.
+    def __init__(
+        self,
+        column: str,
+        function: Callable[[Any], Any],
+        output: Optional[str] = None,
+        typecode: Optional[str] = None,
+        vectorized: bool = False,
+    ) -> None:
+        self.column = column
+        self.function = function
+        self.output = output or column
+        self.typecode = typecode
+        self.vectorized = vectorized
+
+    def map(self, items: Iterator[Columns]) -> Iterator[Columns]:
+        for item in items:
+            if self.vectorized:
+                column = self.function(item[self.column])
+            else:
+                values = map(self.function, item[self.column])
+                column = _column(values, self.typecode, False)
+
+            yield item.with_column(self.output, column)
+
+
+class ToRows(Mapper[Columns, Tuple[Any, ...]]):
+    def map(self, items: Iterator[Columns]) -> Iterator[Tuple[Any, ...]]:
+        for item in items:
+            yield from item.rows()
+
+
+def _column(values: Any, typecode: Optional[str], use_numpy: bool) -> Column:
+    if typecode is None:
+        return list(values)
+
+    typed = array(typecode, values)
+    if use_numpy:
+        return numpy.frombuffer(typed, dtype=typecode)
+
+    return memoryview(typed)
+
+
+# `flags` is `mask` as a list, for the columns which are not numpy arrays.
+def _compress(column: Column, mask: Sequence[bool], flags: Sequence[bool]) -> Column:
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[numpy.asarray(mask, dtype=bool)]
+    if isinstance(column, memoryview):
+        return memoryview(array(column.format, compress(column, flags)))
+
+    return list(compress(column, flags))
@@ -1,3 +1,8 @@
 class MaxIterationsReached(RuntimeError):
     def __init__(self) -> None:
         super().__init__("Max number of iterations reached.")
+
+
+class QueueClosed(Exception):
+    def __init__(self) -> None:
+        super().__init__("Queue was closed by all of its producers.")
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import multiprocessing
+import queue
+import threading
 from abc import ABC, abstractmethod
 from random import random
-from typing import Generic, Iterator, List, Tuple, TypeVar
+from typing import Any, Generic, Iterator, List, Tuple, TypeVar, Union
 
-from modupipe.exceptions import MaxIterationsReached
+from modupipe.exceptions import MaxIterationsReached, QueueClosed
+from modupipe.iterators import BackgroundIterator
 from modupipe.mapper import Mapper
 from modupipe.queue import Queue, QueueGetStrategy
 
@@ -42,6 +46,83 @@ class ExtractorList(Extractor[Tuple[Data, ...]], Generic[Data]):
             yield items
 
 
+class Merge(Extractor[Union[Data, Tuple[int, Data]]]):
+    def __init__(
+        self,
+        extractors: List[Extractor[Data]],
+        buffer_size: int = 1,
+        tagged: bool = False,
+        process: bool = False,
+    ) -> None:
+        self.extractors = extractors
+        self.buffer_size = buffer_size
+        self.tagged = tagged
+        self.process = process
+
+    def extract(self) -> Iterator[Union[Data, Tuple[int, Data]]]:
+        ready: Any = (
+            multiprocessing.Semaphore(0) if self.process else threading.Semaphore(0)
+        )
+        sources = [
+            BackgroundIterator(
+                extractor.extract,
+                maxsize=self.buffer_size,
+                process=self.process,
+                ready=ready,
+            )
+            for extractor in self.extractors
+        ]
+        active = list(range(len(sources)))
+
+        try:
+            while active:
+                ready.acquire()
+                index, item, active = self._next_ready(sources, active)
+
+                if index is not None:
+                    yield (index, item) if self.tagged else item
+        finally:
+            for source in sources:
+                source.close()
+
+    def _next_ready(
+        self, sources: List[BackgroundIterator[Data]], active: List[int]
+    ) -> Tuple[Any, Any, List[int]]:
+        # Items of process sources can be announced slightly before they are
+        # readable, hence the retry until one of them is.
+        while True:
+            for position, index in enumerate(active):
+                try:
+                    item = sources[index].next(timeout=0)
+                except queue.Empty:
+                    continue
+                except StopIteration:
+                    del active[position]
+                    return None, None, active
+
+                following = position + 1
+                return index, item, active[following:] + active[:following]
+
+
+class Prefetch(Extractor[Data]):
+    def __init__(
+        self, extractor: Extractor[Data], depth: int = 1, process: bool = False
+    ) -> None:
+        self.extractor = extractor
+        self.depth = depth
+        self.process = process
+
+    def extract(self) -> Iterator[Data]:
+        source = BackgroundIterator(
+            self.extractor.extract, maxsize=self.depth, process=self.process
+        )
+
+        try:
+            yield from source
+        finally:
+            source.close()
+
+
 class GetFromQueue(Extractor[Data]):
     def __init__(self, queue: Queue[Data], strategy: QueueGetStrategy[Data]) -> None:
         self.queue = queue
@@ -49,7 +130,12 @@ class GetFromQueue(Extractor[Data]):
 
     def extract(self) -> Iterator[Data]:
         while True:
-            yield self.strategy.get(self.queue)
+            try:
+                item = self.strategy.get(self.queue)
+            except QueueClosed:
+                return
+
+            yield item
 
 
 class Random(Extractor[float]):
@@ -0,0 +1,470 @@
+import csv
+import io
+import json
+import mmap
+import os
+from abc import abstractmethod
+from itertools import repeat
+from time import monotonic
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+from modupipe.checkpoint import ResumableExtractor
+from modupipe.loader import IdentityLoader
+
+FSYNC_POLICIES = ("never", "flush", "close")
+
+Block = Tuple[int, int, Any]
+
+
+def byte_ranges(path: str, nb_ranges: int) -> List[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    bounds = [size * index // nb_ranges for index in range(nb_ranges + 1)]
+
+    return list(zip(bounds, bounds[1:]))
+
+
+class FileExtractor(ResumableExtractor[Any]):
+    # Reads the records starting in the byte range [start, end). A record
+    # crossing `start` belongs to the previous range, and a record crossing
+    # `end` to this one.
+    #
+    # Records are split out of blocks of about `chunk_size` bytes of whole
+    # lines. Positions are block boundaries, so resuming reads the records of
+    # a partly processed block again.
+    def __init__(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        use_mmap: bool = True,
+        chunk_size: int = 1 << 20,
+        encoding: Optional[str] = "utf-8",
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.end = end
+        self.batch_size = batch_size
+        self.use_mmap = use_mmap
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+    def extract(self) -> Iterator[Any]:
+        if self.batch_size is not None:
+            for _, batch in self.extract_from(None):
+                yield batch
+            return
+
+        for _, _, records in self._parsed_blocks(None):
+            yield from records
+
+    def extract_from(self, position: Optional[int]) -> Iterator[Tuple[int, Any]]:
+        blocks = self._parsed_blocks(position)
+
+        if self.batch_size is not None:
+            yield from _batches(blocks, self.batch_size)
+            return
+
+        for start, end, records in blocks:
+            last = records.pop()
+            yield from zip(repeat(start), records)
+            yield end, last
+
+    def _parsed_blocks(self, position: Optional[int]) -> Iterator[Block]:
+        with open(self.path, "rb") as file:
+            if position is None:
+                position = _align(file, self.start, self.chunk_size)
+
+            for start, end, block in self._blocks(file, position):
+                records = self._parse(block, start)
+                if records:
+                    yield start, end, records
+
+    def _blocks(self, file: Any, position: int) -> Iterator[Block]:
+        if not self.use_mmap:
+            yield from self._complete(
+                _blocks(file, position, self.end, self.chunk_size)
+            )
+            return
+
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from self._complete(
+                _blocks(mapped, position, self.end, self.chunk_size)
+            )
+
+    def _complete(self, blocks: Iterator[Block]) -> Iterator[Block]:
+        pending: Optional[Tuple[int, bytes]] = None
+        end = 0
+
+        for start, end, block in blocks:
+            if pending is not None:
+                start, block = pending[0], pending[1] + block
+
+            if self._is_complete(block):
+                yield start, end, block
+                pending = None
+            else:
+                pending = start, block
+
+        if pending is not None:
+            yield pending[0], end, pending[1]
+
+    # Whether a block of lines holds whole records, for records spanning
+    # several lines.
+    def _is_complete(self, block: bytes) -> bool:
+        return True
+
+    @abstractmethod
+    def _parse(self, block: bytes, start: int) -> List[Any]:
+        pass
+
+    def _lines(self, block: bytes) -> List[Any]:
+        data: Any = block if self.encoding is None else block.decode(self.encoding)
+        newline = b"\n" if self.encoding is None else "\n"
+        carriage_return = b"\r" if self.encoding is None else "\r"
+
+        lines = data.split(newline)
+        if data.endswith(newline):
+            lines.pop()
+
+        if carriage_return in data:
+            return [
+                line[:-1] if line.endswith(carriage_return) else line for line in lines
+            ]
+
+        return lines
+
+
+class Lines(FileExtractor):
+    # Yields bytes when `encoding` is None.
+    def _parse(self, block: bytes, start: int) -> List[Any]:
+        return self._lines(block)
+
+
+class Jsonl(FileExtractor):
+    def _parse(self, block: bytes, start: int) -> List[Any]:
+        return [json.loads(line) for line in self._lines(block) if line]
+
+
+class Csv(FileExtractor):
+    # With `header`, rows are dicts keyed by the first row of the file. Quoted
+    # fields may contain newlines, as long as byte ranges do not split them.
+    def __init__(
+        self,
+        path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        use_mmap: bool = True,
+        chunk_size: int = 1 << 20,
+        encoding: str = "utf-8",
+        header: bool = False,
+        **format: Any,
+    ) -> None:
+        super().__init__(path, start, end, batch_size, use_mmap, chunk_size, encoding)
+        self.text_encoding = encoding
+        self.header = header
+        self.format = format
+        self.quote = format.get("quotechar", '"').encode(encoding)
+        self.fieldnames: List[str] = []
+
+    # The header is read once per extraction, not for each block.
+    def _parsed_blocks(self, position: Optional[int]) -> Iterator[Block]:
+        if self.header:
+            self.fieldnames = self._fieldnames()
+
+        return super()._parsed_blocks(position)
+
+    def _is_complete(self, block: bytes) -> bool:
+        return block.count(self.quote) % 2 == 0
+
+    def _parse(self, block: bytes, start: int) -> List[Any]:
+        text = io.StringIO(block.decode(self.text_encoding), newline="")
+        rows = csv.reader(text, **self.format)
+
+        if not self.header:
+            return list(rows)
+
+        if start == 0:
+            next(rows, None)
+
+        fieldnames = self.fieldnames
+        return [dict(zip(fieldnames, row)) for row in rows]
+
+    def _fieldnames(self) -> List[str]:
+        with open(self.path, newline="", encoding=self.text_encoding) as file:
+            return next(csv.reader(file, **self.format), [])
+
+
+class WriteFile(IdentityLoader[Any]):
+    # Encoded items are written once `buffer_size` bytes are pending, once the
+    # oldest pending item is `max_wait` seconds old (checked when loading), and
+    # when flushing at the end of the stream, which also closes the file.
+    #
+    # `fsync` is "never", "flush" (after each write) or "close". With
+    # `max_file_bytes`, the output rotates to a new file, named by formatting
+    # `{index}` in the path, or by adding `.<index>` to the following ones.
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = 1 << 20,
+        max_wait: Optional[float] = None,
+        fsync: str = "never",
+        max_file_bytes: Optional[int] = None,
+        append: bool = False,
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}.")
+
+        self.path = path
+        self.buffer_size = buffer_size
+        self.max_wait = max_wait
+        self.fsync = fsync
+        self.max_file_bytes = max_file_bytes
+        self.append = append
+        self.file: Optional[BinaryIO] = None
+        self.index = 0
+        self.file_bytes = 0
+        self.pending: List[bytes] = []
+        self.pending_bytes = 0
+        self.deadline: Optional[float] = None
+        self.paths: List[str] = []
+
+    def load(self, item: Any) -> Any:
+        data = self._encode(item)
+
+        if self._must_rotate(len(data)):
+            self._write()
+            self._close()
+            self.index += 1
+            self.file_bytes = 0
+
+        if not self.pending and self.max_wait is not None:
+            self.deadline = monotonic() + self.max_wait
+
+        self.pending.append(data)
+        self.pending_bytes += len(data)
+
+        if self.pending_bytes >= self.buffer_size:
+            self._write()
+        elif self.deadline is not None and monotonic() >= self.deadline:
+            self._write()
+
+        return item
+
+    def flush(self) -> None:
+        self._write()
+        self._close()
+
+    @abstractmethod
+    def _encode(self, item: Any) -> bytes:
+        pass
+
+    # Written at the start of each new file.
+    def _header(self) -> bytes:
+        return b""
+
+    def _must_rotate(self, nb_bytes: int) -> bool:
+        if self.max_file_bytes is None:
+            return False
+
+        written = self.file_bytes + self.pending_bytes
+        return written > 0 and written + nb_bytes > self.max_file_bytes
+
+    def _current_path(self) -> str:
+        if "{index}" in self.path:
+            return self.path.format(index=self.index)
+        if self.index == 0:
+            return self.path
+
+        return f"{self.path}.{self.index}"
+
+    def _open(self) -> BinaryIO:
+        path = self._current_path()
+        reopened = path in self.paths
+
+        if not reopened:
+            self.paths.append(path)
+
+        file = open(path, "ab" if reopened or self.append else "wb")
+        if file.tell() == 0:
+            header = self._header()
+            file.write(header)
+            self.file_bytes += len(header)
+
+        return file
+
+    def _write(self) -> None:
+        if not self.pending:
+            return
+
+        if self.file is None:
+            self.file = self._open()
+
+        self.file.write(b"".join(self.pending))
+        self.file.flush()
+        self.file_bytes += self.pending_bytes
+        self.pending, self.pending_bytes, self.deadline = [], 0, None
+
+        if self.fsync == "flush":
+            _sync(self.file)
+
+    def _close(self) -> None:
+        if self.file is None:
+            return
+
+        if self.fsync == "close":
+            _sync(self.file)
+
+        self.file.close()
+        self.file = None
+
+
+class WriteBytes(WriteFile):
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = 1 << 20,
+        max_wait: Optional[float] = None,
+        fsync: str = "never",
+        max_file_bytes: Optional[int] = None,
+        append: bool = False,
+        delimiter: bytes = b"",
+    ) -> None:
+        super().__init__(path, buffer_size, max_wait, fsync, max_file_bytes, append)
+        self.delimiter = delimiter
+
+    def _encode(self, item: Any) -> bytes:
+        if self.delimiter:
+            return bytes(item) + self.delimiter
+
+        return bytes(item)
+
+
+class WriteJsonl(WriteFile):
+    def _encode(self, item: Any) -> bytes:
+        return (json.dumps(item) + "\n").encode()
+
+
+class WriteCsv(WriteFile):
+    # With `fieldnames`, items are dicts and each file starts with a header.
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = 1 << 20,
+        max_wait: Optional[float] = None,
+        fsync: str = "never",
+        max_file_bytes: Optional[int] = None,
+        append: bool = False,
+        fieldnames: Optional[Sequence[str]] = None,
+        encoding: str = "utf-8",
+        **format: Any,
+    ) -> None:
+        super().__init__(path, buffer_size, max_wait, fsync, max_file_bytes, append)
+        self.fieldnames = fieldnames
+        self.encoding = encoding
+        self.format = format
+        self.text: Optional[io.StringIO] = None
+        self.writer: Any = None
+
+    def _encode(self, item: Any) -> bytes:
+        if self.fieldnames is not None:
+            item = [item.get(name, "") for name in self.fieldnames]
+
+        return self._row(item)
+
+    def _header(self) -> bytes:
+        if self.fieldnames is None:
+            return b""
+
+        return self._row(self.fieldnames)
+
+    def _row(self, row: Sequence[Any]) -> bytes:
+        # The writer is created on first use, to keep the loader picklable.
+        if self.text is None:
+            self.text = io.StringIO()
+            self.writer = csv.writer(self.text, **self.format)
+
+        self.writer.writerow(row)
+        data = self.text.getvalue().encode(self.encoding)
+        self.text.seek(0)
+        self.text.truncate()
+
+        return data
+
+
+def _sync(file: BinaryIO) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def _align(file: Any, start: int, chunk_size: int) -> int:
+    if start == 0:
+        return 0
+
+    position = start - 1
+    file.seek(position)
+
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return position
+
+        newline = chunk.find(b"\n")
+        if newline != -1:
+            return position + newline + 1
+
+        position += len(chunk)
+
+
+# Yields blocks of whole lines, with their start and end positions, from a
+# file or a memory map. The last line of the file may miss its newline.
+def _blocks(
+    source: Any, position: int, end: Optional[int], chunk_size: int
+) -> Iterator[Block]:
+    source.seek(position)
+    pending = b""
+
+    while end is None or position < end:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            if pending:
+                yield position, position + len(pending), pending
+            return
+
+        data = pending + chunk if pending else chunk
+        length = data.rfind(b"\n") + 1
+        if not length:
+            pending = data
+            continue
+
+        if end is not None and position + length > end:
+            length = data.find(b"\n", end - position - 1) + 1
+
+        yield position, position + length, data[:length]
+        pending = data[length:]
+        position += length
+
+
+def _batches(blocks: Iterator[Block], size: int) -> Iterator[Tuple[int, List[Any]]]:
+    batch: List[Any] = []
+    position = 0
+
+    for start, end, records in blocks:
+        offset = 0
+
+        while len(batch) + len(records) - offset >= size:
+            stop = offset + size - len(batch)
+            batch.extend(records[offset:stop])
+            offset = stop
+            yield (end if offset == len(records) else start), batch
+            batch = []
+
+        batch.extend(records[offset:])
+        position = end
+
+    if batch:
+        yield position, batch
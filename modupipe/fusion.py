@@ -0,0 +1,135 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from modupipe import loader, mapper
+from modupipe.extractor import Extractor, MappedExtractor
+
+Function = Callable[[Any], Any]
+
+FILTER = "filter"
+MAP = "map"
+CALL = "call"
+
+
+class Step:
+    def __init__(self, kind: str, functions: List[Function]) -> None:
+        self.kind = kind
+        self.functions = functions
+
+
+class FusedMapper(mapper.Mapper[Any, Any]):
+    def __init__(self, steps: List[Step]) -> None:
+        self.steps = steps
+        self.fused_map = _compile(steps)
+
+    def map(self, items: Iterator[Any]) -> Iterator[Any]:
+        return self.fused_map(items)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"steps": self.steps}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.steps = state["steps"]
+        self.fused_map = _compile(self.steps)
+
+
+def fuse(extractor: Extractor[Any]) -> Extractor[Any]:
+    source, mappers = _flatten_extractor(extractor)
+    fused: List[mapper.Mapper[Any, Any]] = []
+    steps: List[Step] = []
+
+    for item_mapper in mappers:
+        item_steps = _steps_of(item_mapper)
+
+        if item_steps is None:
+            if steps:
+                fused.append(FusedMapper(steps))
+                steps = []
+            fused.append(item_mapper)
+        else:
+            steps.extend(item_steps)
+
+    if steps:
+        fused.append(FusedMapper(steps))
+
+    for fused_mapper in fused:
+        source = source + fused_mapper
+
+    return source
+
+
+def _flatten_extractor(
+    extractor: Extractor[Any],
+) -> Tuple[Extractor[Any], List[mapper.Mapper[Any, Any]]]:
+    if isinstance(extractor, MappedExtractor):
+        source, mappers = _flatten_extractor(extractor.extractor)
+        return source, mappers + _flatten_mapper(extractor.mapper)
+
+    return extractor, []
+
+
+def _flatten_mapper(
+    item_mapper: mapper.Mapper[Any, Any],
+) -> List[mapper.Mapper[Any, Any]]:
+    if isinstance(item_mapper, mapper.ChainedMapper):
+        return _flatten_mapper(item_mapper.mapper) + _flatten_mapper(item_mapper.next)
+
+    return [item_mapper]
+
+
+def _flatten_loader(item_loader: loader.Loader[Any, Any]) -> List[Function]:
+    if isinstance(item_loader, loader.ChainedLoader):
+        return _flatten_loader(item_loader.mapper) + _flatten_loader(item_loader.next)
+
+    return [item_loader.load]
+
+
+# Loaders flushing pending items at end of stream are left to PushTo and
+# PushToAndMap, since a fused step only has their load function.
+def _flushes(item_loader: loader.Loader[Any, Any]) -> bool:
+    if isinstance(item_loader, loader.ChainedLoader):
+        return _flushes(item_loader.mapper) or _flushes(item_loader.next)
+
+    return type(item_loader).flush is not loader.Loader.flush
+
+
+def _steps_of(item_mapper: mapper.Mapper[Any, Any]) -> Optional[List[Step]]:
+    if type(item_mapper) is mapper.Filter:
+        return [Step(FILTER, [item_mapper.condition.check])]
+    if type(item_mapper) is mapper.ToString:
+        return [Step(MAP, [str])]
+    if type(item_mapper) is mapper.Print:
+        return [Step(CALL, [print])]
+    if type(item_mapper) is mapper.PushTo and not _flushes(item_mapper.loader):
+        return [Step(CALL, _flatten_loader(item_mapper.loader))]
+    if type(item_mapper) is mapper.PushToAndMap and not _flushes(item_mapper.loader):
+        return [Step(MAP, _flatten_loader(item_mapper.loader))]
+
+    return None
+
+
+# Fused steps are compiled into a single generator function with one
+# statement per step, so that no extra Python call or generator frame is
+# added per item and per stage.
+def _compile(steps: List[Step]) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    namespace: Dict[str, Function] = {}
+    lines = ["def fused_map(items):", "    for item in items:"]
+
+    for i, step in enumerate(steps):
+        expression = "item"
+        for j, function in enumerate(step.functions):
+            name = f"step_{i}_{j}"
+            namespace[name] = function
+            expression = f"{name}({expression})"
+
+        if step.kind == FILTER:
+            lines.append(f"        if not {expression}:")
+            lines.append("            continue")
+        elif step.kind == MAP:
+            lines.append(f"        item = {expression}")
+        else:
+            lines.append(f"        {expression}")
+
+    lines.append("        yield item")
+    exec("\n".join(lines), namespace)
+
+    return namespace["fused_map"]
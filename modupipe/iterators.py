@@ -0,0 +1,100 @@
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _End:
+    pass
+
+
+class _Error:
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+def _put(buffer: Any, item: Any, stop: Any, ready: Any) -> bool:
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+
+        if ready is not None:
+            ready.release()
+        return True
+
+    return False
+
+
+def _produce(
+    source: Callable[[], Iterator[Any]], buffer: Any, stop: Any, ready: Any
+) -> None:
+    items = source()
+
+    try:
+        for item in items:
+            if not _put(buffer, item, stop, ready):
+                # Closed by the consumer : the source is closed here, in the
+                # thread or process that has been iterating over it.
+                if hasattr(items, "close"):
+                    items.close()
+                return
+    except BaseException as e:
+        _put(buffer, _Error(e), stop, ready)
+    else:
+        _put(buffer, _End(), stop, ready)
+
+
+class BackgroundIterator(Generic[T]):
+    def __init__(
+        self,
+        source: Callable[[], Iterator[T]],
+        maxsize: int = 1,
+        process: bool = False,
+        ready: Any = None,
+    ) -> None:
+        self.finished = False
+        worker: Any
+
+        if process:
+            self.buffer: Any = multiprocessing.Queue(maxsize)
+            self.stop: Any = multiprocessing.Event()
+            worker = multiprocessing.Process
+        else:
+            self.buffer = queue.Queue(maxsize)
+            self.stop = threading.Event()
+            worker = threading.Thread
+
+        self.worker = worker(
+            target=_produce,
+            args=(source, self.buffer, self.stop, ready),
+            daemon=True,
+        )
+        self.worker.start()
+
+    def next(self, timeout: Optional[float] = None) -> T:
+        if self.finished:
+            raise StopIteration
+
+        item = self.buffer.get(timeout=timeout)
+
+        if isinstance(item, _End):
+            self.finished = True
+            raise StopIteration
+        if isinstance(item, _Error):
+            self.finished = True
+            raise item.exception
+
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        return self.next()
+
+    def close(self) -> None:
+        self.stop.set()
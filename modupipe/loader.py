@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, TypeVar
+from time import monotonic
+from typing import Any, Callable, Generic, List, Optional, Tuple, Type, TypeVar
 
-from modupipe.base import Condition
-from modupipe.queue import Queue, QueuePutStrategy
+from modupipe.base import Backoff, Condition, Failure, retry
+from modupipe.partition import Partitions
+from modupipe.queue import PutBlocking, Queue, QueuePutStrategy
 
 Input = TypeVar("Input")
 Output = TypeVar("Output")
@@ -16,6 +19,11 @@ class Loader(ABC, Generic[Input, Output]):
     def load(self, item: Input) -> Output:
         pass
 
+    # Called once at end of stream, for loaders holding pending items. The
+    # returned value, if any, is an output made out of those items.
+    def flush(self) -> Optional[Output]:
+        return None
+
     def __add__(self, next: Loader[Output, NextOutput]) -> Loader[Input, NextOutput]:
         return ChainedLoader(self, next)
 
@@ -35,6 +43,19 @@ class ChainedLoader(Loader[Input, NextOutput], Generic[Input, Output, NextOutput
         mapped_item = self.mapper.load(item)
         return self.next.load(mapped_item)
 
+    def flush(self) -> Optional[NextOutput]:
+        output = None
+
+        flushed_item = self.mapper.flush()
+        if flushed_item is not None:
+            output = self.next.load(flushed_item)
+
+        flushed_output = self.next.flush()
+        if flushed_output is not None:
+            output = flushed_output
+
+        return output
+
 
 class OnCondition(Loader[Input, Optional[Output]]):
     def __init__(
@@ -49,6 +70,9 @@ class OnCondition(Loader[Input, Optional[Output]]):
         else:
             return None
 
+    def flush(self) -> Optional[Output]:
+        return self.loader.flush()
+
 
 class LoaderList(Loader[Input, List[Output]]):
     def __init__(self, loaders: List[Loader[Input, Output]]) -> None:
@@ -57,6 +81,9 @@ class LoaderList(Loader[Input, List[Output]]):
     def load(self, item: Input) -> List[Output]:
         return [loader.load(item) for loader in self.loaders]
 
+    def flush(self) -> Optional[List[Output]]:
+        return _flush_all(self.loaders)
+
 
 class LoaderListUntyped(Loader[Input, List[Any]]):
     def __init__(self, loaders: List[Loader[Input, Any]]) -> None:
@@ -65,6 +92,9 @@ class LoaderListUntyped(Loader[Input, List[Any]]):
     def load(self, item: Input) -> List[Any]:
         return [loader.load(item) for loader in self.loaders]
 
+    def flush(self) -> Optional[List[Any]]:
+        return _flush_all(self.loaders)
+
 
 class ToString(Loader[Input, str]):
     def load(self, item: Input) -> str:
@@ -92,12 +122,158 @@ class Buffer(Loader[Input, Optional[List[Input]]]):
         else:
             return None
 
+    def flush(self) -> Optional[List[Input]]:
+        if not self.buffer:
+            return None
+
+        items = self.buffer
+        self.buffer = []
+        return items
+
+
+class BoundedBuffer(Loader[Input, Optional[List[Input]]]):
+    def __init__(
+        self,
+        size: int,
+        max_wait: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Input], int] = sys.getsizeof,
+    ) -> None:
+        self.size = size
+        self.max_wait = max_wait
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.buffer: List[Input] = []
+        self.nb_bytes = 0
+        self.deadline: Optional[float] = None
+
+    def load(self, item: Input) -> Optional[List[Input]]:
+        if not self.buffer and self.max_wait is not None:
+            self.deadline = monotonic() + self.max_wait
+
+        self.buffer.append(item)
+        if self.max_bytes is not None:
+            self.nb_bytes += self.sizeof(item)
+
+        if self._is_full():
+            return self.flush()
+        else:
+            return None
+
+    def flush(self) -> Optional[List[Input]]:
+        if not self.buffer:
+            return None
+
+        items = self.buffer
+        self.buffer, self.nb_bytes, self.deadline = [], 0, None
+        return items
+
+    def _is_full(self) -> bool:
+        if len(self.buffer) >= self.size:
+            return True
+        if self.max_bytes is not None and self.nb_bytes >= self.max_bytes:
+            return True
+
+        return self.deadline is not None and monotonic() >= self.deadline
+
 
 class PutToQueue(IdentityLoader[Input]):
-    def __init__(self, queue: Queue[Input], strategy: QueuePutStrategy) -> None:
+    def __init__(
+        self, queue: Queue[Input], strategy: QueuePutStrategy, close: bool = False
+    ) -> None:
         self.queue = queue
         self.strategy = strategy
+        self.close = close
+        self.closed = False
 
     def load(self, item: Input) -> Input:
         self.strategy.put(self.queue, item)
         return item
+
+    def flush(self) -> None:
+        self.strategy.flush(self.queue)
+
+        if self.close and not self.closed:
+            self.queue.close()
+            self.closed = True
+
+
+class PutToPartition(IdentityLoader[Input]):
+    def __init__(
+        self,
+        queues: List[Queue[Input]],
+        key: Callable[[Input], Any],
+        strategy: Callable[[], QueuePutStrategy[Input]] = PutBlocking,
+        close: bool = False,
+        replicas: int = 100,
+    ) -> None:
+        self.partitions = Partitions(queues, key, strategy, replicas)
+        self.close = close
+        self.closed = False
+
+    def add(self, queue: Queue[Input]) -> int:
+        return self.partitions.add(queue)
+
+    def load(self, item: Input) -> Input:
+        self.partitions.put(item)
+        return item
+
+    def flush(self) -> None:
+        self.partitions.flush()
+
+        if self.close and not self.closed:
+            self.partitions.close()
+            self.closed = True
+
+
+class Retry(Loader[Input, Optional[Output]]):
+    def __init__(
+        self,
+        loader: Loader[Input, Output],
+        nb_times: int = 3,
+        backoff: Backoff = Backoff(),
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        on_failure: Optional[Loader[Failure[Input], Any]] = None,
+    ) -> None:
+        self.loader = loader
+        self.nb_times = nb_times
+        self.backoff = backoff
+        self.exceptions = exceptions
+        self.on_failure = on_failure
+        self.nb_failures = 0
+
+    def load(self, item: Input) -> Optional[Output]:
+        try:
+            return retry(
+                self.loader.load, item, self.nb_times, self.backoff, self.exceptions
+            )
+        except self.exceptions as e:
+            if self.on_failure is None:
+                raise
+
+            self.nb_failures += 1
+            self.on_failure.load(Failure(item, e))
+            return None
+
+    def flush(self) -> Optional[Output]:
+        output = retry(
+            lambda _: self.loader.flush(),
+            None,
+            self.nb_times,
+            self.backoff,
+            self.exceptions,
+        )
+
+        if self.on_failure is not None:
+            self.on_failure.flush()
+
+        return output
+
+
+def _flush_all(loaders: List[Loader[Input, Any]]) -> Optional[List[Any]]:
+    flushed = [loader.flush() for loader in loaders]
+
+    if all(output is None for output in flushed):
+        return None
+
+    return flushed
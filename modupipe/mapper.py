@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+import os
+import queue
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Iterator, List, TypeVar
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from modupipe.base import Condition
+from modupipe.base import Backoff, Condition, Failure, retry
+from modupipe.iterators import BackgroundIterator
 from modupipe.loader import Loader
-from modupipe.queue import Queue, QueuePutStrategy
+from modupipe.partition import Partitions
+from modupipe.queue import PutBlocking, Queue, QueuePutStrategy
 
 Input = TypeVar("Input")
 Output = TypeVar("Output")
@@ -72,17 +98,123 @@ class Buffer(Mapper[Input, List[Input]]):
                 yield self.buffer
                 self.buffer = []
 
+        if self.buffer:
+            yield self.buffer
+            self.buffer = []
+
+
+class BoundedBuffer(Mapper[Input, List[Input]]):
+    def __init__(
+        self,
+        size: int,
+        max_wait: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Input], int] = sys.getsizeof,
+    ) -> None:
+        self.size = size
+        self.max_wait = max_wait
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+    def map(self, items: Iterator[Input]) -> Iterator[List[Input]]:
+        # With max_wait, the upstream stages are iterated on a background
+        # thread, so that a pending batch can be emitted while they block.
+        source: Optional[BackgroundIterator[Input]] = None
+        if self.max_wait is not None:
+            source = BackgroundIterator(lambda: items, maxsize=self.size)
+
+        buffer: List[Input] = []
+        nb_bytes = 0
+        deadline: Optional[float] = None
+
+        try:
+            while True:
+                try:
+                    if source is None:
+                        item = next(items)
+                    elif deadline is None:
+                        item = source.next()
+                    else:
+                        item = source.next(timeout=max(0, deadline - monotonic()))
+                except queue.Empty:
+                    yield buffer
+                    buffer, nb_bytes, deadline = [], 0, None
+                    continue
+                except StopIteration:
+                    break
+
+                if not buffer and self.max_wait is not None:
+                    deadline = monotonic() + self.max_wait
+
+                buffer.append(item)
+                if self.max_bytes is not None:
+                    nb_bytes += self.sizeof(item)
+
+                if self._is_full(buffer, nb_bytes, deadline):
+                    yield buffer
+                    buffer, nb_bytes, deadline = [], 0, None
+
+            if buffer:
+                yield buffer
+        finally:
+            if source is not None:
+                source.close()
+
+    def _is_full(
+        self, buffer: List[Input], nb_bytes: int, deadline: Optional[float]
+    ) -> bool:
+        if len(buffer) >= self.size:
+            return True
+        if self.max_bytes is not None and nb_bytes >= self.max_bytes:
+            return True
+
+        return deadline is not None and monotonic() >= deadline
+
 
 class PutToQueue(IdentityMapper[Input]):
-    def __init__(self, queue: Queue[Input], strategy: QueuePutStrategy) -> None:
+    def __init__(
+        self, queue: Queue[Input], strategy: QueuePutStrategy, close: bool = False
+    ) -> None:
         self.queue = queue
         self.strategy = strategy
+        self.close = close
 
     def map(self, items: Iterator[Input]) -> Iterator[Input]:
         for item in items:
             self.strategy.put(self.queue, item)
             yield item
 
+        self.strategy.flush(self.queue)
+
+        if self.close:
+            self.queue.close()
+
+
+class PutToPartition(IdentityMapper[Input]):
+    def __init__(
+        self,
+        queues: List[Queue[Input]],
+        key: Callable[[Input], Any],
+        strategy: Callable[[], QueuePutStrategy[Input]] = PutBlocking,
+        close: bool = False,
+        replicas: int = 100,
+    ) -> None:
+        self.partitions = Partitions(queues, key, strategy, replicas)
+        self.close = close
+
+    def add(self, queue: Queue[Input]) -> int:
+        return self.partitions.add(queue)
+
+    def map(self, items: Iterator[Input]) -> Iterator[Input]:
+        for item in items:
+            self.partitions.put(item)
+            yield item
+
+        self.partitions.flush()
+
+        if self.close:
+            self.partitions.close()
+
 
 class PushTo(IdentityMapper[Input]):
     def __init__(self, loader: Loader[Input, Any]) -> None:
@@ -93,6 +225,8 @@ class PushTo(IdentityMapper[Input]):
             self.loader.load(item)
             yield item
 
+        self.loader.flush()
+
 
 class PushToAndMap(Mapper[Input, Output]):
     def __init__(self, loader: Loader[Input, Output]) -> None:
@@ -101,3 +235,255 @@ class PushToAndMap(Mapper[Input, Output]):
     def map(self, items: Iterator[Input]) -> Iterator[Output]:
         for item in items:
             yield self.loader.load(item)
+
+        flushed = self.loader.flush()
+        if flushed is not None:
+            yield flushed
+
+
+class MapItem(Loader[Input, List[Output]]):
+    def __init__(self, mapper: Mapper[Input, Output]) -> None:
+        self.mapper = mapper
+
+    def load(self, item: Input) -> List[Output]:
+        return list(self.mapper.map(iter([item])))
+
+
+class Retry(Mapper[Input, Output]):
+    # Each item goes through its own run of `mapper`, which must therefore map
+    # items independently of each other.
+    def __init__(
+        self,
+        mapper: Mapper[Input, Output],
+        nb_times: int = 3,
+        backoff: Backoff = Backoff(),
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        on_failure: Optional[Loader[Failure[Input], Any]] = None,
+    ) -> None:
+        self.mapper = mapper
+        self.nb_times = nb_times
+        self.backoff = backoff
+        self.exceptions = exceptions
+        self.on_failure = on_failure
+        self.nb_failures = 0
+
+    def map(self, items: Iterator[Input]) -> Iterator[Output]:
+        for item in items:
+            try:
+                outputs = retry(
+                    MapItem(self.mapper).load,
+                    item,
+                    self.nb_times,
+                    self.backoff,
+                    self.exceptions,
+                )
+            except self.exceptions as e:
+                if self.on_failure is None:
+                    raise
+
+                self.nb_failures += 1
+                self.on_failure.load(Failure(item, e))
+                continue
+
+            yield from outputs
+
+        if self.on_failure is not None:
+            self.on_failure.flush()
+
+
+class ConcurrentPushTo(IdentityMapper[Input]):
+    def __init__(
+        self,
+        loader: Loader[Input, Any],
+        workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        on_failure: Optional[Loader[Failure[Input], Any]] = None,
+    ) -> None:
+        self.loader = loader
+        self.workers = workers
+        self.max_in_flight = max_in_flight or workers
+        self.ordered = ordered
+        self.on_failure = on_failure
+
+    def map(self, items: Iterator[Input]) -> Iterator[Input]:
+        loaded = _load_concurrently(
+            self.loader,
+            items,
+            self.workers,
+            self.max_in_flight,
+            self.ordered,
+            self.on_failure,
+        )
+        for item, _ in loaded:
+            yield item
+
+        self.loader.flush()
+
+
+class ConcurrentPushToAndMap(Mapper[Input, Output]):
+    def __init__(
+        self,
+        loader: Loader[Input, Output],
+        workers: int = 8,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        on_failure: Optional[Loader[Failure[Input], Any]] = None,
+    ) -> None:
+        self.loader = loader
+        self.workers = workers
+        self.max_in_flight = max_in_flight or workers
+        self.ordered = ordered
+        self.on_failure = on_failure
+
+    def map(self, items: Iterator[Input]) -> Iterator[Output]:
+        loaded = _load_concurrently(
+            self.loader,
+            items,
+            self.workers,
+            self.max_in_flight,
+            self.ordered,
+            self.on_failure,
+        )
+        for _, output in loaded:
+            yield output
+
+        flushed = self.loader.flush()
+        if flushed is not None:
+            yield flushed
+
+
+class ParallelMap(Mapper[Input, Output]):
+    def __init__(
+        self,
+        stage: Union[Mapper[Input, Output], Loader[Input, Output]],
+        workers: Optional[int] = None,
+        chunk_size: int = 1,
+        ordered: bool = True,
+    ) -> None:
+        self.stage = stage
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+
+    def map(self, items: Iterator[Input]) -> Iterator[Output]:
+        task = _task_for(self.stage)
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_set_worker_task,
+            initargs=(task,),
+        ) as executor:
+            futures = _submit_bounded(
+                executor,
+                _run_worker_task,
+                _chunks(items, self.chunk_size),
+                max_pending=2 * self.workers,
+                ordered=self.ordered,
+            )
+            for _, future in futures:
+                yield from future.result()
+
+
+_worker_task: Optional[Callable[[List[Any]], List[Any]]] = None
+
+
+def _set_worker_task(task: Callable[[List[Any]], List[Any]]) -> None:
+    global _worker_task
+    _worker_task = task
+
+
+def _run_worker_task(chunk: List[Any]) -> List[Any]:
+    assert _worker_task is not None
+    return _worker_task(chunk)
+
+
+class _LoadChunk(Generic[Input, Output]):
+    def __init__(self, loader: Loader[Input, Output]) -> None:
+        self.loader = loader
+
+    def __call__(self, chunk: List[Input]) -> List[Output]:
+        return [self.loader.load(item) for item in chunk]
+
+
+class _MapChunk(Generic[Input, Output]):
+    def __init__(self, mapper: Mapper[Input, Output]) -> None:
+        self.mapper = mapper
+
+    def __call__(self, chunk: List[Input]) -> List[Output]:
+        return list(self.mapper.map(iter(chunk)))
+
+
+def _task_for(
+    stage: Union[Mapper[Input, Output], Loader[Input, Output]],
+) -> Callable[[List[Input]], List[Output]]:
+    if isinstance(stage, Loader):
+        return _LoadChunk(stage)
+    else:
+        return _MapChunk(stage)
+
+
+def _load_concurrently(
+    loader: Loader[Input, Output],
+    items: Iterator[Input],
+    workers: int,
+    max_in_flight: int,
+    ordered: bool,
+    on_failure: Optional[Loader[Failure[Input], Any]],
+) -> Iterator[Tuple[Input, Output]]:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = _submit_bounded(executor, loader.load, items, max_in_flight, ordered)
+        for item, future in futures:
+            try:
+                output = future.result()
+            except Exception as e:
+                if on_failure is None:
+                    raise e
+                on_failure.load(Failure(item, e))
+            else:
+                yield item, output
+
+
+def _chunks(items: Iterator[Input], size: int) -> Iterator[List[Input]]:
+    chunk: List[Input] = []
+
+    for item in items:
+        chunk.append(item)
+
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _submit_bounded(
+    executor: Executor,
+    task: Callable[[Input], Output],
+    args: Iterator[Input],
+    max_pending: int,
+    ordered: bool,
+) -> Iterator[Tuple[Input, Future]]:
+    pending: Dict[Future, Input] = {}
+
+    for arg in args:
+        pending[executor.submit(task, arg)] = arg
+
+        if len(pending) >= max_pending:
+            yield from _pop_completed(pending, ordered)
+
+    while pending:
+        yield from _pop_completed(pending, ordered)
+
+
+def _pop_completed(
+    pending: Dict[Future, Input], ordered: bool
+) -> List[Tuple[Input, Future]]:
+    if ordered:
+        future = next(iter(pending))
+        return [(pending.pop(future), future)]
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+    return [(pending.pop(future), future) for future in done]
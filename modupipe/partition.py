@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from bisect import bisect
+from hashlib import blake2b
+from typing import Any, Callable, Generic, Iterable, List, TypeVar
+
+from modupipe.queue import PutBlocking, Queue, QueuePutStrategy
+
+T = TypeVar("T")
+
+
+# Python's hash() of str and bytes is salted per process, so partitions would
+# differ between the producer and a restarted one. blake2b is stable.
+def stable_hash(key: Any) -> int:
+    data = key if isinstance(key, bytes) else str(key).encode()
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "big")
+
+
+class HashRing:
+    # Each node is placed `replicas` times on the ring, so that keys spread
+    # evenly and adding a node only moves about 1/N of them to it.
+    def __init__(
+        self,
+        nodes: Iterable[int] = (),
+        replicas: int = 100,
+        hash_function: Callable[[Any], int] = stable_hash,
+    ) -> None:
+        self.replicas = replicas
+        self.hash_function = hash_function
+        self.nodes: List[int] = []
+        self.points: List[int] = []
+        self.owners: List[int] = []
+
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(self, node: int) -> None:
+        if node in self.nodes:
+            raise ValueError(f"Node {node} is already in the ring.")
+
+        self.nodes.append(node)
+        for replica in range(self.replicas):
+            point = self.hash_function(f"{node}-{replica}")
+            index = bisect(self.points, point)
+            self.points.insert(index, point)
+            self.owners.insert(index, node)
+
+    def remove(self, node: int) -> None:
+        self.nodes.remove(node)
+        kept = [
+            (point, owner)
+            for point, owner in zip(self.points, self.owners)
+            if owner != node
+        ]
+        self.points = [point for point, _ in kept]
+        self.owners = [owner for _, owner in kept]
+
+    def node_for(self, key: Any) -> int:
+        if not self.points:
+            raise LookupError("The ring has no nodes.")
+
+        index = bisect(self.points, self.hash_function(key))
+        if index == len(self.points):
+            index = 0
+
+        return self.owners[index]
+
+
+class Partitions(Generic[T]):
+    # Routes each item to the queue of the partition of its key, so that all
+    # the items of a key go through the same queue, in order. Each queue has
+    # its own put strategy, created by calling `strategy`.
+    def __init__(
+        self,
+        queues: Iterable[Queue[T]],
+        key: Callable[[T], Any],
+        strategy: Callable[[], QueuePutStrategy[T]] = PutBlocking,
+        replicas: int = 100,
+    ) -> None:
+        self.key = key
+        self.strategy = strategy
+        self.ring = HashRing(replicas=replicas)
+        self.queues: List[Queue[T]] = []
+        self.strategies: List[QueuePutStrategy[T]] = []
+
+        for queue in queues:
+            self.add(queue)
+
+    def __len__(self) -> int:
+        return len(self.queues)
+
+    # Only the keys moving to the new partition change of queue.
+    def add(self, queue: Queue[T]) -> int:
+        partition = len(self.queues)
+        self.ring.add(partition)
+        self.queues.append(queue)
+        self.strategies.append(self.strategy())
+
+        return partition
+
+    def partition_for(self, item: T) -> int:
+        return self.ring.node_for(self.key(item))
+
+    def put(self, item: T) -> None:
+        partition = self.ring.node_for(self.key(item))
+        self.strategies[partition].put(self.queues[partition], item)
+
+    def flush(self) -> None:
+        for queue, strategy in zip(self.queues, self.strategies):
+            strategy.flush(queue)
+
+    def close(self) -> None:
+        for queue in self.queues:
+            queue.close()
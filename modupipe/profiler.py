@@ -0,0 +1,188 @@
+from time import perf_counter
+from typing import Any, Iterator, List, Optional, TypeVar
+
+from modupipe.extractor import Extractor, MappedExtractor
+from modupipe.loader import ChainedLoader, Loader
+from modupipe.mapper import ChainedMapper, Mapper, PushTo, PushToAndMap
+
+Input = TypeVar("Input")
+Output = TypeVar("Output")
+
+
+class StageStats:
+    def __init__(self, name: str, depth: int = 0) -> None:
+        self.name = name
+        self.depth = depth
+        self.items_in = 0
+        self.items_out = 0
+        self.total_time = 0.0
+        self.children_time = 0.0
+
+    @property
+    def own_time(self) -> float:
+        return self.total_time - self.children_time
+
+    @property
+    def throughput(self) -> float:
+        if self.own_time <= 0:
+            return 0.0
+
+        return self.items_out / self.own_time
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.stages: List[StageStats] = []
+        self._stack: List[StageStats] = []
+
+    def instrument(self, extractor: Extractor[Any]) -> Extractor[Any]:
+        if isinstance(extractor, MappedExtractor):
+            return MappedExtractor(
+                self.instrument(extractor.extractor),
+                self._instrument_mapper(extractor.mapper),
+            )
+
+        return ProfiledExtractor(extractor, self, self._add_stage(extractor))
+
+    def _instrument_mapper(self, mapper: Mapper[Any, Any]) -> Mapper[Any, Any]:
+        if isinstance(mapper, ChainedMapper):
+            return ChainedMapper(
+                self._instrument_mapper(mapper.mapper),
+                self._instrument_mapper(mapper.next),
+            )
+
+        stats = self._add_stage(mapper)
+
+        if type(mapper) is PushTo:
+            mapper = PushTo(self._instrument_loader(mapper.loader, depth=1))
+        elif type(mapper) is PushToAndMap:
+            mapper = PushToAndMap(self._instrument_loader(mapper.loader, depth=1))
+
+        return ProfiledMapper(mapper, self, stats)
+
+    def _instrument_loader(
+        self, loader: Loader[Any, Any], depth: int
+    ) -> Loader[Any, Any]:
+        if isinstance(loader, ChainedLoader):
+            return ChainedLoader(
+                self._instrument_loader(loader.mapper, depth),
+                self._instrument_loader(loader.next, depth),
+            )
+
+        return ProfiledLoader(loader, self, self._add_stage(loader, depth))
+
+    def _add_stage(self, stage: Any, depth: int = 0) -> StageStats:
+        stats = StageStats(stage.__class__.__name__, depth)
+        self.stages.append(stats)
+        return stats
+
+    def begin(self, stats: StageStats) -> float:
+        self._stack.append(stats)
+        return perf_counter()
+
+    def end(self, stats: StageStats, started: float) -> None:
+        elapsed = perf_counter() - started
+        self._stack.pop()
+        stats.total_time += elapsed
+
+        if self._stack:
+            self._stack[-1].children_time += elapsed
+
+    def report(self) -> str:
+        total_time = sum(stats.own_time for stats in self.stages) or 1.0
+        lines = [
+            f"{'Stage':<30} {'In':>10} {'Out':>10} {'Own (s)':>10} {'Own %':>7} {'Out/s':>12}"
+        ]
+
+        for stats in self.stages:
+            name = "  " * stats.depth + stats.name
+            lines.append(
+                f"{name:<30} {stats.items_in:>10} {stats.items_out:>10}"
+                f" {stats.own_time:>10.4f} {100 * stats.own_time / total_time:>6.1f}%"
+                f" {stats.throughput:>12.1f}"
+            )
+
+        return "\n".join(lines)
+
+    def print_report(self) -> None:
+        print(self.report())
+
+
+class ProfiledExtractor(Extractor[Output]):
+    def __init__(
+        self, extractor: Extractor[Output], profiler: Profiler, stats: StageStats
+    ) -> None:
+        self.extractor = extractor
+        self.profiler = profiler
+        self.stats = stats
+
+    def extract(self) -> Iterator[Output]:
+        started = self.profiler.begin(self.stats)
+        try:
+            items = self.extractor.extract()
+        finally:
+            self.profiler.end(self.stats, started)
+
+        yield from _profiled(items, self.profiler, self.stats)
+
+
+class ProfiledMapper(Mapper[Input, Output]):
+    def __init__(
+        self, mapper: Mapper[Input, Output], profiler: Profiler, stats: StageStats
+    ) -> None:
+        self.mapper = mapper
+        self.profiler = profiler
+        self.stats = stats
+
+    def map(self, items: Iterator[Input]) -> Iterator[Output]:
+        started = self.profiler.begin(self.stats)
+        try:
+            mapped_items = self.mapper.map(self._count(items))
+        finally:
+            self.profiler.end(self.stats, started)
+
+        yield from _profiled(mapped_items, self.profiler, self.stats)
+
+    def _count(self, items: Iterator[Input]) -> Iterator[Input]:
+        for item in items:
+            self.stats.items_in += 1
+            yield item
+
+
+class ProfiledLoader(Loader[Input, Output]):
+    def __init__(
+        self, loader: Loader[Input, Output], profiler: Profiler, stats: StageStats
+    ) -> None:
+        self.loader = loader
+        self.profiler = profiler
+        self.stats = stats
+
+    def load(self, item: Input) -> Output:
+        self.stats.items_in += 1
+        started = self.profiler.begin(self.stats)
+        try:
+            output = self.loader.load(item)
+        finally:
+            self.profiler.end(self.stats, started)
+
+        self.stats.items_out += 1
+        return output
+
+    def flush(self) -> Optional[Output]:
+        return self.loader.flush()
+
+
+def _profiled(
+    items: Iterator[Output], profiler: Profiler, stats: StageStats
+) -> Iterator[Output]:
+    while True:
+        started = profiler.begin(stats)
+        try:
+            item = next(items)
+        except StopIteration:
+            return
+        finally:
+            profiler.end(stats, started)
+
+        stats.items_out += 1
+        yield item
@@ -1,40 +1,138 @@
 import multiprocessing
 import queue
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Union
+from collections import deque
+from queue import Empty, Full
+from random import Random
+from threading import Condition, Lock, Thread
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
+from modupipe.base import EndOfStream
+from modupipe.exceptions import QueueClosed
+from modupipe.ring_buffer import SharedMemoryRingBuffer
+from modupipe.serializer import Serializer
+
 T = TypeVar("T")
 
 
 class Queue(Generic[T]):
     def __init__(
         self,
-        queue: Union["queue.Queue[T]", "multiprocessing.Queue[T]"],
+        queue: Union[
+            "queue.Queue[T]", "multiprocessing.Queue[T]", SharedMemoryRingBuffer[T]
+        ],
         name: str = str(uuid4()),
+        producers: int = 1,
+        serializer: Optional[Serializer[T]] = None,
     ) -> None:
         self.queue = queue
         self._name = name
+        self.producers = producers
+        self.ended_producers = _counter_for(queue)
+        self.serializer = serializer
+        # Time spent by the serializer, in the current process.
+        self.nb_encoded = 0
+        self.encode_time = 0.0
+        self.nb_decoded = 0
+        self.decode_time = 0.0
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def closed(self) -> bool:
+        return self.ended_producers.value >= self.producers
+
     def get(self, *args, **kwargs) -> T:
-        return self.queue.get(*args, **kwargs)
+        while True:
+            item = self.queue.get(*args, **kwargs)
+
+            if not isinstance(item, EndOfStream):
+                if self.serializer is None:
+                    return item
+                return self._decode(self.serializer, item)
+
+            with self.ended_producers.get_lock():
+                self.ended_producers.value += 1
+                closed = self.ended_producers.value >= self.producers
+
+            if closed:
+                # Put the end marker back so that every other consumer stops too.
+                self.queue.put(item)
+                raise QueueClosed()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.queue.put(cast(T, EndOfStream()), block=True, timeout=timeout)
 
     def put(self, item: T, *args, **kwargs) -> None:
+        if self.serializer is not None:
+            item = self._encode(self.serializer, item)
+
         self.queue.put(item, *args, **kwargs)
 
     def __len__(self) -> int:
         return self.queue.qsize()
 
+    def _encode(self, serializer: Serializer[T], item: T) -> Any:
+        started = perf_counter()
+        data = serializer.dumps(item)
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self.encode_time += perf_counter() - started
+        self.nb_encoded += 1
+
+        return data
+
+    def _decode(self, serializer: Serializer[T], data: Any) -> T:
+        started = perf_counter()
+        item = serializer.loads(data)
+        self.decode_time += perf_counter() - started
+        self.nb_decoded += 1
+
+        return item
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.value = 0
+        self.lock = Lock()
+
+    def get_lock(self) -> Lock:
+        return self.lock
+
+
+# Only queues shared between processes need their count of ended producers
+# in shared memory.
+def _counter_for(backend: Any) -> Any:
+    if isinstance(backend, queue.Queue):
+        return _Counter()
+
+    return multiprocessing.Value("i", 0)
+
 
 class QueuePutStrategy(ABC, Generic[T]):
     @abstractmethod
     def put(self, queue: Queue[T], item: T):
         pass
 
+    def flush(self, queue: Queue[T]):
+        pass
+
 
 class PutBlocking(QueuePutStrategy[T]):
     def __init__(self, timeout: int = None) -> None:
@@ -49,6 +147,169 @@ class PutNonBlocking(QueuePutStrategy[T]):
         queue.put(item, block=False)
 
 
+class _Shedding(QueuePutStrategy[T]):
+    def __init__(self) -> None:
+        # Shared, so that drops made in a producer process are visible to
+        # the process that created the strategy.
+        self._dropped = multiprocessing.Value("L", 0)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped.value
+
+    def _drop(self) -> None:
+        with self._dropped.get_lock():
+            self._dropped.value += 1
+
+
+class PutDropNewest(_Shedding[T]):
+    def put(self, queue: Queue[T], item: T):
+        try:
+            queue.put(item, block=False)
+        except Full:
+            self._drop()
+
+
+class PutDropOldest(_Shedding[T]):
+    def put(self, queue: Queue[T], item: T):
+        while True:
+            try:
+                queue.put(item, block=False)
+                return
+            except Full:
+                pass
+
+            try:
+                oldest = queue.queue.get(block=False)
+            except Empty:
+                continue
+
+            self._drop()
+
+            # End markers of other producers are never dropped : the newest
+            # item is dropped instead.
+            if isinstance(oldest, EndOfStream):
+                queue.queue.put(oldest)
+                return
+
+
+class PutSampling(_Shedding[T]):
+    def __init__(
+        self, rate: float, threshold: int = 0, seed: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self.rate = rate
+        self.threshold = threshold
+        self.random = Random(seed)
+
+    def put(self, queue: Queue[T], item: T):
+        if len(queue) >= self.threshold and self.random.random() >= self.rate:
+            self._drop()
+            return
+
+        try:
+            queue.put(item, block=False)
+        except Full:
+            self._drop()
+
+
+class PutCoalesce(_Shedding[T]):
+    def __init__(self, key: Callable[[T], Hashable]) -> None:
+        super().__init__()
+        self.key = key
+        self.pending: Dict[Hashable, T] = {}
+
+    def put(self, queue: Queue[T], item: T):
+        key = self.key(item)
+        if key in self.pending:
+            self._drop()
+        self.pending[key] = item
+
+        while self.pending:
+            oldest_key, oldest = next(iter(self.pending.items()))
+            try:
+                queue.put(oldest, block=False)
+            except Full:
+                return
+            del self.pending[oldest_key]
+
+    def flush(self, queue: Queue[T]):
+        while self.pending:
+            oldest_key, oldest = next(iter(self.pending.items()))
+            queue.put(oldest, block=True)
+            del self.pending[oldest_key]
+
+
+class PutBatching(QueuePutStrategy[T]):
+    def __init__(
+        self,
+        size: int,
+        max_latency: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.size = size
+        self.max_latency = max_latency
+        self.timeout = timeout
+        self.frame: List[T] = []
+        self.deadline: Optional[float] = None
+        self.condition = Condition()
+        self.flusher: Optional[Thread] = None
+
+    def put(self, queue: Queue[T], item: T):
+        with self.condition:
+            self.frame.append(item)
+
+            if len(self.frame) >= self.size:
+                self._put_frame(queue)
+            elif self.max_latency is not None and self.deadline is None:
+                self.deadline = monotonic() + self.max_latency
+                self._start_flusher(queue)
+                self.condition.notify()
+
+    def flush(self, queue: Queue[T]):
+        with self.condition:
+            if self.frame:
+                self._put_frame(queue)
+
+    def _put_frame(self, queue: Queue[T]):
+        frame = self.frame
+        self.frame = []
+        self.deadline = None
+        queue.put(cast(Any, frame), block=True, timeout=self.timeout)
+
+    # A single flusher thread is started lazily and kept for the lifetime of
+    # the strategy, so that partial frames are put after max_latency without
+    # starting a new timer thread for every frame.
+    def _start_flusher(self, queue: Queue[T]):
+        if self.flusher is None:
+            self.flusher = Thread(target=self._flush_on_deadline, args=(queue,))
+            self.flusher.daemon = True
+            self.flusher.start()
+
+    def _flush_on_deadline(self, queue: Queue[T]):
+        with self.condition:
+            while True:
+                if self.deadline is None:
+                    self.condition.wait()
+                    continue
+
+                remaining = self.deadline - monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                else:
+                    self._put_frame(queue)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["condition"]
+        state["flusher"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.condition = Condition()
+
+
 class QueueGetStrategy(ABC, Generic[T]):
     @abstractmethod
     def get(self, queue: Queue[T]) -> T:
@@ -66,3 +327,16 @@ class GetBlocking(QueueGetStrategy[T]):
 class GetNonBlocking(QueueGetStrategy[T]):
     def get(self, queue: Queue[T]) -> T:
         return queue.get(block=False)
+
+
+class GetBatching(QueueGetStrategy[T]):
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self.timeout = timeout
+        self.items: Deque[T] = deque()
+
+    def get(self, queue: Queue[T]) -> T:
+        if not self.items:
+            frame = queue.get(block=True, timeout=self.timeout)
+            self.items.extend(cast(List[T], frame))
+
+        return self.items.popleft()
@@ -0,0 +1,140 @@
+import multiprocessing
+import queue
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Generic, List, Optional, TypeVar, cast
+
+from modupipe.base import EndOfStream
+from modupipe.serializer import BytesSerializer, Serializer
+
+T = TypeVar("T")
+
+_HEADER = struct.Struct("<I")
+_END_OF_STREAM = 0xFFFFFFFF
+# Set in the header of a slot holding a frame (a list put by PutBatching).
+_FRAME = 0x80000000
+
+
+class SharedMemoryRingBuffer(Generic[T]):
+    def __init__(
+        self,
+        slots: int,
+        slot_size: int,
+        serializer: Serializer[T] = BytesSerializer(),  # type: ignore
+    ) -> None:
+        self.slots = slots
+        self.slot_size = slot_size
+        self.serializer = serializer
+        self.memory = SharedMemory(create=True, size=slots * self._stride)
+        self.free_slots = multiprocessing.Semaphore(slots)
+        self.used_slots = multiprocessing.Semaphore(0)
+        self.put_lock = multiprocessing.Lock()
+        self.get_lock = multiprocessing.Lock()
+        self.written = multiprocessing.RawValue("Q", 0)
+        self.read = multiprocessing.RawValue("Q", 0)
+
+    @property
+    def _buffer(self) -> memoryview:
+        return cast(memoryview, self.memory.buf)
+
+    @property
+    def _stride(self) -> int:
+        return _HEADER.size + self.slot_size
+
+    # A frame is stored as its number of records, followed by the size and
+    # data of each record, so the serializer only ever sees single items.
+    def put(self, item: T, block: bool = True, timeout: Optional[float] = None):
+        records: List[memoryview] = []
+        if isinstance(item, EndOfStream):
+            size = 0
+            header = _END_OF_STREAM
+        elif isinstance(item, list):
+            records = [self._dump(record) for record in item]
+            size = _HEADER.size * (len(records) + 1) + sum(map(len, records))
+            header = _FRAME | size
+        else:
+            records = [self._dump(item)]
+            size = len(records[0])
+            header = size
+
+        if size > self.slot_size:
+            raise ValueError(
+                f"Item of {size} bytes does not fit in slots of {self.slot_size} bytes."
+            )
+
+        if not self.free_slots.acquire(block, timeout):
+            raise queue.Full
+
+        with self.put_lock:
+            offset = (self.written.value % self.slots) * self._stride
+            _HEADER.pack_into(self._buffer, offset, header)
+            position = offset + _HEADER.size
+
+            if isinstance(item, list):
+                _HEADER.pack_into(self._buffer, position, len(records))
+                position += _HEADER.size
+                for record in records:
+                    _HEADER.pack_into(self._buffer, position, len(record))
+                    position = self._write(position + _HEADER.size, record)
+            elif records:
+                self._write(position, records[0])
+
+            self.written.value += 1
+
+        self.used_slots.release()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        if not self.used_slots.acquire(block, timeout):
+            raise queue.Empty
+
+        with self.get_lock:
+            offset = (self.read.value % self.slots) * self._stride
+            (header,) = _HEADER.unpack_from(self._buffer, offset)
+            start = offset + _HEADER.size
+            if header == _END_OF_STREAM:
+                item: Any = EndOfStream()
+            elif header & _FRAME:
+                item = self._load_frame(start)
+            else:
+                item = self._load(start, header)
+            self.read.value += 1
+
+        self.free_slots.release()
+
+        return item
+
+    def _dump(self, item: T) -> memoryview:
+        return memoryview(self.serializer.dumps(item)).cast("B")
+
+    def _write(self, position: int, data: memoryview) -> int:
+        end = position + len(data)
+        self._buffer[position:end] = data
+
+        return end
+
+    def _load(self, start: int, size: int) -> T:
+        end = start + size
+        with self._buffer[start:end] as data:
+            return self.serializer.loads(data)
+
+    def _load_frame(self, start: int) -> List[T]:
+        (nb_records,) = _HEADER.unpack_from(self._buffer, start)
+        position = start + _HEADER.size
+
+        frame = []
+        for _ in range(nb_records):
+            (size,) = _HEADER.unpack_from(self._buffer, position)
+            position += _HEADER.size
+            frame.append(self._load(position, size))
+            position += size
+
+        return frame
+
+    def qsize(self) -> int:
+        return self.written.value - self.read.value
+
+    def close(self) -> None:
+        self.memory.close()
+
+    def unlink(self) -> None:
+        self.memory.unlink()
@@ -1,10 +1,27 @@
+import math
+import multiprocessing
+import os
+import threading
 import traceback
 from abc import ABC, abstractmethod
 from multiprocessing import Process
 from threading import Thread
-from typing import Generic, List, TypeVar
+from time import monotonic
+from typing import Any, Callable, Generic, List, Optional, TypeVar
 
-from modupipe.extractor import Extractor
+from modupipe.checkpoint import find_checkpointed
+from modupipe.extractor import Extractor, GetFromQueue
+from modupipe.fusion import fuse
+from modupipe.loader import Loader
+from modupipe.mapper import PushTo, PutToPartition, PutToQueue
+from modupipe.profiler import Profiler
+from modupipe.queue import (
+    GetBlocking,
+    PutBlocking,
+    Queue,
+    QueueGetStrategy,
+    QueuePutStrategy,
+)
 
 Data = TypeVar("Data")
 
@@ -16,23 +33,60 @@ class Runnable(ABC):
 
 
 class StepPipeline(Runnable, Generic[Data]):
-    def __init__(self, extractor: Extractor[Data]) -> None:
+    def __init__(
+        self, extractor: Extractor[Data], profiler: Optional[Profiler] = None
+    ) -> None:
+        if profiler is not None:
+            extractor = profiler.instrument(extractor)
+
         self.iterator = extractor.extract()
+        self.finished = False
+        # Shared value counting the items out of the pipeline, if set.
+        self.counter: Optional[Any] = None
 
     def run(self):
         try:
             next(self.iterator)
         except StopIteration:
-            pass
+            self.finished = True
+            return
+
+        if self.counter is not None:
+            self.counter.value += 1
 
 
 class FullPipeline(Runnable, Generic[Data]):
-    def __init__(self, extractor: Extractor[Data]) -> None:
+    def __init__(
+        self,
+        extractor: Extractor[Data],
+        profiler: Optional[Profiler] = None,
+        fused: bool = False,
+    ) -> None:
+        self.checkpoint = find_checkpointed(extractor)
+
+        if fused:
+            extractor = fuse(extractor)
+        if profiler is not None:
+            extractor = profiler.instrument(extractor)
+
         self.extractor = extractor
+        # Shared value counting the items out of the pipeline, if set.
+        self.counter: Optional[Any] = None
 
     def run(self):
+        if self.checkpoint is None and self.counter is None:
+            for _ in self.extractor.extract():
+                pass
+            return
+
         for _ in self.extractor.extract():
-            pass
+            if self.counter is not None:
+                self.counter.value += 1
+            if self.checkpoint is not None:
+                self.checkpoint.acknowledge()
+
+        if self.checkpoint is not None:
+            self.checkpoint.commit()
 
 
 class Repeat(Runnable, Generic[Data]):
@@ -62,11 +116,19 @@ class Retry(Runnable):
 
     def run(self):
         retries = 0
+        nb_commits = self._nb_commits()
 
         while True:
             try:
                 self.runnable.run()
+                return
             except Exception as e:
+                # A pipeline that committed progress since the last failure
+                # resumes from there, so it gets its retries back.
+                if self._nb_commits() != nb_commits:
+                    nb_commits = self._nb_commits()
+                    retries = 0
+
                 if retries >= self.max_retries:
                     raise e
                 else:
@@ -74,6 +136,14 @@ class Retry(Runnable):
                     print(traceback.format_exc())
                     retries += 1
 
+    def _nb_commits(self) -> int:
+        if not isinstance(self.runnable, FullPipeline):
+            return 0
+        if self.runnable.checkpoint is None:
+            return 0
+
+        return self.runnable.checkpoint.nb_commits
+
 
 class MultiThread(Runnable):
     def __init__(self, runnables: List[Runnable]) -> None:
@@ -103,3 +173,263 @@ class MultiProcess(Runnable):
 
         for process in self.processes:
             process.join()
+
+
+# Pipelines count the items they output in `processed`, other runnables
+# count their runs. The runnable is built once, so that the state of its
+# stages (e.g. a Buffer) lives as long as the worker : factories must get
+# from the queue without timeout, and rely on the queue being closed to end.
+def _work(
+    factory: Callable[[], Runnable], queue: Queue[Any], stop: Any, processed: Any
+) -> None:
+    runnable = factory()
+    counted = False
+    if isinstance(runnable, (StepPipeline, FullPipeline)):
+        runnable.counter = processed
+        counted = True
+
+    while not stop.is_set():
+        runnable.run()
+
+        if isinstance(runnable, StepPipeline):
+            if runnable.finished:
+                return
+        elif queue.closed:
+            return
+
+        if not counted:
+            processed.value += 1
+
+
+class WorkerPool(Runnable):
+    def __init__(
+        self,
+        factory: Callable[[], Runnable],
+        queue: Queue[Any],
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        backlog_per_worker: int = 100,
+        interval: float = 1.0,
+        process: bool = False,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        self.factory = factory
+        self.queue = queue
+        self.min_workers = min_workers
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backlog_per_worker = backlog_per_worker
+        self.interval = interval
+        self.process = process
+        self.shutdown_timeout = shutdown_timeout
+        self.workers: List[Any] = []
+        self.retired: List[Any] = []
+        self.stopped = threading.Event()
+        self.last_backlog = 0
+        self.last_processed = 0
+        self.last_scaled = monotonic()
+        self.throughput = 0.0
+
+    @property
+    def nb_workers(self) -> int:
+        return len(self.workers)
+
+    @property
+    def processed(self) -> int:
+        return sum(processed.value for _, _, processed in self.workers + self.retired)
+
+    def run(self) -> None:
+        self.stopped.clear()
+        self.last_scaled = monotonic()
+        for _ in range(self.min_workers):
+            self._add_worker()
+
+        try:
+            while not self.stopped.wait(self.interval):
+                if self.queue.closed and not self._has_alive_workers():
+                    break
+
+                self.scale()
+        finally:
+            self._shutdown()
+
+    def scale(self) -> None:
+        nb_dead = self._remove_dead_workers()
+        if not self.queue.closed:
+            for _ in range(min(nb_dead, self.min_workers - self.nb_workers)):
+                self._add_worker()
+
+        now = monotonic()
+        backlog = len(self.queue)
+        processed = self.processed
+        elapsed = now - self.last_scaled
+        if elapsed > 0:
+            self.throughput = (processed - self.last_processed) / elapsed
+
+        wanted = max(
+            math.ceil(backlog / self.backlog_per_worker), self._wanted_to_drain(backlog)
+        )
+        wanted = max(self.min_workers, min(self.max_workers, wanted))
+
+        can_grow = backlog >= self.last_backlog and not self.queue.closed
+
+        if wanted > self.nb_workers and can_grow:
+            self._add_worker()
+        elif wanted < self.nb_workers and backlog <= self.last_backlog:
+            self._retire_worker()
+
+        self.last_backlog = backlog
+        self.last_processed = processed
+        self.last_scaled = now
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def _has_alive_workers(self) -> bool:
+        return any(worker.is_alive() for worker, _, _ in self.workers)
+
+    # A worker whose runnable raised has stopped. It is kept with the retired
+    # workers for its count of processed items.
+    def _remove_dead_workers(self) -> int:
+        dead = [worker for worker in self.workers if not worker[0].is_alive()]
+        self.workers = [worker for worker in self.workers if worker not in dead]
+        self.retired.extend(dead)
+
+        return len(dead)
+
+    # Number of workers needed to drain the backlog within one interval, at
+    # the throughput measured for each worker since the last scaling.
+    def _wanted_to_drain(self, backlog: int) -> int:
+        if self.throughput <= 0 or not self.nb_workers:
+            return 0
+
+        per_worker = self.throughput / self.nb_workers
+        return math.ceil(backlog / (per_worker * self.interval))
+
+    def _add_worker(self) -> None:
+        stop: Any
+        worker: Any
+        processed = multiprocessing.RawValue("Q", 0)
+
+        if self.process:
+            stop = multiprocessing.Event()
+            worker = Process(
+                target=_work,
+                args=(self.factory, self.queue, stop, processed),
+                daemon=True,
+            )
+        else:
+            stop = threading.Event()
+            worker = Thread(
+                target=_work,
+                args=(self.factory, self.queue, stop, processed),
+                daemon=True,
+            )
+
+        worker.start()
+        self.workers.append((worker, stop, processed))
+
+    def _retire_worker(self) -> None:
+        worker, stop, processed = self.workers.pop()
+        stop.set()
+        self.retired.append((worker, stop, processed))
+
+    # Workers only see their stop event between two runs. One blocked on a
+    # get without timeout is left behind as a daemon thread, or terminated
+    # when it is a process, once shutdown_timeout has elapsed.
+    def _shutdown(self) -> None:
+        for _, stop, _ in self.workers:
+            stop.set()
+
+        deadline = monotonic() + self.shutdown_timeout
+        for worker, _, _ in self.workers + self.retired:
+            worker.join(max(0, deadline - monotonic()))
+            if self.process and worker.is_alive():
+                worker.terminate()
+
+        self.workers, self.retired = [], self.workers + self.retired
+
+
+class Branch(Generic[Data]):
+    def __init__(
+        self,
+        loader: Loader[Data, Any],
+        queue_size: int = 0,
+        strategy: Optional[QueuePutStrategy[Data]] = None,
+        get_strategy: Optional[QueueGetStrategy[Data]] = None,
+    ) -> None:
+        self.loader = loader
+        self.queue_size = queue_size
+        self.strategy = strategy or PutBlocking()
+        # Must match `strategy`, e.g. GetBatching for PutBatching.
+        self.get_strategy = get_strategy or GetBlocking()
+
+
+class FanOut(Runnable, Generic[Data]):
+    def __init__(
+        self, extractor: Extractor[Data], branches: List[Branch[Data]]
+    ) -> None:
+        self.branches = branches
+        self.queues = [
+            Queue[Data](
+                multiprocessing.Queue(branch.queue_size),
+                name=f"{i}-{branch.loader.__class__.__name__}",
+            )
+            for i, branch in enumerate(branches)
+        ]
+
+        for branch, queue in zip(branches, self.queues):
+            extractor = extractor + PutToQueue(queue, branch.strategy, close=True)
+
+        self.producer = FullPipeline(extractor)
+        self.consumers = [
+            FullPipeline(
+                GetFromQueue(queue, branch.get_strategy) + PushTo(branch.loader)
+            )
+            for branch, queue in zip(branches, self.queues)
+        ]
+
+    def queue_sizes(self) -> List[int]:
+        return [len(queue) for queue in self.queues]
+
+    def drop_counts(self) -> List[int]:
+        return [getattr(branch.strategy, "dropped", 0) for branch in self.branches]
+
+    def run(self) -> None:
+        MultiProcess([self.producer, *self.consumers]).run()
+
+
+# One consumer pipeline per loader, which gets all the items of the keys of
+# its partition, in order, so per-key state needs no sharing between them.
+class Partitioned(Runnable, Generic[Data]):
+    def __init__(
+        self,
+        extractor: Extractor[Data],
+        key: Callable[[Data], Any],
+        loaders: List[Loader[Data, Any]],
+        queue_size: int = 0,
+        strategy: Callable[[], QueuePutStrategy[Data]] = PutBlocking,
+        get_strategy: Callable[[], QueueGetStrategy[Data]] = GetBlocking,
+        replicas: int = 100,
+    ) -> None:
+        self.loaders = loaders
+        self.queues = [
+            Queue[Data](multiprocessing.Queue(queue_size), name=f"partition-{i}")
+            for i in range(len(loaders))
+        ]
+        self.router = PutToPartition(self.queues, key, strategy, True, replicas)
+
+        self.producer = FullPipeline(extractor + self.router)
+        self.consumers = [
+            FullPipeline(GetFromQueue(queue, get_strategy()) + PushTo(loader))
+            for loader, queue in zip(loaders, self.queues)
+        ]
+
+    def queue_sizes(self) -> List[int]:
+        return [len(queue) for queue in self.queues]
+
+    def drop_counts(self) -> List[int]:
+        strategies = self.router.partitions.strategies
+        return [getattr(strategy, "dropped", 0) for strategy in strategies]
+
+    def run(self) -> None:
+        MultiProcess([self.producer, *self.consumers]).run()
@@ -0,0 +1,102 @@
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Generic, List, Optional, Tuple, TypeVar, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+T = TypeVar("T")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class Serializer(ABC, Generic[T]):
+    @abstractmethod
+    def dumps(self, item: T) -> Buffer:
+        pass
+
+    # `data` may be a view on memory that is reused afterwards, so it must not
+    # be referenced by the returned item.
+    @abstractmethod
+    def loads(self, data: Buffer) -> T:
+        pass
+
+
+class BytesSerializer(Serializer[bytes]):
+    def dumps(self, item: bytes) -> Buffer:
+        return item
+
+    def loads(self, data: Buffer) -> bytes:
+        return bytes(data)
+
+
+class StructSerializer(Serializer[Tuple[Any, ...]]):
+    def __init__(self, format: str) -> None:
+        self.struct = struct.Struct(format)
+
+    def dumps(self, item: Tuple[Any, ...]) -> Buffer:
+        return self.struct.pack(*item)
+
+    def loads(self, data: Buffer) -> Tuple[Any, ...]:
+        return self.struct.unpack_from(data)
+
+
+class ArraySerializer(Serializer[Any]):
+    def __init__(self, dtype: Any, shape: Optional[Tuple[int, ...]] = None) -> None:
+        if numpy is None:
+            raise ImportError("ArraySerializer requires numpy to be installed.")
+
+        self.dtype = numpy.dtype(dtype)
+        self.shape = shape
+
+    def dumps(self, item: Any) -> Buffer:
+        array: Any = numpy.ascontiguousarray(item, dtype=self.dtype)
+        return memoryview(array).cast("B")
+
+    def loads(self, data: Buffer) -> Any:
+        array = numpy.frombuffer(data, dtype=self.dtype).copy()
+
+        if self.shape is not None:
+            array = array.reshape(self.shape)
+
+        return array
+
+
+class PickleSerializer(Serializer[Any]):
+    # Large buffers (numpy arrays, bytearrays) are pickled out-of-band with
+    # protocol 5 : they are copied once into the message instead of through
+    # the pickle stream, and loaded as views on the message. Arrays loaded
+    # this way are read-only.
+    def __init__(self, protocol: int = 5) -> None:
+        self.protocol = protocol
+
+    def dumps(self, item: Any) -> Buffer:
+        buffers: List[pickle.PickleBuffer] = []
+        callback = buffers.append if self.protocol >= 5 else None
+        payload = pickle.dumps(item, protocol=self.protocol, buffer_callback=callback)
+
+        raws = [buffer.raw() for buffer in buffers]
+        sizes = [len(payload)] + [raw.nbytes for raw in raws]
+        header = struct.pack(f"<I{len(sizes)}Q", len(raws), *sizes)
+
+        return b"".join([header, payload, *raws])
+
+    def loads(self, data: Buffer) -> Any:
+        # The buffers are loaded as views on `data`, which must not change.
+        if not isinstance(data, bytes):
+            data = bytes(data)
+
+        (nb_buffers,) = struct.unpack_from("<I", data)
+        sizes = struct.unpack_from(f"<{nb_buffers + 1}Q", data, 4)
+        offset = 4 + 8 * len(sizes)
+
+        view = memoryview(data)
+        parts = []
+        for size in sizes:
+            parts.append(view[offset:][:size])
+            offset += size
+
+        return pickle.loads(parts[0], buffers=parts[1:])
@@ -0,0 +1,69 @@
+from typing import Any, Callable, Iterator, List, Optional
+
+from modupipe.extractor import Extractor
+from modupipe.mapper import Mapper
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+Array = Any
+
+
+def _require_numpy(name: str) -> None:
+    if numpy is None:
+        raise ImportError(f"{name} requires numpy to be installed.")
+
+
+class RandomBatch(Extractor[Array]):
+    def __init__(self, size: int, seed: Optional[int] = None) -> None:
+        _require_numpy(self.__class__.__name__)
+        self.size = size
+        self.seed = seed
+
+    def extract(self) -> Iterator[Array]:
+        generator = numpy.random.default_rng(self.seed)
+
+        while True:
+            yield generator.random(self.size)
+
+
+class ToArray(Mapper[List[Any], Array]):
+    def __init__(self, dtype: Any = None) -> None:
+        _require_numpy(self.__class__.__name__)
+        self.dtype = dtype
+
+    def map(self, items: Iterator[List[Any]]) -> Iterator[Array]:
+        for item in items:
+            yield numpy.asarray(item, dtype=self.dtype)
+
+
+class Vectorize(Mapper[Array, Array]):
+    def __init__(self, function: Callable[[Array], Array]) -> None:
+        self.function = function
+
+    def map(self, items: Iterator[Array]) -> Iterator[Array]:
+        for item in items:
+            yield self.function(item)
+
+
+class FilterArray(Mapper[Array, Array]):
+    def __init__(self, predicate: Callable[[Array], Array]) -> None:
+        self.predicate = predicate
+
+    def map(self, items: Iterator[Array]) -> Iterator[Array]:
+        for item in items:
+            filtered = item[self.predicate(item)]
+
+            if len(filtered):
+                yield filtered
+
+
+class Unbatch(Mapper[Any, Any]):
+    def map(self, items: Iterator[Any]) -> Iterator[Any]:
+        for item in items:
+            if numpy is not None and isinstance(item, numpy.ndarray):
+                yield from item.tolist()
+            else:
+                yield from item
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from math import floor
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from modupipe.mapper import Mapper
+
+Input = TypeVar("Input")
+Result = TypeVar("Result")
+
+
+class Aggregate(ABC, Generic[Result]):
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        pass
+
+    # Values are always removed in the order they were added.
+    @abstractmethod
+    def remove(self, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def result(self) -> Optional[Result]:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class Count(Aggregate[int]):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+
+    def remove(self, value: Any) -> None:
+        self.count -= 1
+
+    def result(self) -> Optional[int]:
+        return self.count
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+class Sum(Aggregate[Any]):
+    def __init__(self) -> None:
+        self.total: Any = 0
+
+    def add(self, value: Any) -> None:
+        self.total += value
+
+    def remove(self, value: Any) -> None:
+        self.total -= value
+
+    def result(self) -> Optional[Any]:
+        return self.total
+
+    def reset(self) -> None:
+        self.total = 0
+
+
+class Mean(Aggregate[float]):
+    def __init__(self) -> None:
+        self.total: Any = 0
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.total += value
+        self.count += 1
+
+    def remove(self, value: Any) -> None:
+        self.total -= value
+        self.count -= 1
+
+    def result(self) -> Optional[float]:
+        if not self.count:
+            return None
+
+        return self.total / self.count
+
+    def reset(self) -> None:
+        self.total = 0
+        self.count = 0
+
+
+class _Monotonic(Aggregate[Any]):
+    def __init__(self) -> None:
+        self.candidates: Deque[Any] = deque()
+
+    @abstractmethod
+    def _dominates(self, value: Any, other: Any) -> bool:
+        pass
+
+    def add(self, value: Any) -> None:
+        while self.candidates and self._dominates(value, self.candidates[-1]):
+            self.candidates.pop()
+
+        self.candidates.append(value)
+
+    def remove(self, value: Any) -> None:
+        if self.candidates and self.candidates[0] == value:
+            self.candidates.popleft()
+
+    def result(self) -> Optional[Any]:
+        if not self.candidates:
+            return None
+
+        return self.candidates[0]
+
+    def reset(self) -> None:
+        self.candidates.clear()
+
+
+class Min(_Monotonic):
+    def _dominates(self, value: Any, other: Any) -> bool:
+        return value < other
+
+
+class Max(_Monotonic):
+    def _dominates(self, value: Any, other: Any) -> bool:
+        return value > other
+
+
+class Aggregates(Aggregate[Dict[str, Any]]):
+    def __init__(self, aggregates: Dict[str, Aggregate[Any]]) -> None:
+        self.aggregates = aggregates
+
+    def add(self, value: Any) -> None:
+        for aggregate in self.aggregates.values():
+            aggregate.add(value)
+
+    def remove(self, value: Any) -> None:
+        for aggregate in self.aggregates.values():
+            aggregate.remove(value)
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        return {name: aggregate.result() for name, aggregate in self.aggregates.items()}
+
+    def reset(self) -> None:
+        for aggregate in self.aggregates.values():
+            aggregate.reset()
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class TumblingWindow(Mapper[Input, Optional[Result]]):
+    def __init__(
+        self,
+        size: int,
+        aggregate: Aggregate[Result],
+        value: Callable[[Input], Any] = _identity,
+    ) -> None:
+        self.size = size
+        self.aggregate = aggregate
+        self.value = value
+
+    def map(self, items: Iterator[Input]) -> Iterator[Optional[Result]]:
+        self.aggregate.reset()
+        count = 0
+
+        for item in items:
+            self.aggregate.add(self.value(item))
+            count += 1
+
+            if count >= self.size:
+                yield self.aggregate.result()
+                self.aggregate.reset()
+                count = 0
+
+        if count:
+            yield self.aggregate.result()
+            self.aggregate.reset()
+
+
+class SlidingWindow(Mapper[Input, Optional[Result]]):
+    def __init__(
+        self,
+        size: int,
+        aggregate: Aggregate[Result],
+        step: int = 1,
+        value: Callable[[Input], Any] = _identity,
+    ) -> None:
+        self.size = size
+        self.aggregate = aggregate
+        self.step = step
+        self.value = value
+
+    def map(self, items: Iterator[Input]) -> Iterator[Optional[Result]]:
+        self.aggregate.reset()
+        window: Deque[Any] = deque()
+        since_last = 0
+
+        for item in items:
+            value = self.value(item)
+            window.append(value)
+            self.aggregate.add(value)
+
+            if len(window) > self.size:
+                self.aggregate.remove(window.popleft())
+
+            since_last += 1
+            if len(window) == self.size and since_last >= self.step:
+                yield self.aggregate.result()
+                since_last = 0
+
+
+class TumblingTimeWindow(Mapper[Input, Tuple[float, Optional[Result]]]):
+    def __init__(
+        self,
+        duration: float,
+        aggregate: Aggregate[Result],
+        value: Callable[[Input], Any] = _identity,
+        timestamp: Optional[Callable[[Input], float]] = None,
+    ) -> None:
+        self.duration = duration
+        self.aggregate = aggregate
+        self.value = value
+        self.timestamp = timestamp
+
+    def map(self, items: Iterator[Input]) -> Iterator[Tuple[float, Optional[Result]]]:
+        self.aggregate.reset()
+        start: Optional[float] = None
+
+        for item in items:
+            time = monotonic() if self.timestamp is None else self.timestamp(item)
+            window_start = floor(time / self.duration) * self.duration
+
+            if start is not None and window_start != start:
+                yield start, self.aggregate.result()
+                self.aggregate.reset()
+
+            start = window_start
+            self.aggregate.add(self.value(item))
+
+        if start is not None:
+            yield start, self.aggregate.result()
+            self.aggregate.reset()
+
+
+class SlidingTimeWindow(Mapper[Input, Tuple[float, Optional[Result]]]):
+    def __init__(
+        self,
+        duration: float,
+        aggregate: Aggregate[Result],
+        value: Callable[[Input], Any] = _identity,
+        timestamp: Optional[Callable[[Input], float]] = None,
+    ) -> None:
+        self.duration = duration
+        self.aggregate = aggregate
+        self.value = value
+        self.timestamp = timestamp
+
+    def map(self, items: Iterator[Input]) -> Iterator[Tuple[float, Optional[Result]]]:
+        self.aggregate.reset()
+        window: Deque[Tuple[float, Any]] = deque()
+
+        for item in items:
+            time = monotonic() if self.timestamp is None else self.timestamp(item)
+            value = self.value(item)
+            window.append((time, value))
+            self.aggregate.add(value)
+
+            while window[0][0] <= time - self.duration:
+                self.aggregate.remove(window.popleft()[1])
+
+            yield time, self.aggregate.result()
@@ -0,0 +1,233 @@
+import asyncio
+import unittest
+from typing import AsyncIterator, Iterator, List
+
+from mockito import mock, verify, when
+
+from modupipe.aio import (
+    AsyncConcurrentPushTo,
+    AsyncConcurrentPushToAndMap,
+    AsyncExtractor,
+    AsyncFilter,
+    AsyncFullPipeline,
+    AsyncLoader,
+    AsyncMultiTask,
+    AsyncPushTo,
+    AsyncPushToAndMap,
+    FromExtractor,
+    FromLoader,
+    ToExtractor,
+    ToLoader,
+)
+from modupipe.base import Condition
+from modupipe.extractor import Extractor
+from modupipe.loader import Loader
+
+VALUE_1 = 3.546
+VALUE_2 = 234.123
+
+
+class FakeExtractor(Extractor[float]):
+    def __init__(self, items: List[float]) -> None:
+        self.items = items
+
+    def extract(self) -> Iterator[float]:
+        return iter(self.items)
+
+
+class AsyncFakeExtractor(AsyncExtractor[float]):
+    def __init__(self, items: List[float]) -> None:
+        self.items = items
+
+    async def extract(self) -> AsyncIterator[float]:
+        for item in self.items:
+            yield item
+
+
+class AsyncDouble(AsyncLoader[float, float]):
+    async def load(self, item: float) -> float:
+        return item * 2
+
+
+class AsyncCollector(AsyncLoader[float, float]):
+    def __init__(self) -> None:
+        self.items: List[float] = []
+
+    async def load(self, item: float) -> float:
+        self.items.append(item)
+        return item
+
+
+class AsyncFilterTest(unittest.TestCase):
+    def test_itCanFilterOut(self):
+        condition = mock(Condition)
+        when(condition).check(VALUE_1).thenReturn(True)
+        when(condition).check(VALUE_2).thenReturn(False)
+        extractor = AsyncFakeExtractor([VALUE_1, VALUE_2]) + AsyncFilter(condition)
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [VALUE_1])
+
+
+class AsyncPushToTest(unittest.TestCase):
+    def test_itPushesToLoaderAndReturnsTheInputValues(self):
+        loader = AsyncCollector()
+        extractor = AsyncFakeExtractor([VALUE_1, VALUE_2]) + AsyncPushTo(loader)
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(loader.items, [VALUE_1, VALUE_2])
+        self.assertEqual(items, [VALUE_1, VALUE_2])
+
+
+class AsyncPushToAndMapTest(unittest.TestCase):
+    def test_itReturnsTheLoaderOutputValues(self):
+        extractor = AsyncFakeExtractor([VALUE_1, VALUE_2]) + AsyncPushToAndMap(
+            AsyncDouble() + AsyncDouble()
+        )
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [VALUE_1 * 4, VALUE_2 * 4])
+
+
+class AsyncSleepingDouble(AsyncLoader[float, float]):
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def load(self, item: float) -> float:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 * item)
+        self.in_flight -= 1
+        return item * 2
+
+
+class AsyncConcurrentPushToTest(unittest.TestCase):
+    def test_itPushesToLoaderAndReturnsTheInputValues(self):
+        loader = AsyncSleepingDouble()
+        extractor = AsyncFakeExtractor([3, 1, 2]) + AsyncConcurrentPushTo(loader)
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [3, 1, 2])
+
+    def test_itLimitsTheNumberOfLoadsInFlight(self):
+        loader = AsyncSleepingDouble()
+        extractor = AsyncFakeExtractor([1] * 10) + AsyncConcurrentPushTo(
+            loader, max_in_flight=4
+        )
+
+        AsyncFullPipeline(extractor).run()
+
+        self.assertEqual(loader.max_in_flight, 4)
+
+
+class AsyncConcurrentPushToAndMapTest(unittest.TestCase):
+    def test_givenOrdered_itReturnsTheLoaderOutputValuesInOrder(self):
+        extractor = AsyncFakeExtractor([3, 1, 2]) + AsyncConcurrentPushToAndMap(
+            AsyncSleepingDouble()
+        )
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [6, 2, 4])
+
+    def test_givenUnordered_itReturnsTheLoaderOutputValuesAsTheyComplete(self):
+        extractor = AsyncFakeExtractor([3, 1, 2]) + AsyncConcurrentPushToAndMap(
+            AsyncSleepingDouble(), ordered=False
+        )
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [2, 4, 6])
+
+
+class FromExtractorTest(unittest.TestCase):
+    def test_itExtractsAllItems(self):
+        extractor = FromExtractor(FakeExtractor([VALUE_1, VALUE_2]))
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [VALUE_1, VALUE_2])
+
+    def test_givenInThread_itExtractsAllItems(self):
+        extractor = FromExtractor(FakeExtractor([VALUE_1, VALUE_2]), in_thread=True)
+
+        items = list(ToExtractor(extractor).extract())
+
+        self.assertEqual(items, [VALUE_1, VALUE_2])
+
+
+class FromLoaderTest(unittest.IsolatedAsyncioTestCase):
+    async def test_itDelegatesToSyncLoader(self):
+        loader = mock(Loader)
+        when(loader).load(VALUE_1).thenReturn(VALUE_2)
+
+        value = await FromLoader(loader).load(VALUE_1)
+
+        self.assertEqual(value, VALUE_2)
+
+    async def test_givenInThread_itDelegatesToSyncLoader(self):
+        loader = mock(Loader)
+        when(loader).load(VALUE_1).thenReturn(VALUE_2)
+
+        value = await FromLoader(loader, in_thread=True).load(VALUE_1)
+
+        self.assertEqual(value, VALUE_2)
+
+
+class ToLoaderTest(unittest.TestCase):
+    def test_itRunsAsyncLoader(self):
+        loader = ToLoader(AsyncDouble())
+
+        self.assertEqual(loader.load(VALUE_1), VALUE_1 * 2)
+        self.assertEqual(loader.load(VALUE_2), VALUE_2 * 2)
+
+    def test_whenClosing_itClosesItsEventLoop(self):
+        loader = ToLoader(AsyncDouble())
+        loader.load(VALUE_1)
+        loop = loader.loop
+
+        loader.close()
+
+        self.assertTrue(loop.is_closed())
+
+
+class AsyncFullPipelineTest(unittest.TestCase):
+    def test_whenRunning_itExtractsAllItems(self):
+        loader = AsyncCollector()
+        extractor = AsyncFakeExtractor([VALUE_1, VALUE_2]) + AsyncPushTo(loader)
+
+        AsyncFullPipeline(extractor).run()
+
+        self.assertEqual(loader.items, [VALUE_1, VALUE_2])
+
+
+class AsyncMultiTaskTest(unittest.TestCase):
+    def test_itRunsAllPipelines(self):
+        loader1 = AsyncCollector()
+        loader2 = AsyncCollector()
+        pipeline1 = AsyncFullPipeline(
+            AsyncFakeExtractor([VALUE_1]) + AsyncPushTo(loader1)
+        )
+        pipeline2 = AsyncFullPipeline(
+            AsyncFakeExtractor([VALUE_2]) + AsyncPushTo(loader2)
+        )
+
+        AsyncMultiTask([pipeline1, pipeline2]).run()
+
+        self.assertEqual(loader1.items, [VALUE_1])
+        self.assertEqual(loader2.items, [VALUE_2])
+
+    def test_givenSyncLoader_itCanBeAdapted(self):
+        loader = mock(Loader, strict=False)
+        pipeline = AsyncFullPipeline(
+            AsyncFakeExtractor([VALUE_1]) + AsyncPushTo(FromLoader(loader))
+        )
+
+        AsyncMultiTask([pipeline]).run()
+
+        verify(loader).load(VALUE_1)
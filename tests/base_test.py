@@ -0,0 +1,49 @@
+import unittest
+
+from modupipe.base import Backoff, retry
+
+
+class BackoffTest(unittest.TestCase):
+    def test_itGrowsExponentiallyUpToTheMaximum(self):
+        backoff = Backoff(initial=0.1, multiplier=2.0, maximum=0.5)
+
+        delays = [backoff.delay(attempt) for attempt in range(4)]
+
+        self.assertEqual(delays, [0.1, 0.2, 0.4, 0.5])
+
+    def test_givenJitter_itWaitsAtMostTheDelay(self):
+        backoff = Backoff(initial=0.1, jitter=True)
+
+        self.assertLessEqual(backoff.delay(3), 0.8)
+
+
+class RetryTest(unittest.TestCase):
+    def test_itRetriesUntilSuccess(self):
+        attempts = []
+
+        def flaky(item: int) -> int:
+            attempts.append(item)
+            if len(attempts) < 3:
+                raise ValueError(item)
+            return item * 2
+
+        self.assertEqual(retry(flaky, 4, 2, Backoff(initial=0.0)), 8)
+        self.assertEqual(attempts, [4, 4, 4])
+
+    def test_itRaisesTheLastFailure(self):
+        def failing(item: int) -> int:
+            raise ValueError(item)
+
+        with self.assertRaises(ValueError):
+            retry(failing, 4, 2, Backoff(initial=0.0))
+
+    def test_itDoesNotRetryOtherExceptions(self):
+        attempts = []
+
+        def failing(item: int) -> int:
+            attempts.append(item)
+            raise KeyError(item)
+
+        with self.assertRaises(KeyError):
+            retry(failing, 4, 2, Backoff(initial=0.0), exceptions=(ValueError,))
+        self.assertEqual(attempts, [4])
@@ -0,0 +1,116 @@
+import unittest
+from typing import Iterator, List
+
+from mockito import mock, verify, when
+
+from modupipe.cache import Cache, CachedLoader, CachedMapper
+from modupipe.loader import Loader
+from modupipe.mapper import Mapper
+
+VALUE_1 = 3.546
+VALUE_2 = 234.123
+OTHER_VALUE = 923.765
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Repeated(Mapper[float, float]):
+    def __init__(self) -> None:
+        self.calls: List[float] = []
+
+    def map(self, items: Iterator[float]) -> Iterator[float]:
+        for item in items:
+            self.calls.append(item)
+            yield item
+            yield item
+
+
+class CacheTest(unittest.TestCase):
+    def test_itComputesMissesOnlyOnce(self):
+        cache = Cache[float]()
+
+        cache.get_or_compute("key", lambda: VALUE_1)
+        value = cache.get_or_compute("key", lambda: VALUE_2)
+
+        self.assertEqual(value, VALUE_1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_givenMaxSize_itEvictsLeastRecentlyUsed(self):
+        cache = Cache[float](max_size=2)
+        cache.get_or_compute("a", lambda: VALUE_1)
+        cache.get_or_compute("b", lambda: VALUE_1)
+        cache.get_or_compute("a", lambda: VALUE_1)
+
+        cache.get_or_compute("c", lambda: VALUE_1)
+
+        self.assertEqual(list(cache.entries), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_givenTtl_itRecomputesExpiredEntries(self):
+        clock = FakeClock()
+        cache = Cache[float](ttl=10, clock=clock)
+        cache.get_or_compute("key", lambda: VALUE_1)
+
+        clock.now = 11
+        value = cache.get_or_compute("key", lambda: VALUE_2)
+
+        self.assertEqual(value, VALUE_2)
+        self.assertEqual((cache.misses, cache.expirations), (2, 1))
+
+    def test_givenThreadSafe_itCachesValues(self):
+        cache = Cache[float](thread_safe=True)
+
+        cache.get_or_compute("key", lambda: VALUE_1)
+
+        self.assertEqual(cache.get_or_compute("key", lambda: VALUE_2), VALUE_1)
+
+
+class CachedLoaderTest(unittest.TestCase):
+    def test_itLoadsEachKeyOnce(self):
+        loader = mock(Loader)
+        when(loader).load(VALUE_1).thenReturn(OTHER_VALUE)
+        cached_loader = CachedLoader(loader)
+
+        values = [cached_loader.load(VALUE_1), cached_loader.load(VALUE_1)]
+
+        self.assertEqual(values, [OTHER_VALUE, OTHER_VALUE])
+        verify(loader, times=1).load(VALUE_1)
+
+    def test_givenKeyFunction_itCachesByKey(self):
+        loader = mock(Loader)
+        when(loader).load(...).thenReturn(OTHER_VALUE)
+        cached_loader = CachedLoader(loader, key=round)
+
+        cached_loader.load(3.1)
+        cached_loader.load(2.9)
+
+        verify(loader, times=1).load(...)
+
+    def test_givenSharedCache_itSharesEntries(self):
+        cache = Cache[float]()
+        loader = mock(Loader)
+        when(loader).load(...).thenReturn(OTHER_VALUE)
+
+        CachedLoader(loader, cache).load(VALUE_1)
+        CachedLoader(loader, cache).load(VALUE_1)
+
+        verify(loader, times=1).load(...)
+        self.assertEqual(cache.hits, 1)
+
+
+class CachedMapperTest(unittest.TestCase):
+    def test_itMapsEachKeyOnce(self):
+        mapper = Repeated()
+        cached_mapper = CachedMapper(mapper)
+
+        items = list(cached_mapper.map(iter([VALUE_1, VALUE_2, VALUE_1])))
+
+        self.assertEqual(items, [VALUE_1, VALUE_1, VALUE_2, VALUE_2, VALUE_1, VALUE_1])
+        self.assertEqual(mapper.calls, [VALUE_1, VALUE_2])
+        self.assertEqual(cached_mapper.cache.hits, 1)
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+from typing import Iterator, List, Optional, Tuple
+
+from modupipe.checkpoint import (
+    Checkpointed,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    ResumableExtractor,
+)
+from modupipe.loader import Loader
+from modupipe.mapper import Buffer, PushTo
+from modupipe.runnable import FullPipeline, Retry
+
+
+class Items(ResumableExtractor[int]):
+    def __init__(self, nb_items: int) -> None:
+        self.nb_items = nb_items
+        self.starts: List[Optional[int]] = []
+
+    def extract_from(self, position: Optional[int]) -> Iterator[Tuple[int, int]]:
+        self.starts.append(position)
+        start = 0 if position is None else position
+
+        for item in range(start, self.nb_items):
+            yield item + 1, item
+
+
+class FailingOnce(Loader[int, int]):
+    def __init__(self, failing_item: int) -> None:
+        self.failing_item = failing_item
+        self.failed = False
+        self.loaded: List[int] = []
+
+    def load(self, item: int) -> int:
+        if item == self.failing_item and not self.failed:
+            self.failed = True
+            raise ValueError(item)
+
+        self.loaded.append(item)
+        return item
+
+
+class FileCheckpointStoreTest(unittest.TestCase):
+    def test_itLoadsTheSavedPosition(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint")
+            store = FileCheckpointStore(path)
+
+            store.save({"offset": 42})
+
+            self.assertEqual(FileCheckpointStore(path).load(), {"offset": 42})
+            self.assertEqual(os.listdir(directory), ["checkpoint"])
+
+    def test_givenNoCheckpoint_itLoadsNone(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileCheckpointStore(os.path.join(directory, "checkpoint"))
+
+            self.assertIsNone(store.load())
+
+
+class ResumableExtractorTest(unittest.TestCase):
+    def test_itExtractsFromTheStart(self):
+        self.assertEqual(list(Items(3).extract()), [0, 1, 2])
+
+
+class CheckpointedTest(unittest.TestCase):
+    def test_itResumesFromTheStoredPosition(self):
+        extractor = Checkpointed(Items(5), MemoryCheckpointStore(3))
+
+        self.assertEqual(list(extractor.extract()), [3, 4])
+
+    def test_itCommitsEveryNAcknowledgements(self):
+        store = MemoryCheckpointStore()
+        extractor = Checkpointed(Items(5), store, every=2)
+        items = extractor.extract()
+
+        next(items)
+        extractor.acknowledge()
+        self.assertIsNone(store.load())
+        next(items)
+        extractor.acknowledge()
+
+        self.assertEqual(store.load(), 2)
+
+
+class CheckpointedPipelineTest(unittest.TestCase):
+    def test_itCommitsTheEndOfTheStream(self):
+        store = MemoryCheckpointStore()
+        pipeline = FullPipeline(
+            Checkpointed(Items(5), store, every=2) + PushTo(FailingOnce(-1))
+        )
+
+        pipeline.run()
+
+        self.assertEqual(store.load(), 5)
+
+    def test_givenAFailure_retryResumesFromTheLastCommit(self):
+        source = Items(10)
+        loader = FailingOnce(7)
+        pipeline = FullPipeline(
+            Checkpointed(source, MemoryCheckpointStore(), every=3) + PushTo(loader)
+        )
+
+        Retry(pipeline, nb_times=1).run()
+
+        self.assertEqual(source.starts, [None, 6])
+        self.assertEqual(loader.loaded, [0, 1, 2, 3, 4, 5, 6, 6, 7, 8, 9])
+
+    def test_itCommitsBufferedItemsOnceTheyAreEmitted(self):
+        store = MemoryCheckpointStore()
+        extractor = Checkpointed(Items(5), store, every=1) + Buffer(2)
+        pipeline = FullPipeline(extractor)
+        items = pipeline.extractor.extract()
+
+        next(items)
+        pipeline.checkpoint.acknowledge()
+
+        self.assertEqual(store.load(), 2)
+
+    def test_givenProgressBetweenFailures_retryResetsItsRetries(self):
+        class FailingEveryThird(Loader[int, int]):
+            def __init__(self) -> None:
+                self.failed: List[int] = []
+
+            def load(self, item: int) -> int:
+                if item % 3 == 2 and item not in self.failed:
+                    self.failed.append(item)
+                    raise ValueError(item)
+                return item
+
+        loader = FailingEveryThird()
+        pipeline = FullPipeline(
+            Checkpointed(Items(9), MemoryCheckpointStore(), every=1) + PushTo(loader)
+        )
+
+        Retry(pipeline, nb_times=1).run()
+
+        self.assertEqual(loader.failed, [2, 5, 8])
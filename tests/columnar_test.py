@@ -0,0 +1,108 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+from modupipe.columnar import (
+    Columns,
+    FilterColumns,
+    MapColumn,
+    SelectColumns,
+    ToColumns,
+    ToRows,
+)
+
+SCHEMA = [("id", "q"), ("price", "d"), ("name", None)]
+ROWS = [(1, 2.5, "a"), (2, 10.0, "b"), (3, 7.25, "c")]
+
+
+class ColumnsTest(unittest.TestCase):
+    def test_itSlicesTypedColumnsWithoutCopying(self):
+        columns = next(ToColumns(3, SCHEMA).map(iter(ROWS)))
+
+        sliced = columns.slice(1, 3)
+
+        self.assertEqual(len(sliced), 2)
+        self.assertEqual(sliced["price"].tolist(), [10.0, 7.25])
+        self.assertIs(sliced["price"].obj, columns["price"].obj)
+        self.assertEqual(list(sliced.rows()), ROWS[1:])
+
+    def test_itProjectsColumnsWithoutCopying(self):
+        columns = next(ToColumns(3, SCHEMA).map(iter(ROWS)))
+
+        projected = columns.select(["name", "id"])
+
+        self.assertEqual(projected.names, ["name", "id"])
+        self.assertIs(projected["id"], columns["id"])
+
+    def test_givenNoColumns_itIsEmpty(self):
+        self.assertEqual(len(Columns({})), 0)
+
+
+class ToColumnsTest(unittest.TestCase):
+    def test_itBuildsBatchesOfTypedColumns(self):
+        batches = list(ToColumns(2, SCHEMA).map(iter(ROWS)))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(batches[0]["id"].format, "q")
+        self.assertEqual(batches[0]["name"], ["a", "b"])
+        self.assertEqual(list(ToRows().map(iter(batches))), ROWS)
+
+    def test_givenByName_itReadsMappings(self):
+        rows = [{"price": 1.5, "id": 4}, {"price": 3.0, "id": 5}]
+        mapper = ToColumns(10, [("id", "q"), ("price", "d")], by_name=True)
+
+        columns = next(mapper.map(iter(rows)))
+
+        self.assertEqual(columns["id"].tolist(), [4, 5])
+        self.assertEqual(columns["price"].tolist(), [1.5, 3.0])
+
+
+class FilterColumnsTest(unittest.TestCase):
+    def test_itKeepsTheRowsMatchingTheColumnPredicate(self):
+        mapper = ToColumns(3, SCHEMA) + FilterColumns("price", lambda p: p > 5)
+
+        columns = next(mapper.map(iter(ROWS)))
+
+        self.assertEqual(list(columns.rows()), ROWS[1:])
+        self.assertEqual(columns["id"].format, "q")
+
+    def test_itDropsEmptyBatches(self):
+        mapper = ToColumns(3, SCHEMA) + FilterColumns("price", lambda p: p > 50)
+
+        self.assertEqual(list(mapper.map(iter(ROWS))), [])
+
+
+class MapColumnTest(unittest.TestCase):
+    def test_itAddsATypedColumn(self):
+        mapper = ToColumns(3, SCHEMA) + MapColumn(
+            "price", lambda p: round(p * 100), output="cents", typecode="q"
+        )
+
+        columns = next(mapper.map(iter(ROWS)))
+
+        self.assertEqual(columns["cents"].tolist(), [250, 1000, 725])
+        self.assertEqual(columns["price"].tolist(), [2.5, 10.0, 7.25])
+
+    def test_itProjectsAfterMapping(self):
+        mapper = ToColumns(3, SCHEMA) + MapColumn("name", str.upper)
+        mapper = mapper + SelectColumns(["name"]) + ToRows()
+
+        self.assertEqual(list(mapper.map(iter(ROWS))), [("A",), ("B",), ("C",)])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyColumnsTest(unittest.TestCase):
+    def test_itBuildsNumpyColumnsAndFiltersThemVectorized(self):
+        expensive = FilterColumns("price", lambda prices: prices > 5, vectorized=True)
+        doubled = MapColumn("price", lambda prices: prices * 2, vectorized=True)
+        mapper = ToColumns(3, SCHEMA, use_numpy=True) + expensive + doubled
+
+        columns = next(mapper.map(iter(ROWS)))
+
+        self.assertIsInstance(columns["id"], numpy.ndarray)
+        numpy.testing.assert_array_equal(columns["id"], [2, 3])
+        numpy.testing.assert_array_equal(columns["price"], [20.0, 14.5])
+        self.assertEqual(columns["name"], ["b", "c"])
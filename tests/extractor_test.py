@@ -1,4 +1,5 @@
 import multiprocessing
+import time
 import unittest
 from typing import Iterator, List
 
@@ -11,6 +12,8 @@ from modupipe.extractor import (
     GetFromQueue,
     MappedExtractor,
     MaxIterations,
+    Merge,
+    Prefetch,
 )
 from modupipe.mapper import Mapper
 from modupipe.queue import GetBlocking, Queue
@@ -19,6 +22,23 @@ VALUE_1 = 3.546
 VALUE_2 = 2349.234
 
 
+class FakeExtractor(Extractor[float]):
+    def __init__(self, items: List[float], delay: float = 0) -> None:
+        self.items = items
+        self.delay = delay
+
+    def extract(self) -> Iterator[float]:
+        for item in self.items:
+            time.sleep(self.delay)
+            yield item
+
+
+class FailingExtractor(Extractor[float]):
+    def extract(self) -> Iterator[float]:
+        raise ValueError()
+        yield
+
+
 class ExtractorListTest(unittest.TestCase):
     def test_itIteratesThroughEachExtractor(self):
         items1 = [1, 2, 3]
@@ -95,3 +115,93 @@ class GetFromQueueTest(unittest.TestCase):
 
         self.assertEqual(next(items), VALUE_1)
         self.assertEqual(next(items), VALUE_2)
+
+    def test_whenQueueIsClosed_itStopsAfterTheLastItem(self):
+        queue = Queue(multiprocessing.Queue())
+        queue.put(VALUE_1)
+        queue.close()
+        extractor = GetFromQueue(queue=queue, strategy=GetBlocking())
+
+        items = list(extractor.extract())
+
+        self.assertEqual(items, [VALUE_1])
+
+
+class MergeTest(unittest.TestCase):
+    def test_itYieldsAllItemsOfAllExtractors(self):
+        extractor = Merge([FakeExtractor([1, 2, 3]), FakeExtractor([4, 5])])
+
+        items = list(extractor.extract())
+
+        self.assertEqual(sorted(items), [1, 2, 3, 4, 5])
+
+    def test_itDoesNotWaitForStalledExtractors(self):
+        extractor = Merge([FakeExtractor([1], delay=5), FakeExtractor([2, 3])])
+
+        items = extractor.extract()
+
+        self.assertEqual([next(items), next(items)], [2, 3])
+
+    def test_itAlternatesBetweenReadyExtractors(self):
+        extractor = Merge(
+            [FakeExtractor([1, 1, 1]), FakeExtractor([2, 2, 2])], buffer_size=3
+        )
+
+        items = extractor.extract()
+        first_item = next(items)
+        time.sleep(0.1)
+        other_items = list(items)
+
+        self.assertEqual(other_items[0::2], [3 - first_item] * 3)
+
+    def test_givenTagged_itYieldsSourceIndexes(self):
+        extractor = Merge([FakeExtractor([1]), FakeExtractor([2])], tagged=True)
+
+        items = list(extractor.extract())
+
+        self.assertEqual(sorted(items), [(0, 1), (1, 2)])
+
+    def test_givenFailingExtractor_itRethrowsException(self):
+        extractor = Merge([FakeExtractor([1], delay=1), FailingExtractor()])
+
+        with self.assertRaises(ValueError):
+            list(extractor.extract())
+
+    def test_givenProcesses_itYieldsAllItems(self):
+        extractor = Merge([FakeExtractor([1, 2]), FakeExtractor([3, 4])], process=True)
+
+        items = list(extractor.extract())
+
+        self.assertEqual(sorted(items), [1, 2, 3, 4])
+
+
+class PrefetchTest(unittest.TestCase):
+    def test_itYieldsAllItemsInOrder(self):
+        extractor = Prefetch(FakeExtractor([1, 2, 3]), depth=2)
+
+        items = list(extractor.extract())
+
+        self.assertEqual(items, [1, 2, 3])
+
+    def test_itExtractsWhileItemsAreProcessed(self):
+        extractor = Prefetch(FakeExtractor([1, 2, 3, 4], delay=0.05), depth=4)
+
+        start = time.monotonic()
+        for _ in extractor.extract():
+            time.sleep(0.05)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.35)
+
+    def test_givenFailingExtractor_itRethrowsException(self):
+        extractor = Prefetch(FailingExtractor())
+
+        with self.assertRaises(ValueError):
+            list(extractor.extract())
+
+    def test_givenProcess_itYieldsAllItemsInOrder(self):
+        extractor = Prefetch(FakeExtractor([1, 2, 3]), depth=2, process=True)
+
+        items = list(extractor.extract())
+
+        self.assertEqual(items, [1, 2, 3])
@@ -0,0 +1,237 @@
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, List
+from unittest import mock
+
+from modupipe.checkpoint import Checkpointed, MemoryCheckpointStore
+from modupipe.files import (
+    Csv,
+    Jsonl,
+    Lines,
+    WriteBytes,
+    WriteCsv,
+    WriteJsonl,
+    byte_ranges,
+)
+
+LINES = ["first", "", "third line", "fourth", "the fifth and last"]
+
+
+class FileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _givenFile(self, content: str) -> str:
+        path = os.path.join(self.directory.name, "input")
+        with open(path, "w", newline="") as file:
+            file.write(content)
+
+        return path
+
+
+class LinesTest(FileTest):
+    def test_itReadsAllLines(self):
+        path = self._givenFile("\n".join(LINES) + "\n")
+
+        for use_mmap in [True, False]:
+            extractor = Lines(path, use_mmap=use_mmap, chunk_size=4)
+
+            self.assertEqual(list(extractor.extract()), LINES)
+
+    def test_itReadsALastLineWithoutNewline(self):
+        path = self._givenFile("a\r\nb")
+
+        for use_mmap in [True, False]:
+            extractor = Lines(path, use_mmap=use_mmap)
+
+            self.assertEqual(list(extractor.extract()), ["a", "b"])
+
+    def test_itReadsEachLineInExactlyOneByteRange(self):
+        path = self._givenFile("\n".join(LINES) + "\n")
+
+        for nb_ranges in range(1, 12):
+            for use_mmap in [True, False]:
+                lines: List[str] = []
+                for start, end in byte_ranges(path, nb_ranges):
+                    extractor = Lines(path, start, end, use_mmap=use_mmap, chunk_size=3)
+                    lines.extend(extractor.extract())
+
+                self.assertEqual(lines, LINES)
+
+    def test_itYieldsBatches(self):
+        path = self._givenFile("\n".join(LINES))
+
+        extractor = Lines(path, batch_size=2)
+
+        self.assertEqual(list(extractor.extract()), [LINES[0:2], LINES[2:4], LINES[4:]])
+
+    def test_givenNoEncoding_itYieldsBytes(self):
+        path = self._givenFile("a\nb\n")
+
+        self.assertEqual(list(Lines(path, encoding=None).extract()), [b"a", b"b"])
+
+    def test_givenEmptyFile_itYieldsNothing(self):
+        path = self._givenFile("")
+
+        self.assertEqual(list(Lines(path).extract()), [])
+
+    def test_itResumesWithoutSkippingLines(self):
+        path = self._givenFile("\n".join(LINES) + "\n")
+
+        for use_mmap in [True, False]:
+            extractor = Lines(path, use_mmap=use_mmap, chunk_size=4)
+            positions = [position for position, _ in extractor.extract_from(None)]
+
+            for index, position in enumerate(positions):
+                store = MemoryCheckpointStore(position)
+                resumed = list(Checkpointed(extractor, store).extract())
+
+                skipped = len(LINES) - len(resumed)
+                self.assertEqual(resumed, LINES[skipped:])
+                self.assertLessEqual(skipped, index + 1)
+            self.assertEqual(positions[-1], os.path.getsize(path))
+
+    def test_itYieldsBatchesWithTheirPositions(self):
+        path = self._givenFile("\n".join(LINES) + "\n")
+        extractor = Lines(path, batch_size=2, chunk_size=4)
+
+        batches = list(extractor.extract_from(None))
+
+        self.assertEqual(
+            [batch for _, batch in batches], [LINES[0:2], LINES[2:4], LINES[4:]]
+        )
+        self.assertEqual(batches[-1][0], os.path.getsize(path))
+
+
+class JsonlTest(FileTest):
+    def test_itParsesEachLine(self):
+        path = self._givenFile('{"a": 1}\n\n[2, 3]\n"four"\n')
+
+        result: List[Any] = list(Jsonl(path).extract())
+
+        self.assertEqual(result, [{"a": 1}, [2, 3], "four"])
+
+
+class CsvTest(FileTest):
+    def test_itParsesRows(self):
+        path = self._givenFile('a,b\n1,"two, three"\n')
+
+        self.assertEqual(list(Csv(path).extract()), [["a", "b"], ["1", "two, three"]])
+
+    def test_itParsesQuotedNewlines(self):
+        path = self._givenFile('1,"two\nlines"\n3,4\n')
+
+        for chunk_size in [2, 1 << 20]:
+            extractor = Csv(path, chunk_size=chunk_size)
+
+            expected = [["1", "two\nlines"], ["3", "4"]]
+            self.assertEqual(list(extractor.extract()), expected)
+
+    def test_givenHeader_itYieldsDictsInEveryRange(self):
+        path = self._givenFile("a,b\n1,2\n3,4\n5,6\n")
+
+        rows: List[Any] = []
+        for start, end in byte_ranges(path, 3):
+            rows.extend(Csv(path, start, end, header=True).extract())
+
+        expected = [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}, {"a": "5", "b": "6"}]
+        self.assertEqual(rows, expected)
+
+    def test_givenHeader_itReadsItOncePerExtraction(self):
+        path = self._givenFile("a,b\n" + "1,2\n" * 10)
+        extractor = Csv(path, header=True, chunk_size=4)
+
+        with mock.patch.object(Csv, "_fieldnames", return_value=["a", "b"]) as read:
+            rows = list(extractor.extract())
+
+        read.assert_called_once()
+        self.assertEqual(rows, [{"a": "1", "b": "2"}] * 10)
+
+
+class WriteFileTest(FileTest):
+    def test_itCoalescesWritesUntilTheBufferIsFull(self):
+        path = os.path.join(self.directory.name, "output")
+        loader = WriteBytes(path, buffer_size=4)
+
+        loader.load(b"ab")
+        self.assertEqual(self._read(path), b"")
+        loader.load(b"cd")
+        loader.load(b"e")
+        self.assertEqual(self._read(path), b"abcd")
+        loader.flush()
+
+        self.assertEqual(self._read(path), b"abcde")
+        self.assertIsNone(loader.file)
+
+    def test_itWritesPendingItemsAfterMaxWait(self):
+        path = os.path.join(self.directory.name, "output")
+        loader = WriteBytes(path, max_wait=0.01)
+
+        loader.load(b"a")
+        time.sleep(0.02)
+        loader.load(b"b")
+
+        self.assertEqual(self._read(path), b"ab")
+        loader.flush()
+
+    def test_itAppendsItemsLoadedAfterAFlush(self):
+        path = os.path.join(self.directory.name, "output")
+        loader = WriteBytes(path, delimiter=b"\n")
+
+        loader.load(b"a")
+        loader.flush()
+        loader.load(b"b")
+        loader.flush()
+
+        self.assertEqual(self._read(path), b"a\nb\n")
+
+    def test_itRotatesFilesBySize(self):
+        path = os.path.join(self.directory.name, "output-{index}.jsonl")
+        loader = WriteJsonl(path, buffer_size=1, max_file_bytes=13)
+
+        for item in [{"a": 1}, {"a": 2}, [3]]:
+            loader.load(item)
+        loader.flush()
+
+        self.assertEqual(self._read(path.format(index=0)), b'{"a": 1}\n')
+        self.assertEqual(self._read(path.format(index=1)), b'{"a": 2}\n[3]\n')
+        self.assertEqual(list(Jsonl(path.format(index=1)).extract()), [{"a": 2}, [3]])
+
+    def test_itWritesAHeaderAtTheStartOfEachCsvFile(self):
+        path = os.path.join(self.directory.name, "output.csv")
+        loader = WriteCsv(path, fieldnames=["a", "b"], max_file_bytes=10)
+
+        loader.load({"a": 1, "b": "x,y"})
+        loader.load({"a": 2})
+        loader.flush()
+
+        self.assertEqual(self._read(path), b'a,b\r\n1,"x,y"\r\n')
+        self.assertEqual(self._read(f"{path}.1"), b"a,b\r\n2,\r\n")
+        self.assertEqual(loader.paths, [path, f"{path}.1"])
+
+    def test_givenFsyncOnClose_itSyncsTheFileOnFlush(self):
+        path = os.path.join(self.directory.name, "output")
+        loader = WriteBytes(path, fsync="close")
+
+        with mock.patch("os.fsync") as fsync:
+            loader.load(b"a")
+            fsync.assert_not_called()
+            loader.flush()
+
+        fsync.assert_called_once()
+
+    def test_givenUnknownFsyncPolicy_itRaises(self):
+        with self.assertRaises(ValueError):
+            WriteBytes("output", fsync="sometimes")
+
+    def _read(self, path: str) -> bytes:
+        if not os.path.exists(path):
+            return b""
+
+        with open(path, "rb") as file:
+            return file.read()
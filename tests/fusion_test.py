@@ -0,0 +1,104 @@
+import pickle
+import unittest
+from typing import Iterator, List
+
+from modupipe.base import Condition
+from modupipe.extractor import Extractor, MappedExtractor
+from modupipe.fusion import FusedMapper, fuse
+from modupipe.loader import Buffer as BufferLoader
+from modupipe.loader import Loader
+from modupipe.mapper import Buffer, Filter, PushTo, PushToAndMap, ToString
+from modupipe.runnable import FullPipeline
+
+
+class FakeExtractor(Extractor[int]):
+    def __init__(self, items: List[int]) -> None:
+        self.items = items
+
+    def extract(self) -> Iterator[int]:
+        return iter(self.items)
+
+
+class IsEven(Condition[int]):
+    def check(self, item: int) -> bool:
+        return item % 2 == 0
+
+
+class AddOne(Loader[int, int]):
+    def load(self, item: int) -> int:
+        return item + 1
+
+
+class Collect(Loader[object, object]):
+    def __init__(self) -> None:
+        self.items: List[object] = []
+
+    def load(self, item: object) -> object:
+        self.items.append(item)
+        return item
+
+
+class FuseTest(unittest.TestCase):
+    def test_itFusesConsecutiveItemWiseMappers(self):
+        extractor = FakeExtractor([1, 2]) + Filter(IsEven())
+        extractor = extractor + PushToAndMap(AddOne() + AddOne()) + ToString()
+
+        fused = fuse(extractor)
+
+        self.assertIsInstance(fused, MappedExtractor)
+        self.assertIsInstance(fused.mapper, FusedMapper)
+        self.assertEqual(len(fused.mapper.steps), 3)
+
+    def test_itKeepsOtherMappersAsSeparateStages(self):
+        extractor = FakeExtractor([1, 2, 3, 4]) + PushToAndMap(AddOne())
+        extractor = extractor + Buffer(size=2) + PushTo(Collect())
+
+        fused = fuse(extractor)
+
+        self.assertIsInstance(fused.mapper, FusedMapper)
+        self.assertIsInstance(fused.extractor.mapper, Buffer)
+        self.assertIsInstance(fused.extractor.extractor.mapper, FusedMapper)
+
+    def test_itKeepsPipelineSemantics(self):
+        collected = Collect()
+        chained = Collect()
+        extractor = FakeExtractor([1, 2, 3, 4]) + PushToAndMap(AddOne())
+        extractor = extractor + Filter(IsEven()) + PushTo(chained + AddOne())
+        extractor = extractor + Buffer(size=2) + PushTo(collected)
+
+        items = list(fuse(extractor).extract())
+
+        self.assertEqual(items, [[2, 4]])
+        self.assertEqual(chained.items, [2, 4])
+        self.assertEqual(collected.items, [[2, 4]])
+
+    def test_givenFlushingLoader_itKeepsItsPushToAsSeparateStage(self):
+        extractor = FakeExtractor([1, 2, 3]) + PushToAndMap(BufferLoader(size=2))
+
+        items = list(fuse(extractor).extract())
+
+        self.assertEqual(items, [None, [1, 2], None, [3]])
+
+    def test_itCanBePickled(self):
+        extractor = FakeExtractor([1, 2]) + PushToAndMap(AddOne()) + ToString()
+
+        fused = pickle.loads(pickle.dumps(fuse(extractor)))
+
+        self.assertEqual(list(fused.extract()), ["2", "3"])
+
+    def test_givenNoMapper_itReturnsTheExtractor(self):
+        extractor = FakeExtractor([1])
+
+        self.assertIs(fuse(extractor), extractor)
+
+
+class FusedFullPipelineTest(unittest.TestCase):
+    def test_whenRunning_itLoadsAllItems(self):
+        collected = Collect()
+        pipeline = FullPipeline(
+            FakeExtractor([1, 2, 3]) + ToString() + PushTo(collected), fused=True
+        )
+
+        pipeline.run()
+
+        self.assertEqual(collected.items, ["1", "2", "3"])
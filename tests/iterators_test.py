@@ -0,0 +1,48 @@
+import queue
+import time
+import unittest
+from typing import Iterator
+
+from modupipe.iterators import BackgroundIterator
+
+VALUE_1 = 3.546
+VALUE_2 = 234.123
+
+
+def failing_items() -> Iterator[float]:
+    yield VALUE_1
+    raise ValueError()
+
+
+def slow_items() -> Iterator[float]:
+    time.sleep(1)
+    yield VALUE_1
+
+
+class BackgroundIteratorTest(unittest.TestCase):
+    def test_itIteratesOverAllItems(self):
+        iterator = BackgroundIterator(lambda: iter([VALUE_1, VALUE_2]))
+
+        self.assertEqual(list(iterator), [VALUE_1, VALUE_2])
+
+    def test_itPropagatesExceptions(self):
+        iterator = BackgroundIterator(failing_items)
+
+        self.assertEqual(next(iterator), VALUE_1)
+        with self.assertRaises(ValueError):
+            next(iterator)
+
+    def test_givenTimeout_itRaisesEmptyWhenNoItemIsReady(self):
+        iterator = BackgroundIterator(slow_items)
+
+        with self.assertRaises(queue.Empty):
+            iterator.next(timeout=0.01)
+
+        iterator.close()
+
+    def test_givenProcess_itIteratesOverAllItems(self):
+        iterator = BackgroundIterator(failing_items, process=True)
+
+        self.assertEqual(next(iterator), VALUE_1)
+        with self.assertRaises(ValueError):
+            next(iterator)
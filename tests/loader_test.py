@@ -1,23 +1,43 @@
 import multiprocessing
+import time
 import unittest
+from typing import List
 
 from mockito import mock, verify, when
 
-from modupipe.base import Condition
+from modupipe.base import Backoff, Condition, Failure
+from modupipe.exceptions import QueueClosed
 from modupipe.loader import (
+    BoundedBuffer,
     Buffer,
     Loader,
     LoaderList,
     LoaderListUntyped,
     OnCondition,
+    PutToPartition,
     PutToQueue,
+    Retry,
     ToString,
 )
-from modupipe.queue import PutBlocking, Queue
+from modupipe.queue import PutBatching, PutBlocking, Queue
 
 VALUE_1 = 439.234
 VALUE_2 = 12.682
 
+NO_WAIT = Backoff(initial=0.0)
+
+
+class FailingTimes(Loader[float, float]):
+    def __init__(self, nb_failures: int) -> None:
+        self.nb_failures = nb_failures
+        self.attempts = 0
+
+    def load(self, item: float) -> float:
+        self.attempts += 1
+        if self.attempts <= self.nb_failures:
+            raise ValueError(item)
+        return item
+
 
 class OnConditionTest(unittest.TestCase):
     def test_itCanFilterIn(self):
@@ -135,6 +155,60 @@ class BufferTest(unittest.TestCase):
         self.assertEqual(returned_items2, [VALUE_1, VALUE_2])
         self.assertEqual(returned_items3, None)
 
+    def test_whenFlushing_itReturnsTheRemainder(self):
+        loader = Buffer(size=2)
+
+        loader.load(VALUE_1)
+
+        self.assertEqual(loader.flush(), [VALUE_1])
+        self.assertEqual(loader.flush(), None)
+
+
+class ChainedLoaderTest(unittest.TestCase):
+    def test_whenFlushing_itLoadsTheRemainderIntoTheNextLoader(self):
+        loader = Buffer(size=2) + ToString()
+
+        loader.load(VALUE_1)
+
+        self.assertEqual(loader.flush(), str([VALUE_1]))
+
+
+class BoundedBufferTest(unittest.TestCase):
+    def test_itFlushesOnSize(self):
+        loader = BoundedBuffer(size=2)
+
+        returned_items1 = loader.load(VALUE_1)
+        returned_items2 = loader.load(VALUE_2)
+
+        self.assertEqual(returned_items1, None)
+        self.assertEqual(returned_items2, [VALUE_1, VALUE_2])
+
+    def test_itFlushesOnByteSize(self):
+        loader = BoundedBuffer(size=10, max_bytes=4, sizeof=len)
+
+        returned_items1 = loader.load("ab")
+        returned_items2 = loader.load("cd")
+
+        self.assertEqual(returned_items1, None)
+        self.assertEqual(returned_items2, ["ab", "cd"])
+
+    def test_givenMaxWait_itFlushesOnNextItemAfterDeadline(self):
+        loader = BoundedBuffer(size=10, max_wait=0.01)
+
+        loader.load(VALUE_1)
+        time.sleep(0.05)
+        returned_items = loader.load(VALUE_2)
+
+        self.assertEqual(returned_items, [VALUE_1, VALUE_2])
+
+    def test_whenFlushing_itReturnsTheRemainder(self):
+        loader = BoundedBuffer(size=10)
+
+        loader.load(VALUE_1)
+
+        self.assertEqual(loader.flush(), [VALUE_1])
+        self.assertEqual(loader.flush(), None)
+
 
 class PutToQueueTest(unittest.TestCase):
     def test_itPushesToQueue(self):
@@ -146,3 +220,92 @@ class PutToQueueTest(unittest.TestCase):
 
         self.assertEqual(queue.get(), VALUE_1)
         self.assertEqual(queue.get(), VALUE_2)
+
+    def test_whenFlushing_itFlushesItsStrategy(self):
+        queue = Queue(multiprocessing.Queue())
+        loader = PutToQueue(queue, strategy=PutBatching(size=4))
+
+        loader.load(VALUE_1)
+        loader.flush()
+
+        self.assertEqual(queue.get(timeout=1), [VALUE_1])
+
+    def test_givenClose_whenFlushing_itClosesTheQueueOnce(self):
+        queue = Queue(multiprocessing.Queue())
+        loader = PutToQueue(queue, strategy=PutBlocking(), close=True)
+
+        loader.load(VALUE_1)
+        loader.flush()
+        loader.flush()
+
+        self.assertEqual(queue.get(timeout=1), VALUE_1)
+        with self.assertRaises(QueueClosed):
+            queue.get(timeout=1)
+        self.assertEqual(len(queue), 1)
+
+
+class PutToPartitionTest(unittest.TestCase):
+    def test_itPutsEachItemInTheQueueOfItsKey(self):
+        queues = [Queue(multiprocessing.Queue()) for _ in range(2)]
+        loader = PutToPartition(queues, key=round)
+
+        loader.load(VALUE_1)
+        loader.load(VALUE_2)
+
+        partitions = loader.partitions
+        self.assertEqual(queues[partitions.partition_for(VALUE_1)].get(), VALUE_1)
+        self.assertEqual(queues[partitions.partition_for(VALUE_2)].get(), VALUE_2)
+
+    def test_givenClose_whenFlushing_itClosesEveryQueueOnce(self):
+        queues = [Queue(multiprocessing.Queue()) for _ in range(2)]
+        loader = PutToPartition(queues, key=round, close=True)
+
+        loader.flush()
+        loader.flush()
+
+        for queue in queues:
+            with self.assertRaises(QueueClosed):
+                queue.get(timeout=1)
+            self.assertEqual(len(queue), 1)
+
+
+class RetryTest(unittest.TestCase):
+    def test_itRetriesAFailingItem(self):
+        failing = FailingTimes(2)
+        loader = Retry(failing, nb_times=2, backoff=NO_WAIT)
+
+        self.assertEqual(loader.load(VALUE_1), VALUE_1)
+        self.assertEqual(failing.attempts, 3)
+
+    def test_givenNoDeadLetter_itRaisesOnPermanentFailure(self):
+        loader = Retry(FailingTimes(3), nb_times=2, backoff=NO_WAIT)
+
+        with self.assertRaises(ValueError):
+            loader.load(VALUE_1)
+
+    def test_itRoutesPermanentFailuresToTheDeadLetterLoader(self):
+        dead_letter = mock(Loader, strict=False)
+        captured: List[Failure[float]] = []
+        when(dead_letter).load(...).thenAnswer(captured.append)
+        loader = Retry(
+            FailingTimes(3), nb_times=2, backoff=NO_WAIT, on_failure=dead_letter
+        )
+
+        self.assertIsNone(loader.load(VALUE_1))
+        self.assertEqual(loader.load(VALUE_2), VALUE_2)
+
+        self.assertEqual([failure.item for failure in captured], [VALUE_1])
+        self.assertIsInstance(captured[0].exception, ValueError)
+        self.assertEqual(loader.nb_failures, 1)
+
+    def test_itRoutesPermanentFailuresToADeadLetterQueue(self):
+        queue = Queue(multiprocessing.Queue())
+        dead_letter = PutToQueue(queue, PutBlocking(), close=True)
+        loader = Retry(FailingTimes(1), nb_times=0, on_failure=dead_letter)
+
+        loader.load(VALUE_1)
+        loader.flush()
+
+        self.assertEqual(queue.get(timeout=1).item, VALUE_1)
+        with self.assertRaises(QueueClosed):
+            queue.get(timeout=1)
@@ -1,28 +1,98 @@
 import multiprocessing
+import threading
+import time
 import unittest
-from typing import Iterable
+from typing import Iterable, Iterator, List
 
 from mockito import mock, verify, when
 
-from modupipe.base import Condition
+from modupipe.base import Backoff, Condition, Failure
+from modupipe.extractor import GetFromQueue
+from modupipe.loader import Buffer as BufferLoader
 from modupipe.loader import Loader
 from modupipe.mapper import (
+    BoundedBuffer,
     Buffer,
     ChainedMapper,
+    ConcurrentPushTo,
+    ConcurrentPushToAndMap,
     Filter,
+    MapItem,
     Mapper,
+    ParallelMap,
     PushTo,
     PushToAndMap,
+    PutToPartition,
     PutToQueue,
+    Retry,
     ToString,
 )
-from modupipe.queue import PutBlocking, Queue
+from modupipe.queue import GetBatching, GetBlocking, PutBatching, PutBlocking, Queue
 
 VALUE_1 = 243.2345
 VALUE_2 = 39.42
 OTHER_VALUE = 923.765
 
 
+class Double(Loader[float, float]):
+    def load(self, item: float) -> float:
+        return item * 2
+
+
+class FailingOn(Loader[float, float]):
+    def __init__(self, failing_item: float) -> None:
+        self.failing_item = failing_item
+
+    def load(self, item: float) -> float:
+        if item == self.failing_item:
+            raise ValueError(item)
+        return item
+
+
+class InFlightCounter(Loader[float, float]):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def load(self, item: float) -> float:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return item
+
+
+class FailureCollector(Loader[Failure[float], None]):
+    def __init__(self) -> None:
+        self.failures: List[Failure[float]] = []
+
+    def load(self, item: Failure[float]) -> None:
+        self.failures.append(item)
+
+
+class Repeated(Mapper[float, float]):
+    def map(self, items: Iterator[float]) -> Iterator[float]:
+        for item in items:
+            yield item
+            yield item
+
+
+class FlakyDouble(Mapper[float, float]):
+    def __init__(self, failing_item: float, nb_failures: int) -> None:
+        self.failing_item = failing_item
+        self.nb_failures = nb_failures
+
+    def map(self, items: Iterator[float]) -> Iterator[float]:
+        for item in items:
+            if item == self.failing_item and self.nb_failures > 0:
+                self.nb_failures -= 1
+                raise ValueError(item)
+            yield item * 2
+
+
 class ChainedMapperTest(unittest.TestCase):
     def test_itChainsMappersTogether(self):
         source_items = iter([VALUE_1, VALUE_2])
@@ -91,6 +161,76 @@ class BufferTest(unittest.TestCase):
         expected_items = [VALUE_1, VALUE_2]
         self.assertEqual(mapped_items, expected_items)
 
+    def test_itFlushesRemainderAtEndOfStream(self):
+        mapper = Buffer(size=2)
+        items = iter([VALUE_1, VALUE_2, OTHER_VALUE])
+
+        mapped_items = list(mapper.map(items))
+
+        self.assertEqual(mapped_items, [[VALUE_1, VALUE_2], [OTHER_VALUE]])
+
+
+class BoundedBufferTest(unittest.TestCase):
+    def test_itFlushesOnSize(self):
+        mapper = BoundedBuffer(size=2)
+        items = iter([VALUE_1, VALUE_2, VALUE_1, VALUE_2])
+
+        mapped_items = list(mapper.map(items))
+
+        self.assertEqual(mapped_items, [[VALUE_1, VALUE_2], [VALUE_1, VALUE_2]])
+
+    def test_itFlushesRemainderAtEndOfStream(self):
+        mapper = BoundedBuffer(size=2)
+        items = iter([VALUE_1, VALUE_2, OTHER_VALUE])
+
+        mapped_items = list(mapper.map(items))
+
+        self.assertEqual(mapped_items, [[VALUE_1, VALUE_2], [OTHER_VALUE]])
+
+    def test_itFlushesOnByteSize(self):
+        mapper = BoundedBuffer(size=10, max_bytes=4, sizeof=len)
+        items = iter(["ab", "cd", "e"])
+
+        mapped_items = list(mapper.map(items))
+
+        self.assertEqual(mapped_items, [["ab", "cd"], ["e"]])
+
+    def test_givenMaxWait_itFlushesPendingItemsOfSlowStream(self):
+        mapper = BoundedBuffer(size=10, max_wait=0.05)
+
+        mapped_items = list(mapper.map(self._slowItems([VALUE_1, VALUE_2], 0.2)))
+
+        self.assertEqual(mapped_items, [[VALUE_1], [VALUE_2]])
+
+    def test_givenMaxWait_itFlushesRemainderAtEndOfStream(self):
+        mapper = BoundedBuffer(size=10, max_wait=10)
+
+        mapped_items = list(mapper.map(iter([VALUE_1, VALUE_2])))
+
+        self.assertEqual(mapped_items, [[VALUE_1, VALUE_2]])
+
+    def test_givenMaxWait_whenStoppedEarly_itClosesTheUpstreamItems(self):
+        closed = threading.Event()
+        mapper = BoundedBuffer(size=1, max_wait=10)
+
+        def items() -> Iterator[float]:
+            try:
+                while True:
+                    yield VALUE_1
+            finally:
+                closed.set()
+
+        mapped_items = mapper.map(items())
+        next(mapped_items)
+        mapped_items.close()
+
+        self.assertTrue(closed.wait(timeout=1))
+
+    def _slowItems(self, items: List[float], delay: float) -> Iterator[float]:
+        for item in items:
+            yield item
+            time.sleep(delay)
+
 
 class PutToQueueTest(unittest.TestCase):
     def test_itPushesToQueue(self):
@@ -102,6 +242,40 @@ class PutToQueueTest(unittest.TestCase):
         self.assertEqual(queue.get(), VALUE_1)
         self.assertEqual(queue.get(), VALUE_2)
 
+    def test_givenBatchingStrategy_itPutsTheTrailingPartialFrame(self):
+        queue = Queue(multiprocessing.Queue())
+        mapper = PutToQueue(queue, strategy=PutBatching(size=4))
+
+        list(mapper.map(iter(range(10))))
+
+        self.assertEqual(queue.get(timeout=1), [0, 1, 2, 3])
+        self.assertEqual(queue.get(timeout=1), [4, 5, 6, 7])
+        self.assertEqual(queue.get(timeout=1), [8, 9])
+
+    def test_givenClose_itClosesTheQueueAfterTheLastFrame(self):
+        queue = Queue(multiprocessing.Queue())
+        mapper = PutToQueue(queue, strategy=PutBatching(size=4), close=True)
+
+        list(mapper.map(iter(range(10))))
+        items = list(GetFromQueue(queue, GetBatching(timeout=1)).extract())
+
+        self.assertEqual(items, list(range(10)))
+
+
+class PutToPartitionTest(unittest.TestCase):
+    def test_itKeepsTheOrderOfEachKey(self):
+        queues = [Queue(multiprocessing.Queue()) for _ in range(3)]
+        mapper = PutToPartition(queues, key=lambda item: item % 5, close=True)
+
+        self.assertEqual(list(mapper.map(iter(range(50)))), list(range(50)))
+
+        for index, queue in enumerate(queues):
+            items = list(GetFromQueue(queue, GetBlocking(timeout=1)).extract())
+            keys = [
+                key for key in range(5) if mapper.partitions.partition_for(key) == index
+            ]
+            self.assertEqual(items, [item for item in range(50) if item % 5 in keys])
+
 
 class PushToTest(unittest.TestCase):
     def test_itPushesToLoader(self):
@@ -143,11 +317,132 @@ class PushToAndMapTest(unittest.TestCase):
 
         self.assertEqual(mapped_values, [OTHER_VALUE, OTHER_VALUE])
 
+    def test_givenBufferingLoader_itReturnsItsRemainderAtEndOfStream(self):
+        mapper = PushToAndMap(BufferLoader(size=2))
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(mapped_values, [None, [VALUE_1, VALUE_2], None, [OTHER_VALUE]])
+
     def _givenLoader(self):
         return mock(Loader, strict=False)
 
     def _givenLoaderReturning(self, value: float):
         loader = mock(Loader)
         when(loader).load(...).thenReturn(value)
+        when(loader).flush().thenReturn(None)
 
         return loader
+
+
+class ParallelMapTest(unittest.TestCase):
+    def test_givenLoader_itLoadsEachItem(self):
+        mapper = ParallelMap(Double(), workers=2)
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(mapped_values, [VALUE_1 * 2, VALUE_2 * 2, OTHER_VALUE * 2])
+
+    def test_givenMapper_itMapsEachChunk(self):
+        mapper = ParallelMap(Repeated(), workers=2, chunk_size=2)
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        expected_values = [VALUE_1, VALUE_1, VALUE_2, VALUE_2, OTHER_VALUE, OTHER_VALUE]
+        self.assertEqual(mapped_values, expected_values)
+
+    def test_givenUnordered_itReturnsAllItems(self):
+        items = [float(i) for i in range(20)]
+        mapper = ParallelMap(Double(), workers=2, chunk_size=3, ordered=False)
+
+        mapped_values = list(mapper.map(iter(items)))
+
+        self.assertEqual(sorted(mapped_values), [item * 2 for item in items])
+
+
+class MapItemTest(unittest.TestCase):
+    def test_itReturnsTheMappedValuesOfOneItem(self):
+        loader = MapItem(Repeated())
+
+        self.assertEqual(loader.load(VALUE_1), [VALUE_1, VALUE_1])
+
+
+class ConcurrentPushToTest(unittest.TestCase):
+    def test_itPushesToLoader(self):
+        loader = mock(Loader, strict=False)
+        mapper = ConcurrentPushTo(loader, workers=2)
+
+        list(mapper.map(iter([VALUE_1, VALUE_2])))
+
+        verify(loader).load(VALUE_1)
+        verify(loader).load(VALUE_2)
+
+    def test_itReturnsTheInputValuesInOrder(self):
+        mapper = ConcurrentPushTo(Double(), workers=2)
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(mapped_values, [VALUE_1, VALUE_2, OTHER_VALUE])
+
+    def test_itLimitsTheNumberOfLoadsInFlight(self):
+        loader = InFlightCounter()
+        mapper = ConcurrentPushTo(loader, workers=8, max_in_flight=3)
+
+        list(mapper.map(iter([float(i) for i in range(20)])))
+
+        self.assertLessEqual(loader.max_in_flight, 3)
+
+    def test_givenFailureLoader_itReportsFailedItems(self):
+        failures = FailureCollector()
+        mapper = ConcurrentPushTo(FailingOn(VALUE_2), workers=2, on_failure=failures)
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(mapped_values, [VALUE_1, OTHER_VALUE])
+        self.assertEqual([failure.item for failure in failures.failures], [VALUE_2])
+        self.assertIsInstance(failures.failures[0].exception, ValueError)
+
+    def test_givenNoFailureLoader_itRethrowsException(self):
+        mapper = ConcurrentPushTo(FailingOn(VALUE_2), workers=2)
+
+        with self.assertRaises(ValueError):
+            list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+
+class ConcurrentPushToAndMapTest(unittest.TestCase):
+    def test_itReturnsTheLoaderOutputValuesInOrder(self):
+        mapper = ConcurrentPushToAndMap(Double(), workers=2)
+
+        mapped_values = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(mapped_values, [VALUE_1 * 2, VALUE_2 * 2, OTHER_VALUE * 2])
+
+
+class RetryTest(unittest.TestCase):
+    def test_itRetriesOnlyTheFailingItem(self):
+        mapper = Retry(FlakyDouble(VALUE_2, 2), nb_times=2, backoff=Backoff(0.0))
+
+        result = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(result, [VALUE_1 * 2, VALUE_2 * 2, OTHER_VALUE * 2])
+
+    def test_itKeepsTheStreamFlowingPastPermanentFailures(self):
+        failures = FailureCollector()
+        mapper = Retry(
+            FlakyDouble(VALUE_2, 5),
+            nb_times=1,
+            backoff=Backoff(0.0),
+            on_failure=failures,
+        )
+
+        result = list(mapper.map(iter([VALUE_1, VALUE_2, OTHER_VALUE])))
+
+        self.assertEqual(result, [VALUE_1 * 2, OTHER_VALUE * 2])
+        self.assertEqual([failure.item for failure in failures.failures], [VALUE_2])
+        self.assertEqual(mapper.nb_failures, 1)
+
+    def test_givenNoDeadLetter_itRaisesOnPermanentFailure(self):
+        mapper = Retry(FlakyDouble(VALUE_2, 5), nb_times=1, backoff=Backoff(0.0))
+
+        with self.assertRaises(ValueError):
+            list(mapper.map(iter([VALUE_1, VALUE_2])))
@@ -0,0 +1,117 @@
+import queue
+import unittest
+from typing import List
+
+from modupipe.extractor import GetFromQueue
+from modupipe.partition import HashRing, Partitions, stable_hash
+from modupipe.queue import GetBatching, GetBlocking, PutBatching, Queue
+
+KEYS = [f"key-{i}" for i in range(2000)]
+
+
+class StableHashTest(unittest.TestCase):
+    def test_itHashesEqualStringsAndBytesTheSame(self):
+        self.assertEqual(stable_hash("session"), stable_hash(b"session"))
+        self.assertEqual(stable_hash(42), stable_hash("42"))
+
+
+class HashRingTest(unittest.TestCase):
+    def test_itMapsAKeyToTheSameNodeInEveryRing(self):
+        ring = HashRing(range(4))
+        other = HashRing([3, 1, 0, 2])
+
+        for key in KEYS:
+            self.assertEqual(ring.node_for(key), other.node_for(key))
+
+    def test_itSpreadsKeysOverAllNodes(self):
+        ring = HashRing(range(4))
+
+        counts = [0] * 4
+        for key in KEYS:
+            counts[ring.node_for(key)] += 1
+
+        for count in counts:
+            self.assertGreater(count, len(KEYS) / 4 / 2)
+
+    def test_whenAddingANode_onlyKeysMovingToItChangeNode(self):
+        ring = HashRing(range(4))
+        before = [ring.node_for(key) for key in KEYS]
+
+        ring.add(4)
+        after = [ring.node_for(key) for key in KEYS]
+
+        moved = [new for old, new in zip(before, after) if old != new]
+        self.assertEqual(set(moved), {4})
+        self.assertLess(len(moved), len(KEYS) / 5 * 1.5)
+
+    def test_whenRemovingANode_itsKeysMoveToTheOtherNodes(self):
+        ring = HashRing(range(4))
+        before = [ring.node_for(key) for key in KEYS]
+
+        ring.remove(2)
+        after = [ring.node_for(key) for key in KEYS]
+
+        for old, new in zip(before, after):
+            if old != 2:
+                self.assertEqual(old, new)
+        self.assertNotIn(2, after)
+
+    def test_givenNodeAlreadyInTheRing_itRaises(self):
+        with self.assertRaises(ValueError):
+            HashRing([0, 0])
+
+    def test_givenNoNodes_itRaises(self):
+        with self.assertRaises(LookupError):
+            HashRing().node_for("key")
+
+
+class PartitionsTest(unittest.TestCase):
+    def test_itPutsTheItemsOfAKeyInOrderInOneQueue(self):
+        queues = self._givenQueues(3)
+        partitions = Partitions(queues, key=lambda item: item[0])
+        items = [(key, index) for index in range(5) for key in "abcdefgh"]
+
+        for item in items:
+            partitions.put(item)
+        partitions.flush()
+        partitions.close()
+
+        for index, partition in enumerate(queues):
+            received = self._drain(partition)
+            for key in {key for key, _ in received}:
+                expected = [item for item in items if item[0] == key]
+                self.assertEqual(
+                    [item for item in received if item[0] == key], expected
+                )
+                self.assertEqual(partitions.partition_for((key, 0)), index)
+
+    def test_itUsesOneStrategyPerQueue(self):
+        queues = self._givenQueues(2)
+        partitions = Partitions(queues, key=str, strategy=lambda: PutBatching(2))
+
+        for item in range(20):
+            partitions.put(item)
+        partitions.flush()
+        partitions.close()
+
+        for index, partition in enumerate(queues):
+            items = list(GetFromQueue(partition, GetBatching(timeout=1)).extract())
+            self.assertEqual(
+                items,
+                [item for item in range(20) if partitions.partition_for(item) == index],
+            )
+
+    def test_whenAddingAQueue_itRoutesSomeKeysToIt(self):
+        queues = self._givenQueues(2)
+        partitions = Partitions(queues, key=str)
+
+        self.assertEqual(partitions.add(Queue(queue.Queue())), 2)
+        self.assertEqual(len(partitions), 3)
+
+        self.assertIn(2, {partitions.partition_for(key) for key in KEYS})
+
+    def _givenQueues(self, nb_queues: int) -> List[Queue]:
+        return [Queue(queue.Queue()) for _ in range(nb_queues)]
+
+    def _drain(self, partition: Queue) -> List:
+        return list(GetFromQueue(partition, GetBlocking(timeout=1)).extract())
@@ -0,0 +1,102 @@
+import time
+import unittest
+from typing import Iterator, List
+
+from modupipe.base import Condition
+from modupipe.extractor import Extractor
+from modupipe.loader import Loader
+from modupipe.mapper import Filter, Mapper, PushTo
+from modupipe.profiler import Profiler
+from modupipe.runnable import FullPipeline, StepPipeline
+
+
+class FakeExtractor(Extractor[int]):
+    def __init__(self, items: List[int]) -> None:
+        self.items = items
+
+    def extract(self) -> Iterator[int]:
+        return iter(self.items)
+
+
+class IsEven(Condition[int]):
+    def check(self, item: int) -> bool:
+        return item % 2 == 0
+
+
+class Slow(Mapper[int, int]):
+    def map(self, items: Iterator[int]) -> Iterator[int]:
+        for item in items:
+            time.sleep(0.01)
+            yield item
+
+
+class Collect(Loader[int, int]):
+    def __init__(self) -> None:
+        self.items: List[int] = []
+
+    def load(self, item: int) -> int:
+        self.items.append(item)
+        return item
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_itKeepsPipelineSemantics(self):
+        loader = Collect()
+        profiler = Profiler()
+
+        FullPipeline(
+            FakeExtractor([1, 2, 3, 4]) + Filter(IsEven()) + PushTo(loader),
+            profiler=profiler,
+        ).run()
+
+        self.assertEqual(loader.items, [2, 4])
+
+    def test_itCountsItemsPerStage(self):
+        profiler = Profiler()
+
+        FullPipeline(
+            FakeExtractor([1, 2, 3, 4]) + Filter(IsEven()) + PushTo(Collect()),
+            profiler=profiler,
+        ).run()
+
+        counts = [(s.name, s.items_in, s.items_out) for s in profiler.stages]
+        self.assertEqual(
+            counts,
+            [
+                ("FakeExtractor", 0, 4),
+                ("Filter", 4, 2),
+                ("PushTo", 2, 2),
+                ("Collect", 2, 2),
+            ],
+        )
+
+    def test_itAttributesTimeToTheSlowStage(self):
+        profiler = Profiler()
+
+        FullPipeline(
+            FakeExtractor([1, 2, 3]) + Slow() + Filter(IsEven()), profiler=profiler
+        ).run()
+
+        slow_stage = profiler.stages[1]
+        other_stages_time = sum(
+            stage.own_time for stage in profiler.stages if stage is not slow_stage
+        )
+        self.assertGreaterEqual(slow_stage.own_time, 0.03)
+        self.assertLess(other_stages_time, slow_stage.own_time)
+
+    def test_itCanProfileStepPipeline(self):
+        profiler = Profiler()
+        pipeline = StepPipeline(FakeExtractor([1, 2]) + Slow(), profiler=profiler)
+
+        pipeline.run()
+
+        self.assertEqual(profiler.stages[1].items_out, 1)
+
+    def test_itReportsEachStage(self):
+        profiler = Profiler()
+
+        FullPipeline(FakeExtractor([1]) + Slow(), profiler=profiler).run()
+
+        report = profiler.report()
+        self.assertIn("FakeExtractor", report)
+        self.assertIn("Slow", report)
@@ -1,10 +1,25 @@
 import multiprocessing
+import pickle
 import queue
+import struct
+import time
 import unittest
 from abc import ABC, abstractmethod
+from queue import Full
 from typing import TypeVar, Union
 
-from modupipe.queue import Queue
+from modupipe.base import EndOfStream
+from modupipe.exceptions import QueueClosed
+from modupipe.queue import (
+    GetBatching,
+    PutBatching,
+    PutCoalesce,
+    PutDropNewest,
+    PutDropOldest,
+    PutSampling,
+    Queue,
+)
+from modupipe.serializer import PickleSerializer, StructSerializer
 
 T = TypeVar("T")
 
@@ -13,7 +28,7 @@ class QueueTest(ABC):
     class Base(unittest.TestCase, ABC):
         @abstractmethod
         def givenPythonQueue(
-            self,
+            self, maxsize: int = 0
         ) -> Union["queue.Queue[T]", "multiprocessing.Queue[T]"]:
             pass
 
@@ -65,12 +80,231 @@ class QueueTest(ABC):
             self.assertEqual(queue.get(), item1)
             self.assertEqual(queue.get(), item2)
 
+        def test_whenClosed_itRaisesQueueClosedOnceDrained(self):
+            queue = Queue(self.givenPythonQueue())
+
+            queue.put(3.9)
+            queue.close()
+
+            self.assertEqual(queue.get(timeout=1), 3.9)
+            with self.assertRaises(QueueClosed):
+                queue.get(timeout=1)
+            self.assertTrue(queue.closed)
+
+        def test_givenManyProducers_itIsClosedOnceAllOfThemClosedIt(self):
+            queue = Queue(self.givenPythonQueue(), producers=2)
+
+            queue.close()
+            queue.put(3.9)
+
+            self.assertEqual(queue.get(timeout=1), 3.9)
+            self.assertFalse(queue.closed)
+            queue.close()
+            with self.assertRaises(QueueClosed):
+                queue.get(timeout=1)
+
+        def test_givenManyConsumers_itStopsEachOfThem(self):
+            queue = Queue(self.givenPythonQueue())
+
+            queue.close()
+
+            for _ in range(3):
+                with self.assertRaises(QueueClosed):
+                    queue.get(timeout=1)
+
+        def test_givenFullQueue_whenClosingWithTimeout_itRaisesFull(self):
+            python_queue = self.givenPythonQueue(maxsize=1)
+            queue = Queue(python_queue)
+            queue.put(3.9)
+
+            with self.assertRaises(Full):
+                queue.close(timeout=0.01)
+
+        def test_givenSerializer_itEncodesItemsInTheQueue(self):
+            python_queue = self.givenPythonQueue()
+            queue = Queue(python_queue, serializer=StructSerializer("<id"))
+
+            queue.put((3, 0.5))
+            queue.close()
+
+            encoded = struct.pack("<id", 3, 0.5)
+            self.assertEqual(python_queue.get(timeout=1), encoded)
+            self.assertIsInstance(python_queue.get(timeout=1), EndOfStream)
+
+        def test_givenSerializer_itDecodesItemsAndTimesTheSerializer(self):
+            queue = Queue(self.givenPythonQueue(), serializer=PickleSerializer())
+
+            queue.put({"key": [1, 2]})
+            queue.close()
+
+            self.assertEqual(queue.get(timeout=1), {"key": [1, 2]})
+            with self.assertRaises(QueueClosed):
+                queue.get(timeout=1)
+            self.assertEqual((queue.nb_encoded, queue.nb_decoded), (1, 1))
+            self.assertGreater(queue.encode_time, 0)
+            self.assertGreater(queue.decode_time, 0)
+
 
 class SimpleQueueTest(QueueTest.Base):
-    def givenPythonQueue(self) -> Union["queue.Queue[T]", "multiprocessing.Queue[T]"]:
-        return queue.Queue()
+    def givenPythonQueue(
+        self, maxsize: int = 0
+    ) -> Union["queue.Queue[T]", "multiprocessing.Queue[T]"]:
+        return queue.Queue(maxsize)
 
 
 class MultiprocessingQueueTest(QueueTest.Base):
-    def givenPythonQueue(self) -> Union["queue.Queue[T]", "multiprocessing.Queue[T]"]:
-        return multiprocessing.Queue()
+    def givenPythonQueue(
+        self, maxsize: int = 0
+    ) -> Union["queue.Queue[T]", "multiprocessing.Queue[T]"]:
+        return multiprocessing.Queue(maxsize)
+
+
+class PutDropNewestTest(unittest.TestCase):
+    def test_givenFullQueue_itDropsTheItem(self):
+        queue = Queue(multiprocessing.Queue(1))
+        strategy = PutDropNewest()
+
+        strategy.put(queue, 1)
+        strategy.put(queue, 2)
+
+        self.assertEqual(strategy.dropped, 1)
+        self.assertEqual(queue.get(timeout=1), 1)
+
+
+class PutDropOldestTest(unittest.TestCase):
+    def test_givenFullQueue_itDropsTheOldestItem(self):
+        queue = Queue(multiprocessing.Queue(2))
+        strategy = PutDropOldest()
+
+        for item in [1, 2, 3]:
+            strategy.put(queue, item)
+            time.sleep(0.01)
+
+        self.assertEqual(strategy.dropped, 1)
+        self.assertEqual(queue.get(timeout=1), 2)
+        self.assertEqual(queue.get(timeout=1), 3)
+
+    def test_itNeverDropsEndMarkers(self):
+        queue = Queue(multiprocessing.Queue(2), producers=2)
+        strategy = PutDropOldest()
+        queue.close()
+
+        for item in [1, 2]:
+            strategy.put(queue, item)
+            time.sleep(0.01)
+
+        self.assertEqual(strategy.dropped, 1)
+        self.assertEqual(queue.get(timeout=1), 1)
+        queue.close()
+        with self.assertRaises(QueueClosed):
+            queue.get(timeout=1)
+
+
+class PutSamplingTest(unittest.TestCase):
+    def test_givenBacklogOverThreshold_itKeepsAFractionOfItems(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutSampling(rate=0.5, seed=1)
+
+        for item in range(1000):
+            strategy.put(queue, item)
+
+        self.assertEqual(len(queue) + strategy.dropped, 1000)
+        self.assertAlmostEqual(len(queue) / 1000, 0.5, delta=0.05)
+
+    def test_givenBacklogUnderThreshold_itKeepsAllItems(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutSampling(rate=0, threshold=10)
+
+        for item in range(10):
+            strategy.put(queue, item)
+
+        self.assertEqual(len(queue), 10)
+        self.assertEqual(strategy.dropped, 0)
+
+
+class PutCoalesceTest(unittest.TestCase):
+    def test_givenFullQueue_itReplacesPendingItemsOfSameKey(self):
+        queue = Queue(multiprocessing.Queue(2))
+        strategy = PutCoalesce(key=lambda item: item[0])
+
+        for item in [("a", 1), ("b", 1), ("a", 2), ("a", 3)]:
+            strategy.put(queue, item)
+        self.assertEqual(queue.get(timeout=1), ("a", 1))
+        self.assertEqual(queue.get(timeout=1), ("b", 1))
+        strategy.flush(queue)
+
+        self.assertEqual(strategy.dropped, 1)
+        self.assertEqual(queue.get(timeout=1), ("a", 3))
+
+    def test_givenRoomInQueue_itPutsItemsRightAway(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutCoalesce(key=lambda item: item)
+
+        strategy.put(queue, 1)
+        strategy.put(queue, 1)
+
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(strategy.dropped, 0)
+
+
+class PutBatchingTest(unittest.TestCase):
+    def test_itPutsFramesOfGivenSize(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutBatching(size=2)
+
+        for item in [1, 2, 3]:
+            strategy.put(queue, item)
+
+        self.assertEqual(queue.get(timeout=1), [1, 2])
+        self.assertEqual(len(queue), 0)
+
+    def test_whenFlushing_itPutsPartialFrame(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutBatching(size=2)
+
+        strategy.put(queue, 1)
+        strategy.flush(queue)
+
+        self.assertEqual(queue.get(timeout=1), [1])
+
+    def test_givenMaxLatency_itPutsPartialFrameAfterDelay(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutBatching(size=100, max_latency=0.01)
+
+        strategy.put(queue, 1)
+        time.sleep(0.1)
+
+        self.assertEqual(queue.get(timeout=1), [1])
+
+    def test_givenMaxLatency_itReusesTheSameFlusherForEachFrame(self):
+        queue = Queue(multiprocessing.Queue())
+        strategy = PutBatching(size=100, max_latency=0.01)
+
+        strategy.put(queue, 1)
+        flusher = strategy.flusher
+        self.assertEqual(queue.get(timeout=1), [1])
+        strategy.put(queue, 2)
+
+        self.assertEqual(queue.get(timeout=1), [2])
+        self.assertIs(strategy.flusher, flusher)
+
+    def test_itCanBePickled(self):
+        strategy = PutBatching(size=2, max_latency=0.01)
+
+        unpickled = pickle.loads(pickle.dumps(strategy))
+
+        self.assertEqual(unpickled.size, 2)
+
+
+class GetBatchingTest(unittest.TestCase):
+    def test_itUnpacksFrames(self):
+        queue = Queue(multiprocessing.Queue())
+        put_strategy = PutBatching(size=2)
+        get_strategy = GetBatching(timeout=1)
+
+        for item in [1, 2, 3, 4]:
+            put_strategy.put(queue, item)
+
+        items = [get_strategy.get(queue) for _ in range(4)]
+
+        self.assertEqual(items, [1, 2, 3, 4])
@@ -0,0 +1,158 @@
+import multiprocessing
+import queue
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+from modupipe.extractor import GetFromQueue
+from modupipe.mapper import PutToQueue
+from modupipe.queue import GetBatching, GetBlocking, PutBatching, PutBlocking, Queue
+from modupipe.ring_buffer import SharedMemoryRingBuffer
+from modupipe.serializer import ArraySerializer, StructSerializer
+
+VALUE_1 = b"some value"
+VALUE_2 = b"some other value"
+
+
+def put_records(ring_buffer: SharedMemoryRingBuffer, nb_records: int):
+    for i in range(nb_records):
+        ring_buffer.put((i, i / 2))
+
+
+def put_records_and_close(queue: Queue, nb_records: int):
+    for i in range(nb_records):
+        queue.put((i, i / 2))
+    queue.close()
+
+
+class SharedMemoryRingBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.ring_buffers = []
+
+    def tearDown(self):
+        for ring_buffer in self.ring_buffers:
+            ring_buffer.close()
+            ring_buffer.unlink()
+
+    def test_itGetsItemsInSameOrder(self):
+        ring_buffer = self._givenRingBuffer(slots=4, slot_size=32)
+
+        ring_buffer.put(VALUE_1)
+        ring_buffer.put(VALUE_2)
+
+        self.assertEqual(ring_buffer.get(), VALUE_1)
+        self.assertEqual(ring_buffer.get(), VALUE_2)
+
+    def test_itWrapsAround(self):
+        ring_buffer = self._givenRingBuffer(slots=2, slot_size=32)
+
+        items = []
+        for i in range(5):
+            ring_buffer.put(bytes([i]))
+            items.append(ring_buffer.get())
+
+        self.assertEqual(items, [bytes([i]) for i in range(5)])
+
+    def test_itHasALength(self):
+        ring_buffer = self._givenRingBuffer(slots=4, slot_size=32)
+
+        ring_buffer.put(VALUE_1)
+        ring_buffer.put(VALUE_2)
+        ring_buffer.get()
+
+        self.assertEqual(ring_buffer.qsize(), 1)
+
+    def test_givenFullBuffer_whenPuttingWithoutBlocking_itRaisesFull(self):
+        ring_buffer = self._givenRingBuffer(slots=1, slot_size=32)
+        ring_buffer.put(VALUE_1)
+
+        with self.assertRaises(queue.Full):
+            ring_buffer.put(VALUE_2, block=False)
+
+    def test_givenEmptyBuffer_whenGettingWithTimeout_itRaisesEmpty(self):
+        ring_buffer = self._givenRingBuffer(slots=1, slot_size=32)
+
+        with self.assertRaises(queue.Empty):
+            ring_buffer.get(timeout=0.01)
+
+    def test_givenTooLargeItem_itRaisesValueError(self):
+        ring_buffer = self._givenRingBuffer(slots=1, slot_size=4)
+
+        with self.assertRaises(ValueError):
+            ring_buffer.put(VALUE_1)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_itTransfersArrays(self):
+        array = numpy.arange(6, dtype=numpy.float64).reshape((2, 3))
+        ring_buffer = self._givenRingBuffer(
+            slots=2, slot_size=array.nbytes, serializer=ArraySerializer("f8", (2, 3))
+        )
+
+        ring_buffer.put(array)
+
+        numpy.testing.assert_array_equal(ring_buffer.get(), array)
+
+    def test_itTransfersBetweenProcesses(self):
+        ring_buffer = self._givenRingBuffer(
+            slots=4, slot_size=16, serializer=StructSerializer("<qd")
+        )
+        process = multiprocessing.Process(target=put_records, args=(ring_buffer, 10))
+
+        process.start()
+        records = [ring_buffer.get(timeout=5) for _ in range(10)]
+        process.join()
+
+        self.assertEqual(records, [(i, i / 2) for i in range(10)])
+
+    def test_itPlugsIntoQueueModules(self):
+        ring_buffer = self._givenRingBuffer(slots=4, slot_size=32)
+        queue = Queue(ring_buffer)
+        mapper = PutToQueue(queue, strategy=PutBlocking())
+        extractor = GetFromQueue(queue, strategy=GetBlocking())
+
+        list(mapper.map(iter([VALUE_1, VALUE_2])))
+        items = extractor.extract()
+
+        self.assertEqual(next(items), VALUE_1)
+        self.assertEqual(next(items), VALUE_2)
+
+    def test_givenBatchingStrategy_itTransfersFramesRecordByRecord(self):
+        ring_buffer = self._givenRingBuffer(
+            slots=8, slot_size=64, serializer=StructSerializer("<id")
+        )
+        queue = Queue(ring_buffer)
+        mapper = PutToQueue(queue, strategy=PutBatching(2), close=True)
+        records = [(i, i / 2) for i in range(5)]
+
+        list(mapper.map(iter(records)))
+        items = list(GetFromQueue(queue, strategy=GetBatching(timeout=5)).extract())
+
+        self.assertEqual(items, records)
+
+    def test_givenTooLargeFrame_itRaisesValueError(self):
+        ring_buffer = self._givenRingBuffer(slots=1, slot_size=16)
+
+        with self.assertRaises(ValueError):
+            ring_buffer.put([VALUE_1, VALUE_2])
+
+    def test_whenClosedByProducerProcess_itStopsConsumerAfterLastItem(self):
+        ring_buffer = self._givenRingBuffer(
+            slots=2, slot_size=16, serializer=StructSerializer("<qd")
+        )
+        queue = Queue(ring_buffer)
+        process = multiprocessing.Process(target=put_records_and_close, args=(queue, 5))
+
+        process.start()
+        records = list(GetFromQueue(queue, strategy=GetBlocking(timeout=5)).extract())
+        process.join()
+
+        self.assertEqual(records, [(i, i / 2) for i in range(5)])
+        self.assertTrue(queue.closed)
+
+    def _givenRingBuffer(self, **kwargs) -> SharedMemoryRingBuffer:
+        ring_buffer = SharedMemoryRingBuffer(**kwargs)
+        self.ring_buffers.append(ring_buffer)
+        return ring_buffer
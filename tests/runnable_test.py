@@ -1,12 +1,28 @@
+import multiprocessing
+import queue
+import threading
+import time
 import unittest
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, List
+from unittest.mock import patch
 
 from mockito import mock, verify, when
 
-from modupipe.extractor import Extractor
+from modupipe.extractor import Extractor, GetFromQueue
 from modupipe.loader import Loader
-from modupipe.mapper import PushTo
-from modupipe.runnable import FullPipeline, NamedRunnable, Retry, Runnable, StepPipeline
+from modupipe.mapper import Buffer, PushTo
+from modupipe.queue import GetBatching, GetBlocking, PutBatching, PutDropNewest, Queue
+from modupipe.runnable import (
+    Branch,
+    FanOut,
+    FullPipeline,
+    NamedRunnable,
+    Partitioned,
+    Retry,
+    Runnable,
+    StepPipeline,
+    WorkerPool,
+)
 
 VALUE_1 = 3.546
 VALUE_2 = 234.123
@@ -68,6 +84,15 @@ class StepPipelineTest(unittest.TestCase):
 
         verify(loader).load(VALUE_1)
 
+    def test_givenExhaustedExtractor_itIsFinished(self):
+        pipeline = StepPipeline(FakeExtractor(iter([VALUE_1])))
+
+        pipeline.run()
+        self.assertFalse(pipeline.finished)
+        pipeline.run()
+
+        self.assertTrue(pipeline.finished)
+
     def test_givingFailingExtractor_itRethrowsException(self):
         pipeline = StepPipeline(FailingExtractor())
 
@@ -120,3 +145,418 @@ class NamedRunnableTest(unittest.TestCase):
 
     def _givenRunnable(self):
         return mock(Runnable, strict=False)
+
+
+class FanOutTest(unittest.TestCase):
+    def test_itCreatesOneQueuePerBranch(self):
+        fan_out = FanOut(
+            FakeExtractor(iter([])),
+            [Branch(self._givenLoader()), Branch(self._givenLoader())],
+        )
+
+        self.assertEqual(len(fan_out.queues), 2)
+        self.assertEqual(len(fan_out.consumers), 2)
+
+    def test_whenProducing_itPutsItemsInEachBranchQueue(self):
+        fan_out = FanOut(
+            FakeExtractor(iter([VALUE_1, VALUE_2])),
+            [Branch(self._givenLoader()), Branch(self._givenLoader())],
+        )
+
+        fan_out.producer.run()
+
+        for branch_queue in fan_out.queues:
+            self.assertEqual(branch_queue.get(timeout=1), VALUE_1)
+            self.assertEqual(branch_queue.get(timeout=1), VALUE_2)
+
+    def test_givenDroppingBranch_itDoesNotBlockOtherBranches(self):
+        dropping = PutDropNewest()
+        fan_out = FanOut(
+            FakeExtractor(iter([VALUE_1, VALUE_2])),
+            [
+                Branch(self._givenLoader(), queue_size=1, strategy=dropping),
+                Branch(self._givenLoader()),
+            ],
+        )
+        producer = threading.Thread(target=fan_out.producer.run)
+
+        producer.start()
+        self._waitFor(lambda: dropping.dropped == 1)
+
+        self.assertEqual(fan_out.queues[1].get(timeout=1), VALUE_1)
+        self.assertEqual(fan_out.queues[1].get(timeout=1), VALUE_2)
+        self.assertEqual(self._drain(fan_out.queues[0]), [VALUE_1])
+        producer.join(timeout=5)
+        self.assertFalse(producer.is_alive())
+
+    def test_givenProducerInAnotherProcess_itExposesDropCounts(self):
+        fan_out = FanOut(
+            FakeExtractor(iter([VALUE_1, VALUE_2])),
+            [
+                Branch(self._givenLoader(), queue_size=1, strategy=PutDropNewest()),
+                Branch(self._givenLoader()),
+            ],
+        )
+        producer = multiprocessing.Process(target=fan_out.producer.run)
+
+        producer.start()
+        self._waitFor(lambda: fan_out.drop_counts()[0] == 1)
+        self._drain(fan_out.queues[0])
+        producer.join(timeout=5)
+
+        self.assertEqual(fan_out.drop_counts(), [1, 0])
+
+    def test_givenBatchingBranch_itsLoaderGetsItems(self):
+        loader = Collect()
+        branch = Branch(loader, strategy=PutBatching(2), get_strategy=GetBatching())
+        fan_out = FanOut(FakeExtractor(iter([VALUE_1, VALUE_2, VALUE_1])), [branch])
+
+        fan_out.producer.run()
+        fan_out.consumers[0].run()
+
+        self.assertEqual(loader.items, [VALUE_1, VALUE_2, VALUE_1])
+
+    def test_givenFiniteExtractor_whenRunning_itReturnsOnceBranchesAreDrained(self):
+        fan_out = FanOut(
+            FakeExtractor(iter([VALUE_1, VALUE_2])),
+            [Branch(self._givenLoader(), queue_size=1), Branch(self._givenLoader())],
+        )
+        thread = threading.Thread(target=fan_out.run)
+
+        thread.start()
+        thread.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+
+    def _drain(self, branch_queue: Queue[float]) -> List[float]:
+        return list(GetFromQueue(branch_queue, GetBlocking(timeout=5)).extract())
+
+    def _waitFor(self, condition: Callable[[], bool]) -> None:
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def _givenLoader(self):
+        return mock(Loader, strict=False)
+
+
+class PartitionedTest(unittest.TestCase):
+    def test_itCreatesOneQueueAndConsumerPerLoader(self):
+        partitioned = Partitioned(
+            FakeExtractor(iter([])), round, [self._givenLoader() for _ in range(3)]
+        )
+
+        self.assertEqual(len(partitioned.queues), 3)
+        self.assertEqual(len(partitioned.consumers), 3)
+
+    def test_whenProducing_itPutsItemsInTheQueueOfTheirKeyAndClosesThem(self):
+        items = [VALUE_1, VALUE_2, VALUE_1 + 1, VALUE_2 + 1]
+        partitioned = Partitioned(
+            FakeExtractor(iter(items)), round, [self._givenLoader() for _ in range(2)]
+        )
+
+        partitioned.producer.run()
+
+        partitions = partitioned.router.partitions
+        for index, partition in enumerate(partitioned.queues):
+            expected = [
+                item for item in items if partitions.partition_for(item) == index
+            ]
+            received = GetFromQueue(partition, GetBlocking(timeout=5)).extract()
+            self.assertEqual(list(received), expected)
+
+    def test_givenBatchingStrategies_loadersGetItems(self):
+        loaders = [Collect() for _ in range(2)]
+        partitioned = Partitioned(
+            FakeExtractor(iter(range(10))),
+            lambda item: item % 3,
+            loaders,
+            strategy=lambda: PutBatching(3),
+            get_strategy=GetBatching,
+        )
+
+        partitioned.producer.run()
+        for consumer in partitioned.consumers:
+            consumer.run()
+
+        items = sorted(item for loader in loaders for item in loader.items)
+        self.assertEqual(items, list(range(10)))
+
+    def test_givenFiniteExtractor_whenRunning_itReturnsOnceConsumersAreDone(self):
+        partitioned = Partitioned(
+            FakeExtractor(iter([VALUE_1, VALUE_2])),
+            round,
+            [self._givenLoader() for _ in range(2)],
+            queue_size=1,
+        )
+        thread = threading.Thread(target=partitioned.run)
+
+        thread.start()
+        thread.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+
+    def _givenLoader(self):
+        return mock(Loader, strict=False)
+
+
+class Idle(Runnable):
+    def run(self):
+        time.sleep(0.01)
+
+
+class Failing(Runnable):
+    def run(self):
+        raise ValueError()
+
+
+class Collect(Loader[Any, Any]):
+    def __init__(self) -> None:
+        self.items: List[Any] = []
+
+    def load(self, item: Any) -> Any:
+        self.items.append(item)
+        return item
+
+
+class WorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pools: List[WorkerPool] = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            for _, stop, _ in pool.workers:
+                stop.set()
+
+    def test_givenBacklog_itAddsOneWorkerPerScaling(self):
+        pool = self._givenPoolWithBacklog(250, max_workers=4)
+
+        nb_workers = []
+        for _ in range(4):
+            pool.scale()
+            nb_workers.append(pool.nb_workers)
+
+        self.assertEqual(nb_workers, [1, 2, 3, 3])
+
+    def test_itDoesNotExceedMaxWorkers(self):
+        pool = self._givenPoolWithBacklog(1000, max_workers=2)
+
+        for _ in range(4):
+            pool.scale()
+
+        self.assertEqual(pool.nb_workers, 2)
+
+    def test_givenDrainedBacklog_itRetiresWorkers(self):
+        pool = self._givenPoolWithBacklog(250, max_workers=4)
+        for _ in range(3):
+            pool.scale()
+
+        while len(pool.queue):
+            pool.queue.get()
+        pool.scale()
+
+        self.assertEqual(pool.nb_workers, 2)
+
+    def test_givenSlowWorkers_itAddsWorkersToDrainTheBacklog(self):
+        pool = self._givenPoolWithBacklog(250, max_workers=4, backlog_per_worker=1000)
+        pool.scale()
+
+        time.sleep(0.1)
+        pool.scale()
+
+        self.assertGreater(pool.throughput, 0)
+        self.assertEqual(pool.nb_workers, 2)
+
+    def test_whenRunning_workersConsumeTheQueue(self):
+        items_queue = Queue[int](queue.Queue())
+        for i in range(50):
+            items_queue.put(i)
+        loader = Collect()
+        pool = WorkerPool(
+            lambda: StepPipeline(
+                GetFromQueue(items_queue, GetBlocking()) + PushTo(loader)
+            ),
+            items_queue,
+            min_workers=2,
+            max_workers=4,
+            backlog_per_worker=10,
+            interval=0.01,
+            shutdown_timeout=0.1,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        deadline = time.monotonic() + 5
+        while len(loader.items) < 50 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool.stop()
+        thread.join()
+
+        self.assertEqual(sorted(loader.items), list(range(50)))
+        self.assertEqual(pool.nb_workers, 0)
+
+    def test_givenIdlePeriod_workersConsumeItemsPutAfterwards(self):
+        items_queue = Queue[int](queue.Queue())
+        loader = Collect()
+        pool = WorkerPool(
+            lambda: StepPipeline(
+                GetFromQueue(items_queue, GetBlocking()) + PushTo(loader)
+            ),
+            items_queue,
+            interval=0.01,
+            shutdown_timeout=0.1,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        time.sleep(0.3)
+        for i in range(20):
+            items_queue.put(i)
+        deadline = time.monotonic() + 5
+        while len(loader.items) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool.stop()
+        thread.join()
+
+        self.assertEqual(sorted(loader.items), list(range(20)))
+
+    def test_givenClosedQueue_itReturnsOnceWorkersHaveDrainedIt(self):
+        items_queue = Queue[int](queue.Queue())
+        for i in range(20):
+            items_queue.put(i)
+        items_queue.close()
+        loader = Collect()
+        pool = WorkerPool(
+            lambda: StepPipeline(
+                GetFromQueue(items_queue, GetBlocking()) + PushTo(loader)
+            ),
+            items_queue,
+            min_workers=2,
+            interval=0.01,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(sorted(loader.items), list(range(20)))
+
+    def test_givenFullPipelineFactory_itReturnsOnceTheQueueIsClosed(self):
+        items_queue = Queue[int](queue.Queue())
+        for i in range(20):
+            items_queue.put(i)
+        items_queue.close()
+        loader = Collect()
+        pool = WorkerPool(
+            lambda: FullPipeline(
+                GetFromQueue(items_queue, GetBlocking()) + PushTo(loader)
+            ),
+            items_queue,
+            min_workers=2,
+            interval=0.01,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(sorted(loader.items), list(range(20)))
+        self.assertEqual(items_queue.ended_producers.value, 2)
+
+    def test_itCountsTheItemsProcessedByPipelines(self):
+        items_queue = Queue[int](queue.Queue())
+        for i in range(20):
+            items_queue.put(i)
+        items_queue.close()
+        pool = WorkerPool(
+            lambda: FullPipeline(GetFromQueue(items_queue, GetBlocking())),
+            items_queue,
+            interval=0.01,
+        )
+        pool.run()
+
+        self.assertEqual(pool.processed, 20)
+
+    def test_givenIdlePeriod_itKeepsTheItemsBufferedByWorkers(self):
+        items_queue = Queue[int](queue.Queue())
+        loader = Collect()
+        pool = WorkerPool(
+            lambda: StepPipeline(
+                GetFromQueue(items_queue, GetBlocking()) + Buffer(10) + PushTo(loader)
+            ),
+            items_queue,
+            interval=0.01,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        for i in range(15):
+            items_queue.put(i)
+        time.sleep(0.2)
+        for i in range(15, 20):
+            items_queue.put(i)
+        items_queue.close()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(
+            [item for batch in loader.items for item in batch], list(range(20))
+        )
+
+    def test_givenFailingWorker_itReplacesItUpToMinWorkers(self):
+        items_queue = Queue[int](queue.Queue())
+        nb_built = []
+
+        def factory() -> Runnable:
+            nb_built.append(1)
+            if len(nb_built) == 1:
+                return Failing()
+            return Idle()
+
+        pool = WorkerPool(factory, items_queue, min_workers=1, max_workers=1)
+        self.pools.append(pool)
+        with patch.object(threading, "excepthook"):
+            pool._add_worker()
+            pool.workers[0][0].join(timeout=5)
+
+        pool.scale()
+
+        self.assertEqual(len(nb_built), 2)
+        self.assertEqual(pool.nb_workers, 1)
+        self.assertTrue(pool.workers[0][0].is_alive())
+
+    def test_givenWorkerBlockedWithoutTimeout_itStopsAfterShutdownTimeout(self):
+        items_queue = Queue[int](queue.Queue())
+        pool = WorkerPool(
+            lambda: StepPipeline(GetFromQueue(items_queue, GetBlocking())),
+            items_queue,
+            interval=0.01,
+            shutdown_timeout=0.1,
+        )
+        thread = threading.Thread(target=pool.run)
+
+        thread.start()
+        time.sleep(0.05)
+        pool.stop()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+
+    def _givenPoolWithBacklog(
+        self, backlog: int, max_workers: int, backlog_per_worker: int = 100
+    ) -> WorkerPool:
+        items_queue = Queue[int](queue.Queue())
+        for i in range(backlog):
+            items_queue.put(i)
+
+        pool = WorkerPool(
+            Idle,
+            items_queue,
+            min_workers=1,
+            max_workers=max_workers,
+            backlog_per_worker=backlog_per_worker,
+        )
+        self.pools.append(pool)
+        return pool
@@ -0,0 +1,81 @@
+import pickle
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+from modupipe.serializer import (
+    ArraySerializer,
+    BytesSerializer,
+    PickleSerializer,
+    StructSerializer,
+)
+
+
+class BytesSerializerTest(unittest.TestCase):
+    def test_itRoundTripsBytes(self):
+        serializer = BytesSerializer()
+
+        data = serializer.dumps(b"value")
+
+        self.assertEqual(serializer.loads(memoryview(data)), b"value")
+
+
+class StructSerializerTest(unittest.TestCase):
+    def test_itRoundTripsRecords(self):
+        serializer = StructSerializer("<if")
+        record = (3, 0.5)
+
+        data = serializer.dumps(record)
+
+        self.assertEqual(len(data), 8)
+        self.assertEqual(serializer.loads(data), record)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ArraySerializerTest(unittest.TestCase):
+    def test_itRoundTripsArrays(self):
+        serializer = ArraySerializer("i4", shape=(2, 2))
+        array = numpy.array([[1, 2], [3, 4]], dtype="i4")
+
+        data = serializer.dumps(array)
+
+        numpy.testing.assert_array_equal(serializer.loads(data), array)
+
+    def test_itDoesNotReferenceTheGivenData(self):
+        serializer = ArraySerializer("i4")
+        data = bytearray(serializer.dumps(numpy.array([1, 2], dtype="i4")))
+
+        array = serializer.loads(data)
+        data[:] = bytes(len(data))
+
+        self.assertEqual(list(array), [1, 2])
+
+
+class PickleSerializerTest(unittest.TestCase):
+    def test_itRoundTripsObjects(self):
+        serializer = PickleSerializer()
+        item = {"id": 3, "payload": bytearray(b"data"), "tags": ("a", "b")}
+
+        data = serializer.dumps(item)
+
+        self.assertEqual(serializer.loads(memoryview(data)), item)
+
+    def test_givenOlderProtocol_itRoundTripsObjects(self):
+        serializer = PickleSerializer(protocol=4)
+
+        self.assertEqual(serializer.loads(serializer.dumps([1, "a"])), [1, "a"])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_itLoadsArraysAsViewsOnTheMessage(self):
+        serializer = PickleSerializer()
+        array = numpy.arange(100_000, dtype="f8")
+
+        data = serializer.dumps({"array": array})
+        loaded = serializer.loads(data)["array"]
+
+        numpy.testing.assert_array_equal(loaded, array)
+        self.assertFalse(loaded.flags.writeable)
+        self.assertLess(len(data), len(pickle.dumps(array, protocol=4)) + 100)
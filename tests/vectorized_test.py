@@ -0,0 +1,77 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+from modupipe.mapper import Buffer
+from modupipe.vectorized import FilterArray, RandomBatch, ToArray, Unbatch, Vectorize
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class RandomBatchTest(unittest.TestCase):
+    def test_itYieldsArraysOfGivenSize(self):
+        extractor = RandomBatch(size=100)
+
+        batch = next(extractor.extract())
+
+        self.assertEqual(batch.shape, (100,))
+        self.assertTrue(((batch >= 0) & (batch < 1)).all())
+
+    def test_givenSeed_itIsReproducible(self):
+        batch1 = next(RandomBatch(size=10, seed=42).extract())
+        batch2 = next(RandomBatch(size=10, seed=42).extract())
+
+        numpy.testing.assert_array_equal(batch1, batch2)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ToArrayTest(unittest.TestCase):
+    def test_itConvertsBufferOutputToArrays(self):
+        mapper = Buffer(size=2) + ToArray(dtype="f8")
+
+        arrays = list(mapper.map(iter([1, 2, 3, 4])))
+
+        self.assertEqual(len(arrays), 2)
+        self.assertEqual(arrays[0].dtype, numpy.float64)
+        numpy.testing.assert_array_equal(arrays[1], [3.0, 4.0])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class VectorizeTest(unittest.TestCase):
+    def test_itAppliesFunctionToWholeArrays(self):
+        mapper = Vectorize(numpy.sqrt)
+
+        arrays = list(mapper.map(iter([numpy.array([4.0, 9.0])])))
+
+        numpy.testing.assert_array_equal(arrays[0], [2.0, 3.0])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class FilterArrayTest(unittest.TestCase):
+    def test_itKeepsMatchingElements(self):
+        mapper = FilterArray(lambda array: array > 1)
+
+        arrays = list(mapper.map(iter([numpy.array([1, 2, 3]), numpy.array([0])])))
+
+        self.assertEqual(len(arrays), 1)
+        numpy.testing.assert_array_equal(arrays[0], [2, 3])
+
+
+class UnbatchTest(unittest.TestCase):
+    def test_itUnbatchesLists(self):
+        mapper = Unbatch()
+
+        items = list(mapper.map(iter([[1, 2], [3]])))
+
+        self.assertEqual(items, [1, 2, 3])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_itUnbatchesArraysToPythonScalars(self):
+        extractor = RandomBatch(size=3) + Unbatch()
+
+        items = extractor.extract()
+        first_items = [next(items) for _ in range(3)]
+
+        self.assertTrue(all(isinstance(item, float) for item in first_items))
@@ -0,0 +1,121 @@
+import unittest
+from typing import Dict, List, Tuple
+
+from modupipe.window import (
+    Aggregates,
+    Count,
+    Max,
+    Mean,
+    Min,
+    SlidingTimeWindow,
+    SlidingWindow,
+    Sum,
+    TumblingTimeWindow,
+    TumblingWindow,
+)
+
+VALUES = [4, 1, 3, 3, 7, 2, 5]
+
+
+class AggregateTest(unittest.TestCase):
+    def test_itComputesRunningAggregates(self):
+        aggregates = Aggregates(
+            {"count": Count(), "sum": Sum(), "mean": Mean(), "min": Min(), "max": Max()}
+        )
+
+        for value in [4, 1, 3]:
+            aggregates.add(value)
+        aggregates.remove(4)
+
+        expected = {"count": 2, "sum": 4, "mean": 2.0, "min": 1, "max": 3}
+        self.assertEqual(aggregates.result(), expected)
+
+    def test_itKeepsEqualValuesInMonotonicAggregates(self):
+        maximum = Max()
+
+        for value in [3, 3, 1]:
+            maximum.add(value)
+        maximum.remove(3)
+
+        self.assertEqual(maximum.result(), 3)
+
+    def test_itReturnsNoneWhenEmpty(self):
+        self.assertIsNone(Mean().result())
+        self.assertIsNone(Min().result())
+        self.assertIsNone(Max().result())
+
+
+class TumblingWindowTest(unittest.TestCase):
+    def test_itAggregatesEachWindowIncludingTheRemainder(self):
+        mapper = TumblingWindow(3, Sum())
+
+        result = list(mapper.map(iter(VALUES)))
+
+        self.assertEqual(result, [8, 12, 5])
+
+    def test_itAggregatesAFieldOfTheItems(self):
+        mapper = TumblingWindow(2, Max(), value=lambda item: item["value"])
+
+        result = list(mapper.map(iter([{"value": v} for v in VALUES])))
+
+        self.assertEqual(result, [4, 3, 7, 5])
+
+
+class SlidingWindowTest(unittest.TestCase):
+    def test_itAggregatesEachFullWindow(self):
+        mapper = SlidingWindow(3, Max())
+
+        result = list(mapper.map(iter(VALUES)))
+
+        self.assertEqual(result, self._reference(max, 3, 1))
+
+    def test_itEmitsEveryStepItems(self):
+        mapper = SlidingWindow(3, Min(), step=2)
+
+        result = list(mapper.map(iter(VALUES)))
+
+        self.assertEqual(result, self._reference(min, 3, 2))
+
+    def test_itComputesTheMeanIncrementally(self):
+        mapper = SlidingWindow(2, Mean())
+
+        result = list(mapper.map(iter(VALUES)))
+
+        self.assertEqual(result, [2.5, 2.0, 3.0, 5.0, 4.5, 3.5])
+
+    def _reference(self, function, size: int, step: int) -> List[int]:
+        windows = [VALUES[i:][:size] for i in range(len(VALUES) - size + 1)]
+        return [function(window) for window in windows[::step]]
+
+
+class TumblingTimeWindowTest(unittest.TestCase):
+    def test_itAggregatesItemsOfTheSameTimeWindow(self):
+        mapper = TumblingTimeWindow(
+            10.0, Count(), timestamp=lambda item: item[0], value=lambda item: item[1]
+        )
+        items: List[Tuple[float, int]] = [(1.0, 1), (9.0, 2), (12.0, 3), (35.0, 4)]
+
+        result = list(mapper.map(iter(items)))
+
+        self.assertEqual(result, [(0.0, 2), (10.0, 1), (30.0, 1)])
+
+
+class SlidingTimeWindowTest(unittest.TestCase):
+    def test_itAggregatesItemsOfTheLastDuration(self):
+        mapper = SlidingTimeWindow(
+            10.0,
+            Aggregates({"sum": Sum(), "max": Max()}),
+            timestamp=lambda item: item[0],
+            value=lambda item: item[1],
+        )
+        items: List[Tuple[float, int]] = [(1.0, 5), (9.0, 2), (12.0, 3), (25.0, 4)]
+
+        result = list(mapper.map(iter(items)))
+
+        expected: List[Tuple[float, Dict[str, int]]] = [
+            (1.0, {"sum": 5, "max": 5}),
+            (9.0, {"sum": 7, "max": 5}),
+            (12.0, {"sum": 5, "max": 3}),
+            (25.0, {"sum": 4, "max": 4}),
+        ]
+        self.assertEqual(result, expected)